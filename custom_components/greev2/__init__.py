@@ -5,14 +5,18 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-# Import const is needed if used, but not for stubs
-# from . import const
+from .const import DOMAIN
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 # List of platforms to support. There should be a matching
 # platform.async_setup_entry function for each platform.
-PLATFORMS = ["climate"]
+# The climate entity owns the device state; companion platforms read it, so
+# climate is always set up first.
+CLIMATE_PLATFORM = "climate"
+COMPANION_PLATFORMS = ["switch", "sensor", "select"]
+PLATFORMS = [CLIMATE_PLATFORM, *COMPANION_PLATFORMS]
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -20,6 +24,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     # This component does not support configuration via configuration.yaml
     # Setup happens via config flow instead.
     _LOGGER.debug("Async_setup called, returning True as setup is via config entry.")
+    async_setup_services(hass)
     return True
 
 
@@ -30,8 +35,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # hass.data.setdefault(const.DOMAIN, {})[entry.entry_id] = entry.data
 
     # Forward the setup to the climate platform.
-    # The climate platform will then call async_setup_entry within its code.
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # The climate platform will then call async_setup_entry within its code
+    # and register its entity in hass.data for the companion platforms.
+    await hass.config_entries.async_forward_entry_setups(entry, [CLIMATE_PLATFORM])
+    await hass.config_entries.async_forward_entry_setups(entry, COMPANION_PLATFORMS)
 
     # Add update listener for options flow
     entry.add_update_listener(async_update_options)
@@ -46,18 +53,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward the unload to the climate platform.
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Clean up hass.data if used
-    # if unload_ok:
-    #     hass.data[const.DOMAIN].pop(entry.entry_id)
-    #     if not hass.data[const.DOMAIN]:
-    #         hass.data.pop(const.DOMAIN)
+    # Drop the device registered by the climate platform
+    if unload_ok:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if not hass.data.get(DOMAIN):
+            hass.data.pop(DOMAIN, None)
 
     _LOGGER.debug("Finished unloading Gree Climate V2 entry: %s", entry.entry_id)
     return unload_ok
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
+    """Handle options update.
+
+    Data-only updates (the device key persisted after a bind) need no
+    reload; only a change of options does.
+    """
+    device = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if device is not None and device.entry_options == entry.options:
+        _LOGGER.debug("Options unchanged for %s, not reloading", entry.entry_id)
+        return
     _LOGGER.debug("Handling options update for %s", entry.entry_id)
     # Reload the entry to apply changes.
     await hass.config_entries.async_reload(entry.entry_id)
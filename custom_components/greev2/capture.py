@@ -0,0 +1,155 @@
+"""Packet capture and deterministic replay for the Gree UDP protocol.
+
+A capture is a sequence of exchanges, one per datagram received: the
+encrypted request that was waiting, the encrypted datagram that arrived (or
+none for a timeout) and the time waited for it. Stale, reordered and
+duplicate datagrams are recorded like the reply that resolved the request.
+`PacketRecorder` collects them from a live `GreeDeviceApi`; `ReplayTransport`
+feeds them back through the same decode path without any network, so
+captures from real units can serve as tests and benchmarks.
+
+File layout (little endian): the `CAPTURE_MAGIC` header, then per exchange
+a `<dII` record (rtt seconds, request length, reply length) followed by
+the request and reply bytes. A timed-out exchange has rtt -1 and no reply.
+"""
+
+import asyncio
+import logging
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"GRCAP\x01"
+_RECORD = struct.Struct("<dII")
+_TIMEOUT_RTT = -1.0
+
+
+@dataclass(frozen=True, slots=True)
+class CapturedExchange:
+    """One datagram received while a request waited, or its timeout."""
+
+    request: bytes
+    reply: Optional[bytes]  # None if the device never answered
+    rtt: float  # Seconds waited for the reply; ignored when reply is None
+
+
+class PacketRecorder:
+    """Collects the exchanges of a `GreeDeviceApi` in memory.
+
+    Recording only appends to a list; writing the file is left to `save`,
+    which callers run outside the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty capture."""
+        self.exchanges: List[CapturedExchange] = []
+
+    def record(self, request: bytes, reply: Optional[bytes], rtt: float) -> None:
+        """Record one received datagram (None for a timeout)."""
+        self.exchanges.append(CapturedExchange(request, reply, rtt))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the capture file (blocking I/O)."""
+        write_capture(path, self.exchanges)
+
+
+def write_capture(
+    path: Union[str, Path], exchanges: Iterable[CapturedExchange]
+) -> None:
+    """Write exchanges to a capture file."""
+    with open(path, "wb") as capture_file:
+        capture_file.write(CAPTURE_MAGIC)
+        for exchange in exchanges:
+            reply = exchange.reply if exchange.reply is not None else b""
+            rtt = exchange.rtt if exchange.reply is not None else _TIMEOUT_RTT
+            capture_file.write(_RECORD.pack(rtt, len(exchange.request), len(reply)))
+            capture_file.write(exchange.request)
+            capture_file.write(reply)
+
+
+def read_capture(path: Union[str, Path]) -> List[CapturedExchange]:
+    """Read a capture file. Raises ValueError if it is not one."""
+    with open(path, "rb") as capture_file:
+        data = capture_file.read()
+    if not data.startswith(CAPTURE_MAGIC):
+        raise ValueError(f"{path} is not a Gree capture file")
+    exchanges: List[CapturedExchange] = []
+    offset = len(CAPTURE_MAGIC)
+    while offset < len(data):
+        if len(data) - offset < _RECORD.size:
+            raise ValueError(f"{path} is truncated")
+        rtt, request_len, reply_len = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        request = data[offset : offset + request_len]
+        offset += request_len
+        reply = data[offset : offset + reply_len]
+        offset += reply_len
+        if len(reply) != reply_len:
+            raise ValueError(f"{path} is truncated")
+        timed_out = rtt == _TIMEOUT_RTT
+        exchanges.append(
+            CapturedExchange(request, None if timed_out else reply, max(rtt, 0.0))
+        )
+    return exchanges
+
+
+class ReplayTransport:
+    """Plays captured replies back to a `GreeDeviceApi`.
+
+    The transport behaves like one long-lived socket: every receive consumes
+    the next captured reply, whatever was sent, so reordered, late or
+    duplicated replies in the capture reach the API's correlation layer
+    exactly as they did on the wire. With `realtime` the recorded round-trip
+    times are slept (scaled by `time_scale`), and replies slower than the
+    API timeout time out as they would live.
+    """
+
+    def __init__(
+        self,
+        exchanges: Iterable[CapturedExchange],
+        realtime: bool = False,
+        time_scale: float = 1.0,
+    ) -> None:
+        """Initialize the transport with the exchanges to replay."""
+        self._exchanges = list(exchanges)
+        self._position = 0
+        self._realtime = realtime
+        self._time_scale = time_scale
+        self.requests: List[bytes] = []  # Datagrams the API sent during replay
+
+    @property
+    def remaining(self) -> int:
+        """Return how many captured exchanges are left."""
+        return len(self._exchanges) - self._position
+
+    def send(self, request: bytes) -> None:
+        """Record a datagram sent by the API."""
+        self.requests.append(bytes(request))
+
+    async def receive(self, buffer: bytearray, timeout: float) -> int:
+        """Copy the next captured reply into `buffer` and return its length.
+
+        Raises asyncio.TimeoutError for a captured timeout, a reply slower
+        than `timeout` in realtime mode, or when the capture is exhausted.
+        """
+        if not self._realtime:
+            # Yield like a socket would, so concurrent requests interleave
+            await asyncio.sleep(0)
+        if self._position >= len(self._exchanges):
+            _LOGGER.debug("Replay capture exhausted")
+            raise asyncio.TimeoutError
+        captured = self._exchanges[self._position]
+        self._position += 1
+        reply = captured.reply
+        if self._realtime:
+            if reply is None or captured.rtt > timeout:
+                await asyncio.sleep(timeout * self._time_scale)
+                raise asyncio.TimeoutError
+            await asyncio.sleep(captured.rtt * self._time_scale)
+        elif reply is None:
+            raise asyncio.TimeoutError
+        buffer[: len(reply)] = reply
+        return len(reply)
@@ -1,11 +1,14 @@
 # pylint: disable=protected-access
 """Home Assistant platform for Gree Climate V2 devices."""
 
+import asyncio
 import logging
 import socket  # Keep socket
+import time
+from datetime import datetime
 
 # Need Optional for type hints
-from typing import Any, Dict, List, Optional # Removed Union
+from typing import Any, Callable, Dict, List, Optional # Removed Union
 
 # Third-party imports
 # import voluptuous as vol # Unused
@@ -34,11 +37,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    async_call_later,
     async_track_state_change_event,  # Keep for potential future use in options flow
+    async_track_time_interval,
 )
 
 # from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType # Unused
@@ -50,13 +55,41 @@ from homeassistant.helpers.device_registry import format_mac, DeviceInfo
 
 # Local imports
 from .device_api import GreeDeviceApi
-from .climate_helpers import GreeClimateState, detect_features
+from .climate_helpers import (
+    GreeClimateState,
+    SensorAggregate,
+    TemperatureFilter,
+    column_mask,
+    detect_features,
+    temp_sensor_ids,
+)
+from .metrics import PHASE_APPLY, TransportMetrics
+from .schema import (
+    DEFAULT_FETCH_COLUMNS,
+    FEATURE_ANTI_DIRECT_BLOW,
+    FEATURE_LIGHT_SENSOR,
+    FEATURE_TEMP_SENSOR,
+    FAN_MODE_ENCODE,
+    HVAC_MODE_ENCODE,
+    INITIAL_OPTIONS,
+    PRESET_MODE_ENCODE,
+    SWING_MODE_ENCODE,
+    encode_command,
+)
+from .telemetry import DeviceTelemetry
 
 # Import constants needed for defaults and config keys
 # from . import const # Unused
 from .const import (
+    CONF_ENCRYPTION_KEY,
     CONF_ENCRYPTION_VERSION,
+    CONF_PIPELINED_POLLING,
     CONF_TEMP_SENSOR,  # Added
+    CONF_TEMP_SENSOR_AGGREGATE,
+    CONF_TEMP_SENSOR_DEADBAND,
+    CONF_TEMP_SENSOR_MAX_AGE,
+    CONF_TEMP_SENSOR_MIN_INTERVAL,
+    CONF_TEMP_SENSOR_SMOOTHING,
     DEFAULT_NAME,
     DEFAULT_PORT,
     DEFAULT_TIMEOUT,
@@ -69,9 +102,17 @@ from .const import (
     DEFAULT_HORIZONTAL_SWING,  # Corrected import
     DEFAULT_DISABLE_AVAILABILITY_CHECK,  # Corrected import
     DEFAULT_MAX_ONLINE_ATTEMPTS,  # Corrected import
+    DEFAULT_PIPELINED_POLLING,
+    DEFAULT_TEMP_SENSOR_AGGREGATE,
+    DEFAULT_TEMP_SENSOR_DEADBAND,
+    DEFAULT_TEMP_SENSOR_MAX_AGE,
+    DEFAULT_TEMP_SENSOR_MIN_INTERVAL,
+    DEFAULT_TEMP_SENSOR_SMOOTHING,
     MIN_TEMP,
     MAX_TEMP,
+    PIPELINE_COLUMNS_PER_PACKET,
     SUPPORT_FLAGS,
+    SCAN_INTERVAL,
     # TEMP_OFFSET, # Removed
     DOMAIN,  # Import DOMAIN for device info
 )
@@ -85,6 +126,9 @@ CipherType = Any
 _LOGGER = logging.getLogger(__name__)
 
 
+# Columns backing the climate entity's own state attributes
+CLIMATE_COLUMNS = ("Pow", "Mod", "SetTem", "WdSpd", "SwUpDn", "Quiet", "Tur", "StHt")
+
 # PLATFORM_SCHEMA is removed as configuration is via Config Flow
 
 
@@ -102,6 +146,8 @@ async def async_setup_entry(
     # Instantiate the GreeClimate entity using the config entry
     # Pass hass and the entry itself to the constructor
     device = GreeClimate(hass, entry)
+    # Companion platforms (switch/sensor/select) read this device's state
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = device
 
     # Add the entity to Home Assistant
     async_add_entities([device])
@@ -114,7 +160,7 @@ class GreeClimate(ClimateEntity):
     # Declare types for instance variables
     _attr_name: str
     _attr_unique_id: str
-    _attr_should_poll: bool = True  # Default should_poll
+    _attr_should_poll: bool = False  # Polled by our own timer, see _async_poll
     _attr_temperature_unit: str = UnitOfTemperature.CELSIUS  # Use HA Constant
     _attr_hvac_modes: List[HVACMode]
     _attr_fan_modes: List[str]
@@ -135,8 +181,9 @@ class GreeClimate(ClimateEntity):
     _online_attempts: int = 0
     _max_online_attempts: int
     _disable_available_check: bool
-    _temp_sensor_entity_id: Optional[str]  # Added back
+    _temp_sensor_entity_ids: List[str]  # External room temperature sensors
     _horizontal_swing: bool
+    _pipelined_polling: bool  # Poll column groups as parallel packets
     _first_time_run: bool = True
     encryption_version: int
     _encryption_key: Optional[bytes] = None
@@ -147,14 +194,26 @@ class GreeClimate(ClimateEntity):
 
     # State managed by GreeClimateState helper
     _state: GreeClimateState
+    _visible_mask: int  # State columns that feed HA attributes of this entity
 
     # Feature flags (determined during runtime)
     _has_temp_sensor: Optional[bool] = None
     _has_anti_direct_blow: Optional[bool] = None
     _has_light_sensor: Optional[bool] = None
 
+    # Companion entities notified with the changed-column mask after each sync
+    _listeners: List[Callable[[int], None]]
+    _notified_available: Optional[bool] = None
+    # Commands queued by companion entities, flushed as one packet
+    _pending_command: Dict[str, Any]
+    _command_flush: Optional["asyncio.Future[None]"] = None
+    # Held while an update runs; a poll tick that finds it held is skipped
+    _update_lock: asyncio.Lock
+
     # Current temperature (handled separately due to external sensor)
     _current_temperature: Optional[float] = None
+    # Publishes a held-back external sensor reading
+    _temp_flush_unsub: Optional[CALLBACK_TYPE] = None
 
     # Deprecated/Unused?
     _enable_light_sensor: bool = False
@@ -173,6 +232,8 @@ class GreeClimate(ClimateEntity):
 
         # --- Extract data from ConfigEntry ---
         options = entry.options  # Get options dictionary
+        # Options this entity was built with; only a change of these reloads
+        self.entry_options: Dict[str, Any] = dict(options)
         data = entry.data  # Get original data dictionary
 
         # Prioritize options, then data, then default for name
@@ -181,9 +242,53 @@ class GreeClimate(ClimateEntity):
         self._ip_addr = options.get(CONF_HOST, data[CONF_HOST])
         # Prioritize options, then data for area_id
         area_id = options.get("area_id", data.get("area_id"))
-        # Prioritize options, then data for temp sensor
-        self._temp_sensor_entity_id = options.get(
-            CONF_TEMP_SENSOR, data.get(CONF_TEMP_SENSOR)
+        # Prioritize options, then data for temp sensors (one id or a list)
+        self._temp_sensor_entity_ids = temp_sensor_ids(
+            options.get(CONF_TEMP_SENSOR, data.get(CONF_TEMP_SENSOR))
+        )
+        # Latest reading of each temp sensor, combined into one room value
+        self._temp_aggregate = SensorAggregate(
+            options.get(
+                CONF_TEMP_SENSOR_AGGREGATE,
+                data.get(CONF_TEMP_SENSOR_AGGREGATE, DEFAULT_TEMP_SENSOR_AGGREGATE),
+            ),
+            float(
+                options.get(
+                    CONF_TEMP_SENSOR_MAX_AGE,
+                    data.get(CONF_TEMP_SENSOR_MAX_AGE, DEFAULT_TEMP_SENSOR_MAX_AGE),
+                )
+            ),
+        )
+
+        # External sensor readings pass this filter before reaching HA state
+        self._temp_filter = TemperatureFilter(
+            float(
+                options.get(
+                    CONF_TEMP_SENSOR_DEADBAND,
+                    data.get(CONF_TEMP_SENSOR_DEADBAND, DEFAULT_TEMP_SENSOR_DEADBAND),
+                )
+            ),
+            float(
+                options.get(
+                    CONF_TEMP_SENSOR_MIN_INTERVAL,
+                    data.get(
+                        CONF_TEMP_SENSOR_MIN_INTERVAL, DEFAULT_TEMP_SENSOR_MIN_INTERVAL
+                    ),
+                )
+            ),
+            float(
+                options.get(
+                    CONF_TEMP_SENSOR_SMOOTHING,
+                    data.get(CONF_TEMP_SENSOR_SMOOTHING, DEFAULT_TEMP_SENSOR_SMOOTHING),
+                )
+            ),
+        )
+
+        self._pipelined_polling = bool(
+            options.get(
+                CONF_PIPELINED_POLLING,
+                data.get(CONF_PIPELINED_POLLING, DEFAULT_PIPELINED_POLLING),
+            )
         )
 
         # MAC and Encryption Version should only come from original data, not options
@@ -221,7 +326,13 @@ class GreeClimate(ClimateEntity):
         self._has_light_sensor = None  # Will be detected
         self._current_temperature = None  # Keep for external sensor logic
         self._first_time_run = True
-        self._encryption_key = None
+        # Key persisted by an earlier bind; a stale one triggers a re-bind
+        stored_key = data.get(CONF_ENCRYPTION_KEY)
+        self._encryption_key = stored_key.encode("utf8") if stored_key else None
+        self._listeners = []
+        self._pending_command = {}
+        self._update_lock = asyncio.Lock()
+        self._telemetry = DeviceTelemetry()
 
         # --- Configure Preset Modes based on horizontal swing ---
         if self._horizontal_swing:
@@ -245,66 +356,24 @@ class GreeClimate(ClimateEntity):
             port=self._port,
             mac=self._mac_addr,
             timeout=self._timeout,
-            encryption_key=None,
+            encryption_key=self._encryption_key,
             encryption_version=self.encryption_version,
         )
 
         # --- Initialize State Manager ---
-        initial_ac_options = {  # Define the initial dictionary structure
-            "Pow": 0,
-            "Mod": None,
-            "SetTem": None,
-            "WdSpd": None,
-            "Air": None,  # Start Pow=0 (Off)
-            "Blo": None,
-            "Health": None,
-            "SwhSlp": None,
-            "Lig": None,
-            "SwingLfRig": None,
-            "SwUpDn": None,
-            "Quiet": None,
-            "Tur": None,
-            "StHt": None,
-            "TemUn": None,
-            "HeatCoolType": None,
-            "TemRec": None,
-            "SvSt": None,
-            "SlpMod": None,
-            "TemSen": None,
-            "AntiDirectBlow": None,
-            "LigSen": None,
-        }
         # Pass flags needed by GreeClimateState properties/methods
         # Pass False for has_temp_sensor initially, it will be updated after detection.
         self._state = GreeClimateState(
-            initial_options=initial_ac_options,
+            initial_options=INITIAL_OPTIONS,
             horizontal_swing=self._horizontal_swing,
             has_temp_sensor=False,  # Initial value, will be updated by detect_features
         )
 
+        self._visible_mask = self._compute_visible_mask()
+
         # --- Initialize fetch list ---
         # This list might be modified by feature detection later
-        self._options_to_fetch = [
-            "Pow",
-            "Mod",
-            "SetTem",
-            "WdSpd",
-            "Air",
-            "Blo",
-            "Health",
-            "SwhSlp",
-            "Lig",
-            "SwingLfRig",
-            "SwUpDn",
-            "Quiet",
-            "Tur",
-            "StHt",
-            "TemUn",
-            "HeatCoolType",
-            "TemRec",
-            "SvSt",
-            "SlpMod",
-        ]
+        self._options_to_fetch = list(DEFAULT_FETCH_COLUMNS)
 
         # --- Setup state change listeners ---
         # Listener registration moved to async_added_to_hass
@@ -312,12 +381,26 @@ class GreeClimate(ClimateEntity):
     # Obsolete methods removed
 
     # pylint: disable=too-many-statements, too-many-branches
+    def _compute_visible_mask(self) -> int:
+        """Return the state bitmask of columns shown by this entity."""
+        columns = list(CLIMATE_COLUMNS)
+        if self._horizontal_swing:
+            columns.append("SwingLfRig")
+        if not self._temp_sensor_entity_ids:
+            columns.append("TemSen")
+        return column_mask(columns)
+
     async def _async_sync_state(
         self, ac_options_to_send: Optional[Dict[str, Any]] = None
-    ) -> None:  # Renamed and made async, changed arg name
-        """Fetch state, update internal state, optionally send commands, update HA state."""
+    ) -> bool:  # Renamed and made async, changed arg name
+        """Fetch state, update internal state, optionally send commands.
+
+        Returns True if anything visible in HA (attributes or availability)
+        changed, so callers only write state when there is something new.
+        """
         if ac_options_to_send is None:
             ac_options_to_send = {}
+        was_available = self.available
 
         # --- Feature Detection (only if not done before) ---
         if self._has_temp_sensor is None:  # Check if detection is needed
@@ -369,8 +452,20 @@ class GreeClimate(ClimateEntity):
                     self._state._has_temp_sensor = False  # Update state helper too
 
         # --- Fetch Current State ---
+        # Pipelined groups are merged into the state as each reply lands
+        landed_mask = 0
+
+        def _apply_group(columns: List[str], values: List[Any]) -> None:
+            nonlocal landed_mask
+            landed_mask |= self._apply_polled(columns, values)
+
         try:
-            received_data_list = await self._api.get_status(self._options_to_fetch)
+            if self._pipelined_polling:
+                received_data_list = await self._api.get_status_pipelined(
+                    self._options_to_fetch, PIPELINE_COLUMNS_PER_PACKET, _apply_group
+                )
+            else:
+                received_data_list = await self._api.get_status(self._options_to_fetch)
             if received_data_list is None:
                 raise ConnectionError("API get_status returned None")
             if not isinstance(received_data_list, list):
@@ -409,7 +504,7 @@ class GreeClimate(ClimateEntity):
                         e,
                     )
                     self._device_online = False
-            return  # Exit if fetch fails
+            return self.available != was_available  # Exit if fetch fails
 
         # --- Connection Success ---
         if not self._disable_available_check:
@@ -420,18 +515,23 @@ class GreeClimate(ClimateEntity):
 
         # --- Update Internal State using Helper ---
         # Update state with fetched values
-        self._state.update_options(
-            self._options_to_fetch, received_data_list
-        )  # Use helper
+        if self._pipelined_polling:
+            changed_mask = landed_mask
+        else:
+            changed_mask = self._apply_polled(
+                self._options_to_fetch, received_data_list
+            )
+        self._record_telemetry()
         # If specific options were sent (e.g., from a service call), update state with those too
         if ac_options_to_send:
-            self._state.update_options(ac_options_to_send)  # Use helper
+            changed_mask |= self._state.apply_dat(
+                list(ac_options_to_send), list(ac_options_to_send.values())
+            )
+        first_sync = self._first_time_run
 
         # --- Send Commands (if needed) ---
         if not self._first_time_run and ac_options_to_send:
-            opt_keys, p_values = list(ac_options_to_send.keys()), list(
-                ac_options_to_send.values()
-            )
+            opt_keys, p_values = encode_command(ac_options_to_send)
             _LOGGER.debug("Sending command: %s = %s", opt_keys, p_values)
             try:
                 send_result = await self._api.send_command(opt_keys, p_values)
@@ -449,18 +549,22 @@ class GreeClimate(ClimateEntity):
             self._first_time_run = False
 
         # --- Update HA State ---
-        # HA state is now derived directly from properties reading self._state
+        # HA state is derived from properties reading self._state; report
+        # whether any of them changed.
+        return (
+            first_sync
+            or bool(changed_mask & self._visible_mask)
+            or self.available != was_available
+        )
 
     # --- Properties ---
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current temperature."""
-        _LOGGER.debug("current_temperature: Using external sensor path (%s)", self._temp_sensor_entity_id)
         # If external sensor used, return its value stored in self._current_temperature
-        if self._temp_sensor_entity_id:
+        if self._temp_sensor_entity_ids:
             return self._current_temperature
         # Otherwise, get from internal state helper
-        _LOGGER.debug("current_temperature: Using internal state path (_state.get_internal_temp())")
         return self._state.get_internal_temp()
 
     @property
@@ -494,6 +598,119 @@ class GreeClimate(ClimateEntity):
         return True if self._disable_available_check else bool(self._device_online)
 
     # --- Service Methods ---
+    async def _async_apply_command(self, ac_options_to_send: Dict[str, Any]) -> None:
+        """Send a command and write HA state if it changed anything visible."""
+        if await self._async_sync_state(ac_options_to_send):
+            self.async_write_ha_state()
+        self._async_notify_listeners()
+
+    async def async_send_command(self, ac_options_to_send: Dict[str, Any]) -> None:
+        """Queue a command from a companion entity.
+
+        Commands queued in the same event loop iteration are merged and sent
+        as a single packet; every caller waits for that packet. The packet is
+        sent even if the caller that started it is cancelled meanwhile, since
+        other callers may have joined it.
+        """
+        self._pending_command.update(ac_options_to_send)
+        if self._command_flush is not None:
+            await self._command_flush
+            return
+        self._command_flush = flush = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.sleep(0)  # Let concurrent callers join this packet
+        finally:
+            command, self._pending_command = self._pending_command, {}
+            self._command_flush = None
+            try:
+                await self._async_apply_command(command)
+            finally:
+                flush.set_result(None)
+
+    async def async_send_group_command(
+        self, ac_options_to_send: Dict[str, Any]
+    ) -> bool:
+        """Send a command straight to the device, skipping the status read.
+
+        Used by the apply_group service fan-out. Returns True if the device
+        acknowledged the command; the state cache is then updated with the
+        sent values.
+        """
+        opt_keys, p_values = encode_command(ac_options_to_send)
+        if not opt_keys or not self._api._is_bound:
+            return False
+        try:
+            response = await self._api.send_command(opt_keys, p_values)
+        except (
+            socket.timeout,
+            socket.error,
+            ConnectionError,
+            ValueError,
+            TypeError,
+        ) as e:  # Catch specific errors
+            _LOGGER.error("Error sending group command to %s: %s", self.name, e)
+            return False
+        if not response:
+            return False
+        if self._state.apply_dat(opt_keys, p_values) & self._visible_mask:
+            self.async_write_ha_state()
+        self._async_notify_listeners()
+        return True
+
+    # --- Companion Entity Support ---
+    @property
+    def metrics(self) -> TransportMetrics:
+        """Return the transport metrics recorded by the device API."""
+        return self._api.metrics
+
+    @property
+    def telemetry(self) -> DeviceTelemetry:
+        """Return the ring of polled samples and its runtime statistics."""
+        return self._telemetry
+
+    @property
+    def ac_state(self) -> GreeClimateState:
+        """Return the shared device state read by companion entities."""
+        return self._state
+
+    def has_feature(self, feature: Optional[str]) -> bool:
+        """Return True if a schema feature gate was detected (None is always on)."""
+        if feature is None:
+            return True
+        detected = {
+            FEATURE_TEMP_SENSOR: self._has_temp_sensor,
+            FEATURE_ANTI_DIRECT_BLOW: self._has_anti_direct_blow,
+            FEATURE_LIGHT_SENSOR: self._has_light_sensor,
+        }
+        return bool(detected.get(feature))
+
+    @callback
+    def async_add_listener(self, listener: Callable[[int], None]) -> Callable[[], None]:
+        """Register a companion entity listener. Returns a remove callback."""
+        self._listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Pass the columns changed since the last sync to companion entities.
+
+        An availability change (or the first notification) marks every
+        column changed so all companions refresh.
+        """
+        changed_mask = self._state.clear_dirty()
+        if self.available != self._notified_available:
+            self._notified_available = self.available
+            changed_mask = -1
+        if not changed_mask:
+            return
+        for listener in list(self._listeners):
+            listener(changed_mask)
+
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature: Optional[float] = kwargs.get(ATTR_TEMPERATURE)
@@ -504,7 +721,7 @@ class GreeClimate(ClimateEntity):
                 temp_int = int(temperature)
                 if MIN_TEMP <= temp_int <= MAX_TEMP:
                     # Send command via sync_state
-                    await self._async_sync_state(
+                    await self._async_apply_command(
                         {"SetTem": temp_int, "StHt": 0}
                     )  # Ensure StHt is off
                 else:
@@ -515,21 +732,19 @@ class GreeClimate(ClimateEntity):
                 _LOGGER.warning("Cannot set temperature when device is off.")
         else:
             _LOGGER.warning("set_temperature called without temperature value.")
-        # self.async_write_ha_state() # Removed
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new target swing mode."""
         _LOGGER.debug("Service call: set_swing_mode(%s)", swing_mode)
         if self._state.hvac_mode != HVACMode.OFF:  # Use state helper
             if swing_mode in self._attr_swing_modes:
-                await self._async_sync_state(
-                    {"SwUpDn": self._attr_swing_modes.index(swing_mode)}
+                await self._async_apply_command(
+                    {"SwUpDn": SWING_MODE_ENCODE[swing_mode]}
                 )
             else:
                 _LOGGER.error("Invalid swing mode requested: %s", swing_mode)
         else:
             _LOGGER.warning("Cannot set swing mode when device is off.")
-        # self.async_write_ha_state() # Removed
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new target preset mode."""
@@ -539,14 +754,13 @@ class GreeClimate(ClimateEntity):
             return
         if self._state.hvac_mode != HVACMode.OFF:  # Use state helper
             if self._attr_preset_modes and preset_mode in self._attr_preset_modes:
-                await self._async_sync_state(
-                    {"SwingLfRig": self._attr_preset_modes.index(preset_mode)}
+                await self._async_apply_command(
+                    {"SwingLfRig": PRESET_MODE_ENCODE[preset_mode]}
                 )
             else:
                 _LOGGER.error("Invalid preset mode requested: %s", preset_mode)
         else:
             _LOGGER.warning("Cannot set preset mode when device is off.")
-        # self.async_write_ha_state() # Removed
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
@@ -560,15 +774,14 @@ class GreeClimate(ClimateEntity):
             elif fan_mode_lower == "quiet":
                 command["Quiet"] = 1
                 # WdSpd might need adjustment based on device behavior with Quiet
-            elif fan_mode in self._attr_fan_modes:
-                command["WdSpd"] = self._attr_fan_modes.index(fan_mode)
+            elif fan_mode in FAN_MODE_ENCODE:
+                command["WdSpd"] = FAN_MODE_ENCODE[fan_mode]
             else:
                 _LOGGER.error("Invalid fan mode requested: %s", fan_mode)
                 return
-            await self._async_sync_state(command)
+            await self._async_apply_command(command)
         else:
             _LOGGER.warning("Cannot set fan mode when device is off.")
-        # self.async_write_ha_state() # Removed
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -577,74 +790,126 @@ class GreeClimate(ClimateEntity):
         if hvac_mode == HVACMode.OFF:
             command["Pow"] = 0
         else:
-            if hvac_mode in self._attr_hvac_modes:
+            if hvac_mode in HVAC_MODE_ENCODE:
                 command["Pow"] = 1
-                command["Mod"] = self._attr_hvac_modes.index(hvac_mode)
+                command["Mod"] = HVAC_MODE_ENCODE[hvac_mode]
             else:
                 _LOGGER.error("Invalid HVAC mode requested: %s", hvac_mode)
                 return
-        await self._async_sync_state(command)
-        # self.async_write_ha_state() # Removed
+        await self._async_apply_command(command)
 
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
         _LOGGER.debug("Service call: turn_on()")
-        await self._async_sync_state({"Pow": 1})
-        # self.async_write_ha_state() # Removed
+        await self._async_apply_command({"Pow": 1})
 
     async def async_turn_off(self) -> None:
         """Turn the entity off."""
         _LOGGER.debug("Service call: turn_off()")
-        await self._async_sync_state({"Pow": 0})
-        # self.async_write_ha_state() # Removed
+        await self._async_apply_command({"Pow": 0})
 
     # --- HA Lifecycle Methods ---
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
         _LOGGER.debug("Gree climate device %s added to hass", self.name)
         # Add listener for external temp sensor if configured
-        if self._temp_sensor_entity_id:
+        if self._temp_sensor_entity_ids:
             _LOGGER.debug(
-                "Adding state listener for temp sensor %s", self._temp_sensor_entity_id
+                "Adding state listener for temp sensors %s",
+                self._temp_sensor_entity_ids,
             )
-            # Get initial state
-            new_state = self.hass.states.get(self._temp_sensor_entity_id)
-            if new_state:
-                self._async_update_current_temp(
-                    new_state
-                )  # Update internal _current_temperature
+            # Get initial states; later changes arrive one sensor at a time
+            for entity_id in self._temp_sensor_entity_ids:
+                new_state = self.hass.states.get(entity_id)
+                if new_state:
+                    self._async_update_current_temp(
+                        new_state
+                    )  # Update internal _current_temperature
 
             # Register for future state changes
             self.async_on_remove(
                 async_track_state_change_event(
                     self.hass,
-                    self._temp_sensor_entity_id,
+                    self._temp_sensor_entity_ids,
                     self._async_temp_sensor_changed,
                 )
             )
+            self.async_on_remove(self._async_cancel_temp_flush)
+        # Poll on our own timer so unchanged polls don't rewrite HA state
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_poll, SCAN_INTERVAL)
+        )
         # Perform initial update (will also do feature detection)
         await self.async_update()
+        self._async_notify_listeners()
 
     async def async_update(self) -> None:
         """Update the entity."""
         # Directly await the async internal update method
-        await self._async_update_internal()
+        async with self._update_lock:
+            await self._async_update_internal()
         # State update is implicitly handled by properties reading from self._state now
 
-    async def _async_update_internal(self) -> None:  # Renamed and made async
-        """Asynchronous update logic. Handles binding and state sync."""
+    def _apply_polled(self, columns: List[str], values: List[Any]) -> int:
+        """Merge polled values into the state, timed as the `apply` phase."""
+        started = time.perf_counter_ns()
+        changed_mask = self._state.apply_dat(columns, values)
+        self._api.metrics.phases.record(PHASE_APPLY, time.perf_counter_ns() - started)
+        return changed_mask
+
+    def _record_telemetry(self) -> None:
+        """Add the freshly polled state to the telemetry ring."""
+        state = self._state
+        self._telemetry.record(
+            time.monotonic(),
+            state.get_column("Pow"),
+            state.get_column("Mod"),
+            state.target_temperature,
+            self.current_temperature,
+            state.get_column("WdSpd"),
+        )
+
+    async def _async_poll(self, _now: datetime) -> None:
+        """Poll the device and write HA state only if something visible changed.
+
+        Like HA's own polling, a tick is skipped while the previous update is
+        still running (timeouts, a column-limit probe or a re-bind can outlast
+        the scan interval).
+        """
+        if self._update_lock.locked():
+            _LOGGER.debug(
+                "Previous update of %s still running, skipping poll", self.name
+            )
+            return
+        async with self._update_lock:
+            changed = await self._async_update_internal()
+        # Room sensors that stopped reporting leave the aggregate
+        now = time.monotonic()
+        if self._temp_aggregate.evict_stale(now):
+            changed |= self._async_publish_room_temp(now)
+        if changed:
+            self.async_write_ha_state()
+        self._async_notify_listeners()
+
+    async def _async_update_internal(self) -> bool:  # Renamed and made async
+        """Asynchronous update logic. Handles binding and state sync.
+
+        Returns True if the HA-visible state changed.
+        """
+        was_available = self.available
         if not self._api._is_bound:
             try:
                 bind_success = await self._api.bind_and_get_key()  # Added await
                 if not bind_success:
                     if not self._disable_available_check:
                         self._device_online = False
-                    return
+                    return self.available != was_available
                 else:
                     _LOGGER.info("Binding successful for %s.", self.name)
                     self._encryption_key = self._api._encryption_key
                     if self._encryption_key is not None:
                         self._api.update_encryption_key(self._encryption_key)
+                        self._persist_encryption_key()
                     else:
                         _LOGGER.error("Binding ok but key is None for %s.", self.name)
             except (
@@ -657,11 +922,16 @@ class GreeClimate(ClimateEntity):
                 _LOGGER.error("Exception during binding for %s: %s", self.name, e)
                 if not self._disable_available_check:
                     self._device_online = False
-                return
+                return self.available != was_available
+
+        if self._api.needs_rebind:
+            # Replies arrive but no longer decrypt: the unit was reset or
+            # re-paired and has a new key
+            await self._async_rebind()
 
         if self._api._is_bound:
             try:
-                await self._async_sync_state()  # Call async sync state
+                return await self._async_sync_state()  # Call async sync state
             except (
                 socket.timeout,
                 socket.error,
@@ -674,6 +944,30 @@ class GreeClimate(ClimateEntity):
                     self._device_online = False
         elif not self._disable_available_check:
             self._device_online = False
+        return self.available != was_available
+
+    async def _async_rebind(self) -> None:
+        """Fetch and persist the new key of a reset or re-paired unit.
+
+        The API rate limits the attempts, so this is cheap to call on every
+        poll while the key is stale.
+        """
+        if not await self._api.rebind():
+            return
+        _LOGGER.info("Re-bound %s after its key changed.", self.name)
+        self._encryption_key = self._api._encryption_key
+        self._persist_encryption_key()
+
+    def _persist_encryption_key(self) -> None:
+        """Store the device key in the entry so restarts skip the bind."""
+        if self._encryption_key is None:
+            return
+        key = self._encryption_key.decode("utf8")
+        if self._entry.data.get(CONF_ENCRYPTION_KEY) == key:
+            return
+        self.hass.config_entries.async_update_entry(
+            self._entry, data={**self._entry.data, CONF_ENCRYPTION_KEY: key}
+        )
 
     # --- State Change Callbacks (Added back for Temp Sensor) ---
 
@@ -698,16 +992,21 @@ class GreeClimate(ClimateEntity):
         if new_state is None or new_state.state in (STATE_UNKNOWN, None):
             _LOGGER.debug("New temp_sensor state is unknown or None, ignoring.")
             return
-        self._async_update_current_temp(new_state)
-        # Request HA state update after internal temp is updated
-        self.async_write_ha_state()
+        # Only write HA state if the filtered temperature actually changed
+        if self._async_update_current_temp(new_state):
+            self.async_write_ha_state()
 
     @callback
-    def _async_update_current_temp(self, state: State) -> None:
-        _LOGGER.debug("_async_update_current_temp: Processing state for external sensor '%s': %s", state.entity_id, state.state)
-        """Update internal _current_temperature from sensor state."""
+    def _async_update_current_temp(self, state: State) -> bool:
+        """Update internal _current_temperature from sensor state.
+
+        The reading replaces this sensor's entry in the room aggregate, and
+        the aggregate goes through the deadband/interval/EMA filter.
+        Returns True if _current_temperature changed.
+        """
         # This method only updates the internal variable used by the current_temperature property
         # when an external sensor is configured. It does NOT interact with self._state.
+        reading: Optional[float] = None
         _LOGGER.debug(
             "Updating internal _current_temperature from sensor: %s", state.state
         )
@@ -718,16 +1017,16 @@ class GreeClimate(ClimateEntity):
                 temp_value = float(_state_val)
                 if unit == UnitOfTemperature.FAHRENHEIT:
                     celsius_temp = (temp_value - 32.0) * 5.0 / 9.0
-                    self._current_temperature = round(celsius_temp, 1)
+                    reading = round(celsius_temp, 1)
                     _LOGGER.debug(
                         "External sensor (%s °F) converted to %s °C for _current_temperature",
                         temp_value,
-                        self._current_temperature,
+                        reading,
                     )
                 else:
-                    self._current_temperature = temp_value
+                    reading = temp_value
                     _LOGGER.debug(
-                        "External sensor (%s %s) stored directly in _current_temperature",
+                        "External sensor (%s %s) used directly for _current_temperature",
                         temp_value,
                         unit or "°C assumed",
                     )
@@ -735,12 +1034,46 @@ class GreeClimate(ClimateEntity):
                 _LOGGER.warning(
                     "Temp sensor state '%s' is not a valid float.", _state_val
                 )
-                self._current_temperature = None
         except (ValueError, TypeError) as ex:
             _LOGGER.error(
                 "Unable to update _current_temperature from temp_sensor: %s", ex
             )
-            self._current_temperature = None
+            reading = None
+
+        now = time.monotonic()
+        self._temp_aggregate.update(state.entity_id, reading, now)
+        return self._async_publish_room_temp(now)
+
+    @callback
+    def _async_publish_room_temp(self, now: float) -> bool:
+        """Offer the room aggregate to the filter.
+
+        Returns True if _current_temperature changed; a change held back by
+        the min interval is scheduled for later.
+        """
+        if self._temp_filter.offer(self._temp_aggregate.value, now):
+            self._current_temperature = self._temp_filter.value
+            return True
+        if self._temp_filter.pending and self._temp_flush_unsub is None:
+            self._temp_flush_unsub = async_call_later(
+                self.hass, self._temp_filter.retry_in(now), self._async_flush_temp
+            )
+        return False
+
+    @callback
+    def _async_flush_temp(self, _now: datetime) -> None:
+        """Publish an external sensor reading held back by the min interval."""
+        self._temp_flush_unsub = None
+        if self._temp_filter.flush(time.monotonic()):
+            self._current_temperature = self._temp_filter.value
+            self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_temp_flush(self) -> None:
+        """Cancel a scheduled publish of a held-back reading."""
+        if self._temp_flush_unsub is not None:
+            self._temp_flush_unsub()
+            self._temp_flush_unsub = None
 
     # --- Helper Methods (Added back) ---
     def represents_float(self, s: Any) -> bool:
@@ -1,21 +1,111 @@
 """Helper classes and functions for the Gree Climate platform."""
 
 import logging
+import math
 import socket  # Added import
-from typing import Any, Dict, List, Optional, Tuple, Union
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNKNOWN
+from homeassistant.const import STATE_UNKNOWN
 from homeassistant.components.climate import HVACMode
 
-# Assuming necessary consts are imported here or passed in
-from .const import FAN_MODES, SWING_MODES, PRESET_MODES, TEMP_OFFSET, HVAC_MODES
+from .const import (
+    COLUMN_INDEX_CACHE_SIZE,
+    TEMP_AGGREGATE_MAX,
+    TEMP_AGGREGATE_MEAN,
+    TEMP_AGGREGATE_MIN,
+    TEMP_OFFSET,
+    TEMP_SENSOR_AGGREGATES,
+)
 from .device_api import GreeDeviceApi  # Needed for feature detection
+from .schema import (
+    FAN_MODE_DECODE,
+    FEATURE_ANTI_DIRECT_BLOW,
+    FEATURE_COLUMNS,
+    FEATURE_LIGHT_SENSOR,
+    FEATURE_TEMP_SENSOR,
+    HVAC_MODE_DECODE,
+    PRESET_MODE_DECODE,
+    STATE_COLUMNS,
+    SWING_MODE_DECODE,
+    decode_onoff,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Fixed state layout: slot order comes from the column schema
+COLUMN_INDEX: Dict[str, int] = {name: i for i, name in enumerate(STATE_COLUMNS)}
+
+# Slots read by the HA state properties
+_I_POW: int = COLUMN_INDEX["Pow"]
+_I_MOD: int = COLUMN_INDEX["Mod"]
+_I_SETTEM: int = COLUMN_INDEX["SetTem"]
+_I_WDSPD: int = COLUMN_INDEX["WdSpd"]
+_I_SWHSLP: int = COLUMN_INDEX["SwhSlp"]
+_I_SWINGLFRIG: int = COLUMN_INDEX["SwingLfRig"]
+_I_SWUPDN: int = COLUMN_INDEX["SwUpDn"]
+_I_QUIET: int = COLUMN_INDEX["Quiet"]
+_I_TUR: int = COLUMN_INDEX["Tur"]
+_I_STHT: int = COLUMN_INDEX["StHt"]
+_I_SLPMOD: int = COLUMN_INDEX["SlpMod"]
+_I_TEMSEN: int = COLUMN_INDEX["TemSen"]
+
+# Marks an unset (None) slot in the int16 state array
+_UNSET: int = -32768
+_INT16_MAX: int = 32767
+
+# Column lists seen in status replies, mapped to their state slots. Cleared
+# when full: split, pipelined and service column orders all add keys.
+_INDEX_CACHE: Dict[Tuple[str, ...], Tuple[Optional[int], ...]] = {}
+
+
+def _column_indices(columns: Sequence[str]) -> Tuple[Optional[int], ...]:
+    """Return the state slot for each column (None for unknown columns)."""
+    key = tuple(columns)
+    indices = _INDEX_CACHE.get(key)
+    if indices is None:
+        indices = tuple(COLUMN_INDEX.get(name) for name in key)
+        if len(_INDEX_CACHE) >= COLUMN_INDEX_CACHE_SIZE:
+            _INDEX_CACHE.clear()
+        _INDEX_CACHE[key] = indices
+    return indices
+
+
+def column_mask(columns: Iterable[str]) -> int:
+    """Return the state bitmask covering the given columns."""
+    mask = 0
+    for name in columns:
+        mask |= 1 << COLUMN_INDEX[name]
+    return mask
+
+
+def changed_columns(mask: int) -> Set[str]:
+    """Return the column names whose bits are set in a state bitmask."""
+    return {name for i, name in enumerate(STATE_COLUMNS) if mask >> i & 1}
+
+
+def _onoff_property(column: str, doc: str) -> property:
+    """Build a read-only on/off state property for a bool column."""
+    index = COLUMN_INDEX[column]
+
+    def getter(self: "GreeClimateState") -> str:
+        return decode_onoff(self._get(index))
+
+    getter.__doc__ = doc
+    return property(getter)
+
+
 class GreeClimateState:
-    """Manages the internal state representation (_ac_options) and translation."""
+    """Manages the internal state representation (_ac_options) and translation.
+
+    Values live in a fixed-layout int16 array indexed by STATE_COLUMNS; a
+    bitmask records which slots changed since the last `clear_dirty()`.
+    """
+
+    __slots__ = ("_values", "_dirty", "_horizontal_swing", "_has_temp_sensor")
 
     def __init__(
         self,
@@ -24,16 +114,77 @@ class GreeClimateState:
         has_temp_sensor: bool,
     ):
         """Initialize the state manager."""
-        self._ac_options: Dict[str, Optional[int]] = initial_options
+        self._values: array = array("h", [_UNSET]) * len(STATE_COLUMNS)
+        self._dirty: int = 0
         self._horizontal_swing = horizontal_swing  # Store flag
         self._has_temp_sensor = has_temp_sensor  # Store flag
+        self.update_options(initial_options)
+        self._dirty = 0
+
+    @property
+    def _ac_options(self) -> Dict[str, Optional[int]]:
+        """Return a snapshot of the state as a column -> value dictionary."""
+        return {name: self._get(i) for i, name in enumerate(STATE_COLUMNS)}
+
+    @property
+    def dirty_mask(self) -> int:
+        """Return the bitmask of slots changed since the last clear_dirty()."""
+        return self._dirty
+
+    def clear_dirty(self) -> int:
+        """Reset the dirty bitmask, returning its previous value."""
+        dirty, self._dirty = self._dirty, 0
+        return dirty
+
+    def _get(self, index: int) -> Optional[int]:
+        """Return the value stored in a slot, or None if unset."""
+        value = self._values[index]
+        return None if value == _UNSET else value
+
+    def _set(self, index: int, key: str, value: Any) -> int:
+        """Store a raw value in a slot. Returns the slot's bit if it changed."""
+        new_value = _UNSET
+        if value is not None:
+            try:
+                new_value = int(value)
+                if not _UNSET < new_value <= _INT16_MAX:
+                    raise OverflowError(new_value)
+            except (ValueError, TypeError, OverflowError):
+                _LOGGER.warning(
+                    "Could not convert value '%s' to int for key '%s'. Storing as None.",
+                    value,
+                    key,
+                )
+                new_value = _UNSET
+        if self._values[index] == new_value:
+            return 0
+        self._values[index] = new_value
+        return 1 << index
+
+    def apply_dat(self, columns: Sequence[str], dat: Sequence[Any]) -> int:
+        """Bulk-apply a status reply (`cols`/`dat` lists) to the state.
+
+        Returns the bitmask of slots whose value changed.
+        """
+        changed = 0
+        for index, key, value in zip(_column_indices(columns), columns, dat):
+            if index is None:
+                _LOGGER.debug("Ignoring unknown state column '%s'", key)
+                continue
+            changed |= self._set(index, key, value)
+        self._dirty |= changed
+        return changed
 
     def update_options(
         self,
         new_options_to_override: Union[List[str], Dict[str, Any]],
         option_values_to_override: Optional[List[Any]] = None,
-    ) -> None:
-        """Update the internal _ac_options dictionary."""
+    ) -> Set[str]:
+        """Update the internal state from key/value lists or a dictionary.
+
+        Returns the set of columns whose value actually changed.
+        """
+        changed = 0
         if option_values_to_override is not None and isinstance(
             new_options_to_override, list
         ):
@@ -44,74 +195,57 @@ class GreeClimateState:
                     len(option_values_to_override),
                 )
             else:
-                for i, key in enumerate(new_options_to_override):
-                    value = option_values_to_override[i]
-                    try:
-                        self._ac_options[key] = (
-                            int(value) if value is not None else None
-                        )
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Could not convert value '%s' to int for key '%s'. Storing as None.",
-                            value,
-                            key,
-                        )
-                        self._ac_options[key] = None
+                changed = self.apply_dat(
+                    new_options_to_override, option_values_to_override
+                )
         elif isinstance(new_options_to_override, dict):
-            for key, value in new_options_to_override.items():
-                try:
-                    self._ac_options[key] = int(value) if value is not None else None
-                except (ValueError, TypeError):
-                    _LOGGER.warning(
-                        "Could not convert value '%s' to int for key '%s'. Storing as None.",
-                        value,
-                        key,
-                    )
-                    self._ac_options[key] = None
+            changed = self.apply_dat(
+                list(new_options_to_override), list(new_options_to_override.values())
+            )
         else:
             _LOGGER.error("Invalid arguments passed to update_options.")
-        # No return needed as it modifies self._ac_options directly
+        return changed_columns(changed) if changed else set()
 
     # --- Properties for HA State ---
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target temperature based on internal state."""
-        if self._ac_options.get("StHt") == 1:
+        if self._get(_I_STHT) == 1:
             return 8.0
-        set_temp = self._ac_options.get("SetTem")
+        set_temp = self._get(_I_SETTEM)
         return float(set_temp) if set_temp is not None else None
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the HVAC mode based on internal state."""
-        pow_state = self._ac_options.get("Pow")
+        pow_state = self._get(_I_POW)
         if pow_state == 0:
             return HVACMode.OFF
-        mod_index = self._ac_options.get("Mod")
-        if mod_index is not None and 0 <= mod_index < len(HVAC_MODES):
-            return HVAC_MODES[mod_index]
+        mod_index = self._get(_I_MOD)
+        if mod_index is not None and 0 <= mod_index < len(HVAC_MODE_DECODE):
+            return HVAC_MODE_DECODE[mod_index]
         _LOGGER.warning("Invalid HVAC mode index: %s", mod_index)
         return HVACMode.OFF  # Default to OFF if invalid
 
     @property
     def fan_mode(self) -> Optional[str]:
         """Return the fan mode based on internal state."""
-        if self._ac_options.get("Tur") == 1:
+        if self._get(_I_TUR) == 1:
             return "Turbo"
-        if self._ac_options.get("Quiet") == 1:
+        if self._get(_I_QUIET) == 1:
             return "Quiet"
-        speed_index = self._ac_options.get("WdSpd")
-        if speed_index is not None and 0 <= speed_index < len(FAN_MODES):
-            return FAN_MODES[speed_index]
+        speed_index = self._get(_I_WDSPD)
+        if speed_index is not None and 0 <= speed_index < len(FAN_MODE_DECODE):
+            return FAN_MODE_DECODE[speed_index]
         _LOGGER.warning("Invalid fan speed index: %s", speed_index)
         return None
 
     @property
     def swing_mode(self) -> Optional[str]:
         """Return the vertical swing mode based on internal state."""
-        swing_index = self._ac_options.get("SwUpDn")
-        if swing_index is not None and 0 <= swing_index < len(SWING_MODES):
-            return SWING_MODES[swing_index]
+        swing_index = self._get(_I_SWUPDN)
+        if swing_index is not None and 0 <= swing_index < len(SWING_MODE_DECODE):
+            return SWING_MODE_DECODE[swing_index]
         _LOGGER.warning("Invalid vertical swing index: %s", swing_index)
         return None
 
@@ -120,153 +254,263 @@ class GreeClimateState:
         """Return the horizontal swing (preset) mode based on internal state."""
         if not self._horizontal_swing:  # Use stored flag
             return None
-        preset_index = self._ac_options.get("SwingLfRig")
-        if preset_index is not None and 0 <= preset_index < len(PRESET_MODES):
-            return PRESET_MODES[preset_index]
+        preset_index = self._get(_I_SWINGLFRIG)
+        if preset_index is not None and 0 <= preset_index < len(PRESET_MODE_DECODE):
+            return PRESET_MODE_DECODE[preset_index]
         _LOGGER.warning("Invalid horizontal swing index: %s", preset_index)
         return None
 
-    @property
-    def lights_state(self) -> str:
-        """Return the state of the lights."""
-        lig_val = self._ac_options.get("Lig")
-        return (
-            STATE_ON if lig_val == 1 else STATE_OFF if lig_val == 0 else STATE_UNKNOWN
-        )
-
-    @property
-    def xfan_state(self) -> str:
-        """Return the state of XFan."""
-        blo_val = self._ac_options.get("Blo")
-        return (
-            STATE_ON if blo_val == 1 else STATE_OFF if blo_val == 0 else STATE_UNKNOWN
-        )
-
-    @property
-    def health_state(self) -> str:
-        """Return the state of the Health mode."""
-        health_val = self._ac_options.get("Health")
-        return (
-            STATE_ON
-            if health_val == 1
-            else STATE_OFF if health_val == 0 else STATE_UNKNOWN
-        )
-
-    @property
-    def powersave_state(self) -> str:
-        """Return the state of Power Save mode."""
-        svst_val = self._ac_options.get("SvSt")
-        return (
-            STATE_ON if svst_val == 1 else STATE_OFF if svst_val == 0 else STATE_UNKNOWN
-        )
+    lights_state = _onoff_property("Lig", "Return the state of the lights.")
+    xfan_state = _onoff_property("Blo", "Return the state of XFan.")
+    health_state = _onoff_property("Health", "Return the state of the Health mode.")
+    powersave_state = _onoff_property("SvSt", "Return the state of Power Save mode.")
+    eightdegheat_state = _onoff_property(
+        "StHt", "Return the state of 8 Degree Heat mode."
+    )
+    air_state = _onoff_property("Air", "Return the state of the Air mode/feature.")
+    # Note: This assumes the feature *exists*. The main climate class should handle availability.
+    anti_direct_blow_state = _onoff_property(
+        "AntiDirectBlow", "Return the state of Anti-Direct Blow."
+    )
 
     @property
     def sleep_state(self) -> str:
         """Return the state of Sleep mode."""
-        swhslp_val = self._ac_options.get("SwhSlp")
-        slpmod_val = self._ac_options.get("SlpMod")
-        return (
-            STATE_ON
-            if (swhslp_val == 1 and slpmod_val == 1)
-            else STATE_OFF if (swhslp_val == 0 and slpmod_val == 0) else STATE_UNKNOWN
-        )
-
-    @property
-    def eightdegheat_state(self) -> str:
-        """Return the state of 8 Degree Heat mode."""
-        stht_val = self._ac_options.get("StHt")
-        return (
-            STATE_ON if stht_val == 1 else STATE_OFF if stht_val == 0 else STATE_UNKNOWN
-        )
-
-    @property
-    def air_state(self) -> str:
-        """Return the state of the Air mode/feature."""
-        air_val = self._ac_options.get("Air")
-        return (
-            STATE_ON if air_val == 1 else STATE_OFF if air_val == 0 else STATE_UNKNOWN
-        )
+        swhslp_val = self._get(_I_SWHSLP)
+        if swhslp_val != self._get(_I_SLPMOD):
+            return STATE_UNKNOWN
+        return decode_onoff(swhslp_val)
 
-    @property
-    def anti_direct_blow_state(self) -> str:
-        """Return the state of Anti-Direct Blow."""
-        # Note: This assumes the feature *exists*. The main climate class should handle availability.
-        adb_val = self._ac_options.get("AntiDirectBlow")
-        return (
-            STATE_ON if adb_val == 1 else STATE_OFF if adb_val == 0 else STATE_UNKNOWN
-        )
+    def get_column(self, column: str) -> Optional[int]:
+        """Return the raw value of a column, or None if unset."""
+        return self._get(COLUMN_INDEX[column])
 
     # --- Helper Methods ---
     def get_internal_temp(self) -> Optional[float]:
-        """Gets internal temperature from device state, applying offset if needed."""
-        _LOGGER.debug("get_internal_temp: Internal sensor detected flag (_has_temp_sensor): %s", self._has_temp_sensor)
+        """Gets internal temperature from device state, applying offset if needed.
+
+        Read through `current_temperature` on every HA state write, so it
+        does not log.
+        """
         if not self._has_temp_sensor:  # Use stored flag
             return None
-            _LOGGER.debug("get_internal_temp: Returning None (internal sensor not detected)")
-            return None # Moved return here
-        temp_sen = self._ac_options.get("TemSen")
-        if temp_sen is not None:
-            _LOGGER.debug("get_internal_temp: Raw TemSen value from _ac_options: %s", temp_sen) # Indented
-            temp_val = temp_sen if temp_sen <= TEMP_OFFSET else temp_sen - TEMP_OFFSET # Indented
-            _LOGGER.debug("get_internal_temp: Returning calculated internal temp: %s", float(temp_val)) # Indented and moved before return
-            return float(temp_val) # Indented
-        else: # Added else block
-            _LOGGER.debug("get_internal_temp: Returning None (TemSen value was None)") # Indented under else
-            return None # Indented under else
+        temp_sen = self._get(_I_TEMSEN)
+        if temp_sen is None:
+            return None
+        return float(temp_sen if temp_sen <= TEMP_OFFSET else temp_sen - TEMP_OFFSET)
+
+
+# Slack when comparing a change against the deadband (float noise)
+_DEADBAND_EPSILON: float = 1e-9
+
+
+class TemperatureFilter:
+    """Filters external temperature sensor readings before HA sees them.
+
+    A reading is smoothed with an exponential moving average (`smoothing`
+    is the weight kept from the previous average; 0 turns it off) and only
+    published when it moved at least `deadband` degrees from the published
+    value, and no sooner than `min_interval` seconds after the last publish.
+    A change held back only by the interval stays `pending`; the caller
+    publishes it with `flush` after `retry_in` seconds. The first reading
+    and a sensor becoming unavailable (None) are published at once.
+    """
+
+    __slots__ = (
+        "_deadband",
+        "_min_interval",
+        "_smoothing",
+        "_average",
+        "_published_at",
+        "value",
+        "pending",
+    )
+
+    def __init__(self, deadband: float, min_interval: float, smoothing: float) -> None:
+        """Initialize with nothing published."""
+        self._deadband = deadband
+        self._min_interval = min_interval
+        self._smoothing = smoothing
+        self._average: Optional[float] = None
+        self._published_at = 0.0
+        self.value: Optional[float] = None
+        self.pending = False
+
+    def offer(self, reading: Optional[float], now: float) -> bool:
+        """Feed a reading taken at monotonic `now`.
+
+        Returns True if the published value changed.
+        """
+        if reading is None:
+            self._average = None
+            return self._publish(None, now)
+        if self._average is None:
+            self._average = reading
+            return self._publish(reading, now)
+        self._average += (1.0 - self._smoothing) * (reading - self._average)
+        if (
+            self.value is not None
+            and abs(self._average - self.value) + _DEADBAND_EPSILON < self._deadband
+        ):
+            self.pending = False
+            return False
+        if self.value is not None and now - self._published_at < self._min_interval:
+            self.pending = True
+            return False
+        return self._publish(self._average, now)
+
+    def retry_in(self, now: float) -> float:
+        """Return the seconds until a pending change may be published."""
+        return max(0.0, self._published_at + self._min_interval - now)
+
+    def flush(self, now: float) -> bool:
+        """Publish a pending change. Returns True if the value changed."""
+        if not self.pending or self._average is None:
+            return False
+        return self._publish(self._average, now)
+
+    def _publish(self, value: Optional[float], now: float) -> bool:
+        """Make `value` the published value."""
+        self.pending = False
+        self._published_at = now
+        if value is not None:
+            value = round(value, 2)
+        changed = value != self.value
+        self.value = value
+        return changed
+
+
+def temp_sensor_ids(value: Union[str, Sequence[str], None]) -> List[str]:
+    """Return the configured temp sensors as a list (older entries hold one id)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+class SensorAggregate:
+    """Combines the latest readings of several room temperature sensors.
+
+    Each sensor event replaces that sensor's reading. The mean comes from a
+    running sum, and min, max and median from a sorted list of the current
+    readings kept with `bisect`. Readings are never rebuilt from
+    `hass.states`. Readings older than `max_age` seconds (0: never) are
+    evicted oldest-first; sensors are kept in update order, so eviction
+    stops at the first fresh one.
+    """
+
+    __slots__ = ("_method", "_max_age", "_readings", "_sorted", "_sum")
+
+    def __init__(self, method: str, max_age: float) -> None:
+        """Initialize with no readings."""
+        if method not in TEMP_SENSOR_AGGREGATES:
+            raise ValueError(f"Unknown temperature aggregate: {method}")
+        self._method = method
+        self._max_age = max_age
+        # entity_id -> (reading, monotonic time), oldest update first
+        self._readings: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._sorted: List[float] = []
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of sensors with a current reading."""
+        return len(self._readings)
+
+    def update(self, entity_id: str, reading: Optional[float], now: float) -> None:
+        """Replace a sensor's reading; None, NaN or inf drops the sensor."""
+        self._discard(entity_id)
+        if reading is not None and math.isfinite(reading):
+            self._readings[entity_id] = (reading, now)
+            insort(self._sorted, reading)
+            self._sum += reading
+        self.evict_stale(now)
+
+    def evict_stale(self, now: float) -> bool:
+        """Drop readings older than max_age. Returns True if any were dropped."""
+        if not self._max_age:
+            return False
+        evicted = False
+        while self._readings:
+            entity_id, (_reading, updated) = next(iter(self._readings.items()))
+            if now - updated <= self._max_age:
+                break
+            self._discard(entity_id)
+            evicted = True
+        return evicted
+
+    def _discard(self, entity_id: str) -> None:
+        """Remove a sensor's reading, if it has one."""
+        entry = self._readings.pop(entity_id, None)
+        if entry is None:
+            return
+        del self._sorted[bisect_left(self._sorted, entry[0])]
+        self._sum -= entry[0]
+        if not self._readings:
+            self._sum = 0.0  # Drop accumulated float error
+
+    @property
+    def value(self) -> Optional[float]:
+        """Return the aggregate of the current readings, or None."""
+        count = len(self._sorted)
+        if not count:
+            return None
+        if self._method == TEMP_AGGREGATE_MEAN:
+            return self._sum / count
+        if self._method == TEMP_AGGREGATE_MIN:
+            return self._sorted[0]
+        if self._method == TEMP_AGGREGATE_MAX:
+            return self._sorted[-1]
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2.0
+
+
+# Feature gate -> name used in detection log messages
+_FEATURE_DESCRIPTIONS: Dict[str, str] = {
+    FEATURE_TEMP_SENSOR: "internal temperature sensor",
+    FEATURE_ANTI_DIRECT_BLOW: "anti-direct blow feature",
+    FEATURE_LIGHT_SENSOR: "light sensor",
+}
+
 
 async def detect_features(
     api: GreeDeviceApi, current_options: List[str]
 ) -> Tuple[bool, bool, bool, List[str]]:
-    """Detect optional device features using API calls."""
-    has_temp_sensor = False
-    has_anti_direct_blow = False
-    has_light_sensor = False
+    """Detect optional device features using API calls.
+
+    Each feature-gated column in the schema is probed with its own status
+    request; columns the device answers are appended to the fetch list.
+    """
+    detected: Dict[str, bool] = {}
     options_to_fetch = list(current_options)  # Work on a copy
 
-    # Detect Temp Sensor (TemSen)
-    try:
-        # Check if device responds to "TemSen" query
-        response = await api.get_status(["TemSen"])
-        # Check if response is not None and is a list (expected format)
-        if response is not None and isinstance(response, list):
-            has_temp_sensor = True
-            _LOGGER.debug("Internal temperature sensor detected.")
-            if "TemSen" not in options_to_fetch:
-                options_to_fetch.append("TemSen")
-        else:
-            _LOGGER.debug(
-                "Internal temperature sensor not detected or invalid response."
-            )
-    except (socket.timeout, socket.error, ConnectionError, ValueError, TypeError) as e:
-        _LOGGER.warning("Error detecting internal temperature sensor: %s", e)
-        # Keep has_temp_sensor as False
-
-    # Detect Anti-Direct Blow (AntiDirectBlow)
-    try:
-        response = await api.get_status(["AntiDirectBlow"])
-        if response is not None and isinstance(response, list):
-            has_anti_direct_blow = True
-            _LOGGER.debug("Anti-direct blow feature detected.")
-            if "AntiDirectBlow" not in options_to_fetch:
-                options_to_fetch.append("AntiDirectBlow")
-        else:
-            _LOGGER.debug("Anti-direct blow feature not detected or invalid response.")
-    except (socket.timeout, socket.error, ConnectionError, ValueError, TypeError) as e:
-        _LOGGER.warning("Error detecting anti-direct blow feature: %s", e)
-        # Keep has_anti_direct_blow as False
-
-    # Detect Light Sensor (LigSen)
-    try:
-        response = await api.get_status(["LigSen"])
-        if response is not None and isinstance(response, list):
-            has_light_sensor = True
-            _LOGGER.debug("Light sensor detected.")
-            if "LigSen" not in options_to_fetch:
-                options_to_fetch.append("LigSen")
-        else:
-            _LOGGER.debug("Light sensor not detected or invalid response.")
-    except (socket.timeout, socket.error, ConnectionError, ValueError, TypeError) as e:
-        _LOGGER.warning("Error detecting light sensor: %s", e)
-        # Keep has_light_sensor as False
+    for feature, column in FEATURE_COLUMNS.items():
+        description = _FEATURE_DESCRIPTIONS.get(feature, column)
+        detected[feature] = False
+        try:
+            response = await api.get_status([column])
+            # Check if response is not None and is a list (expected format)
+            if response is not None and isinstance(response, list):
+                detected[feature] = True
+                _LOGGER.debug("Detected %s.", description)
+                if column not in options_to_fetch:
+                    options_to_fetch.append(column)
+            else:
+                _LOGGER.debug("%s not detected or invalid response.", description)
+        except (
+            socket.timeout,
+            socket.error,
+            ConnectionError,
+            ValueError,
+            TypeError,
+        ) as e:
+            _LOGGER.warning("Error detecting %s: %s", description, e)
 
-    return has_temp_sensor, has_anti_direct_blow, has_light_sensor, options_to_fetch
+    return (
+        detected.get(FEATURE_TEMP_SENSOR, False),
+        detected.get(FEATURE_ANTI_DIRECT_BLOW, False),
+        detected.get(FEATURE_LIGHT_SENSOR, False),
+        options_to_fetch,
+    )
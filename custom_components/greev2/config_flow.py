@@ -1,7 +1,9 @@
 """Config flow for Gree Climate V2 integration."""
 
+import asyncio
 import logging
 import socket  # For exception handling
+from typing import List, Optional
 
 import voluptuous as vol
 
@@ -31,10 +33,25 @@ from .const import (
     CONF_ENCRYPTION_VERSION,  # Import constant
     CONF_TEMP_SENSOR,  # Import new constant
     CONF_DEVICE_MODEL,  # Import new constant
+    CONF_PIPELINED_POLLING,
+    CONF_TEMP_SENSOR_AGGREGATE,
+    CONF_TEMP_SENSOR_DEADBAND,
+    CONF_TEMP_SENSOR_MAX_AGE,
+    CONF_TEMP_SENSOR_MIN_INTERVAL,
+    CONF_TEMP_SENSOR_SMOOTHING,
+    DEFAULT_PIPELINED_POLLING,
+    DEFAULT_TEMP_SENSOR_AGGREGATE,
+    DEFAULT_TEMP_SENSOR_DEADBAND,
+    DEFAULT_TEMP_SENSOR_MAX_AGE,
+    DEFAULT_TEMP_SENSOR_MIN_INTERVAL,
+    DEFAULT_TEMP_SENSOR_SMOOTHING,
+    TEMP_SENSOR_AGGREGATES,
 )
 
 # Line 32 removed
+from .climate_helpers import temp_sensor_ids
 from .device_api import GreeDeviceApi  # Import the API
+from .discovery import DiscoveredDevice, async_sweep, sweep_hosts
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,10 +59,65 @@ _LOGGER = logging.getLogger(__name__)
 _LOGGER.info("GreeV2 Config Flow module loading...")
 
 # Define encryption version options
+ENCRYPTION_AUTO = "auto"  # Bind with every version at once, keep the winner
 ENCRYPTION_OPTIONS = [
+    selector.SelectOptionDict(value=ENCRYPTION_AUTO, label="Auto-detect"),
     selector.SelectOptionDict(value="1", label="V1 (ECB)"),
     selector.SelectOptionDict(value="2", label="V2 (GCM)"),
 ]
+ENCRYPTION_VERSIONS = [1, 2]
+
+# External temperature sensor options: key -> (default, selector)
+TEMP_SENSOR_OPTIONS = {
+    CONF_TEMP_SENSOR_AGGREGATE: (
+        DEFAULT_TEMP_SENSOR_AGGREGATE,
+        selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=TEMP_SENSOR_AGGREGATES,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+                translation_key=CONF_TEMP_SENSOR_AGGREGATE,
+            )
+        ),
+    ),
+    CONF_TEMP_SENSOR_MAX_AGE: (
+        DEFAULT_TEMP_SENSOR_MAX_AGE,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=86400,
+                step=60,
+                unit_of_measurement="s",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+    ),
+    CONF_TEMP_SENSOR_DEADBAND: (
+        DEFAULT_TEMP_SENSOR_DEADBAND,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=2, step=0.05, unit_of_measurement="°C"
+            )
+        ),
+    ),
+    CONF_TEMP_SENSOR_MIN_INTERVAL: (
+        DEFAULT_TEMP_SENSOR_MIN_INTERVAL,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                unit_of_measurement="s",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+    ),
+    CONF_TEMP_SENSOR_SMOOTHING: (
+        DEFAULT_TEMP_SENSOR_SMOOTHING,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(min=0, max=0.95, step=0.05)
+        ),
+    ),
+}
 
 
 # Define the base schema for the user configuration step
@@ -53,12 +125,13 @@ ENCRYPTION_OPTIONS = [
 def get_user_schema(user_input: dict | None = None) -> vol.Schema:
     """Return the user step schema, pre-filled with user input if available."""
     user_input = user_input or {}
-    # Default to V2 based on user's previous config, but allow selection
-    default_enc_version = user_input.get(CONF_ENCRYPTION_VERSION, "2")
+    # Auto-detect by default, but allow forcing a version
+    default_enc_version = user_input.get(CONF_ENCRYPTION_VERSION, ENCRYPTION_AUTO)
     return vol.Schema(
         {
             vol.Required(CONF_HOST, default=user_input.get(CONF_HOST, "")): str,
-            vol.Required(CONF_MAC, default=user_input.get(CONF_MAC, "")): str,
+            # Only needed for a single host; a range sweep finds the MACs
+            vol.Optional(CONF_MAC, default=user_input.get(CONF_MAC, "")): str,
             vol.Optional(
                 CONF_NAME, default=user_input.get(CONF_NAME, DEFAULT_NAME)
             ): str,
@@ -87,61 +160,95 @@ def get_user_schema(user_input: dict | None = None) -> vol.Schema:
     )
 
 
+async def async_bind_first(
+    host: str, mac: str, versions: List[int]
+) -> Optional[GreeDeviceApi]:
+    """Bind with every candidate encryption version concurrently.
+
+    Returns the API of the first attempt that got a valid device key, and
+    cancels the others; None if no version bound.
+    """
+    attempts = {
+        asyncio.create_task(api.bind_and_get_key()): api
+        for api in (
+            GreeDeviceApi(
+                host=host,
+                port=DEFAULT_PORT,
+                mac=mac,
+                timeout=DEFAULT_TIMEOUT,
+                encryption_version=version,
+            )
+            for version in versions
+        )
+    }
+    pending = set(attempts)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                api = attempts[task]
+                if (
+                    task.exception() is None
+                    and task.result()
+                    and api._encryption_key  # pylint: disable=protected-access
+                ):
+                    return api
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 async def validate_input(hass: HomeAssistant, data: dict) -> dict[str, str]:
-    """Validate the user input allows us to connect and bind."""
+    """Validate the user input allows us to connect and bind.
+
+    With the encryption version on auto, V1 and V2 binds race and the
+    version that answers first with a key is returned for the entry.
+    """
     _LOGGER.debug("Validating input data: %s", data)  # Log received data
     host = data[CONF_HOST]
     mac = data[CONF_MAC]
-    # Get selected encryption version, default to 1 if somehow missing (shouldn't happen with default)
-    enc_version_str = data.get(CONF_ENCRYPTION_VERSION, "1")
-    try:
-        enc_version = int(enc_version_str)
-    except (ValueError, TypeError):
-        _LOGGER.warning(
-            "Invalid encryption version '%s', defaulting to 1", enc_version_str
-        )
-        enc_version = 1
+    enc_version_str = data.get(CONF_ENCRYPTION_VERSION, ENCRYPTION_AUTO)
+    if enc_version_str == ENCRYPTION_AUTO:
+        versions = ENCRYPTION_VERSIONS
+    else:
+        try:
+            versions = [int(enc_version_str)]
+        except (ValueError, TypeError):
+            _LOGGER.warning(
+                "Invalid encryption version '%s', auto-detecting", enc_version_str
+            )
+            versions = ENCRYPTION_VERSIONS
 
     # Clean MAC address (remove separators, lowercase)
     cleaned_mac = format_mac(mac)
     _LOGGER.debug(
-        "Extracted Host: %s, Cleaned MAC: %s, Enc Ver: %d",
+        "Extracted Host: %s, Cleaned MAC: %s, Enc Versions: %s",
         host,
         cleaned_mac,
-        enc_version,
+        versions,
     )  # Log extracted values
 
     try:
-        # Instantiate API - use defaults for port/timeout
-        _LOGGER.debug("Instantiating API with encryption_version=%d", enc_version)
-        api = GreeDeviceApi(
-            host=host,
-            port=DEFAULT_PORT,
-            mac=cleaned_mac,
-            timeout=DEFAULT_TIMEOUT,
-            encryption_version=enc_version,  # Use selected version
-        )
-
-        # Run the blocking bind operation in executor
-        _LOGGER.debug(
-            "Attempting to bind to device %s (%s) using V%d",
-            host,
-            cleaned_mac,
-            enc_version,
-        )
-        # bind_and_get_key now returns bool
-        is_bound = await hass.async_add_executor_job(api.bind_and_get_key)
-
-        if not is_bound:
+        api = await async_bind_first(host, cleaned_mac, versions)
+        if api is None:
             _LOGGER.error(
                 "Bind failed for %s (%s) - invalid MAC/unsupported?", host, cleaned_mac
             )
             # Use "invalid_auth" as it implies connection worked but binding failed
             raise InvalidAuth
-        # If binding is successful, return validated info (including cleaned MAC)
-        _LOGGER.info("Successfully bound to device %s (%s)", host, cleaned_mac)
+        version = api._encryption_version  # pylint: disable=protected-access
+        _LOGGER.info(
+            "Successfully bound to device %s (%s) using V%d", host, cleaned_mac, version
+        )
         # We don't strictly need area_id in the return here, it's in the user_input passed to create_entry
-        return {"title": data.get(CONF_NAME, host), "cleaned_mac": cleaned_mac}
+        return {
+            "title": data.get(CONF_NAME, host),
+            "cleaned_mac": cleaned_mac,
+            "encryption_version": str(version),
+        }
 
     except (socket.timeout, socket.error, ConnectionRefusedError, OSError) as conn_ex:
         _LOGGER.error("Failed to connect to device %s: %s", host, conn_ex)
@@ -218,6 +325,10 @@ class GreeV2OptionsFlowHandler(config_entries.OptionsFlow):
                     # Also save the name if provided, can be used by entity naming
                     CONF_NAME: user_input.get(CONF_NAME),
                 }
+                # Only stored once the user has touched them
+                for key in (CONF_PIPELINED_POLLING, *TEMP_SENSOR_OPTIONS):
+                    if user_input.get(key) is not None:
+                        data_to_save[key] = user_input[key]
                 # Use async_create_entry with empty title, data becomes config_entry.options
                 return self.async_create_entry(title="", data=data_to_save) # type: ignore[return-value]
 
@@ -231,15 +342,33 @@ class GreeV2OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_HOST, default=options.get(CONF_HOST, data.get(CONF_HOST))
                 ): str,
                 vol.Optional(
-                    CONF_TEMP_SENSOR, default=options.get(CONF_TEMP_SENSOR)
+                    CONF_TEMP_SENSOR,
+                    default=temp_sensor_ids(options.get(CONF_TEMP_SENSOR)),
                 ): selector.EntitySelector(
                     selector.EntitySelectorConfig(
-                        domain="sensor", device_class=SensorDeviceClass.TEMPERATURE
+                        domain="sensor",
+                        device_class=SensorDeviceClass.TEMPERATURE,
+                        multiple=True,
                     )
                 ),
                 vol.Optional(
                     "area_id", default=options.get("area_id")
                 ): selector.AreaSelector(),
+                vol.Optional(
+                    CONF_PIPELINED_POLLING,
+                    description={
+                        "suggested_value": options.get(
+                            CONF_PIPELINED_POLLING, DEFAULT_PIPELINED_POLLING
+                        )
+                    },
+                ): bool,
+                **{
+                    vol.Optional(
+                        key,
+                        description={"suggested_value": options.get(key, default)},
+                    ): field
+                    for key, (default, field) in TEMP_SENSOR_OPTIONS.items()
+                },
                 # Display-only fields: Use Optional, they won't be saved by the logic above
                 # Use description/suggested_value to hint to UI it's display-only if possible
                 vol.Optional(CONF_DEVICE_MODEL, description={"suggested_value": data.get(CONF_DEVICE_MODEL, "Unknown")}): str,
@@ -273,55 +402,38 @@ class GreeV2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     # CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL # Add later if needed
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._user_input: dict = {}
+        self._sweep_task: Optional[asyncio.Task[List[DiscoveredDevice]]] = None
+        self._discovered: List[DiscoveredDevice] = []
+
     async def async_step_user(self, user_input=None):
-        """Handle the initial step."""
+        """Handle the initial step.
+
+        A CIDR range (e.g. 192.168.20.0/24) in the host field starts a
+        unicast sweep instead of binding to a single address. The MAC is
+        only required for a single address.
+        """
         _LOGGER.info("GreeV2 Config Flow: async_step_user started.")
         errors = {}
         # Pass user_input to pre-fill schema only if it exists (i.e., on error)
         data_schema = get_user_schema(user_input)
 
         if user_input is not None:
-            try:
-                # Validate the input by trying to connect and bind
-                info = await validate_input(self.hass, user_input)
-
-                # Set unique ID to prevent duplicate entries
-                await self.async_set_unique_id(info["cleaned_mac"])
-                self._abort_if_unique_id_configured()
-
-                # If validation succeeds, create the entry
-                _LOGGER.info("Validation successful, preparing config entry data.")
-
-                # Remove temp sensor key if it's empty or None
-                temp_sensor_value = user_input.get(CONF_TEMP_SENSOR)
-                if not temp_sensor_value: # Checks for None or empty string
-                    _LOGGER.debug("External temp sensor is blank, removing key from entry data.")
-                    user_input.pop(CONF_TEMP_SENSOR, None) # Remove key if it exists
+            if "/" in user_input.get(CONF_HOST, ""):
+                try:
+                    sweep_hosts(user_input[CONF_HOST])
+                except ValueError as e:
+                    _LOGGER.warning("Invalid sweep range %s: %s", user_input[CONF_HOST], e)
+                    errors["base"] = "invalid_range"
                 else:
-                    _LOGGER.debug("External temp sensor provided: %s", temp_sensor_value)
-
-                _LOGGER.debug("Final data for config entry: %s", user_input)
-                # Pass potentially modified user_input to data
-                return self.async_create_entry(title=info["title"], data=user_input)
-
-            # Reordered except blocks: AbortFlow first
-            except data_entry_flow.AbortFlow as af:  # Use data_entry_flow.AbortFlow
-                _LOGGER.info("Config flow aborted: %s", af.reason)
-                # Re-raise AbortFlow to let HA handle it (shows the abort message)
-                raise af
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except InvalidAuth:
-                errors["base"] = "invalid_auth"
-            except exceptions.HomeAssistantError as e:  # Catch other HA errors
-                _LOGGER.error("Config flow error: %s", e)
-                errors["base"] = "unknown"  # Default for now
-            # Broad exception catch as a fallback for the whole user step
-            except Exception as e: # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception in config flow: %s", e)
-                errors["base"] = "unknown"
-
-            # If errors occurred, schema is already pre-filled by get_user_schema(user_input) above
+                    self._user_input = user_input
+                    return await self.async_step_sweep()
+            elif not user_input.get(CONF_MAC, "").strip():
+                errors[CONF_MAC] = "mac_required"
+            else:
+                return await self._async_validate_and_create(user_input, errors)
 
         # Show the form to the user (again if errors occurred, pre-filled)
         _LOGGER.info("GreeV2 Config Flow: Showing user form. Errors: %s", errors)
@@ -330,6 +442,135 @@ class GreeV2ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=data_schema, errors=errors
         )
 
+    async def _async_validate_and_create(self, user_input: dict, errors: dict):
+        """Bind to the device in `user_input` and create the entry.
+
+        Shows the user form again with the error if validation fails.
+        """
+        try:
+            # Validate the input by trying to connect and bind
+            info = await validate_input(self.hass, user_input)
+
+            # Set unique ID to prevent duplicate entries
+            await self.async_set_unique_id(info["cleaned_mac"])
+            self._abort_if_unique_id_configured()
+
+            # If validation succeeds, create the entry
+            _LOGGER.info("Validation successful, preparing config entry data.")
+            # Store the version that actually bound, not "auto"
+            if "encryption_version" in info:
+                user_input[CONF_ENCRYPTION_VERSION] = info["encryption_version"]
+
+            # Remove temp sensor key if it's empty or None
+            temp_sensor_value = user_input.get(CONF_TEMP_SENSOR)
+            if not temp_sensor_value: # Checks for None or empty string
+                _LOGGER.debug("External temp sensor is blank, removing key from entry data.")
+                user_input.pop(CONF_TEMP_SENSOR, None) # Remove key if it exists
+            else:
+                _LOGGER.debug("External temp sensor provided: %s", temp_sensor_value)
+
+            _LOGGER.debug("Final data for config entry: %s", user_input)
+            # Pass potentially modified user_input to data
+            return self.async_create_entry(title=info["title"], data=user_input)
+
+        # Reordered except blocks: AbortFlow first
+        except data_entry_flow.AbortFlow as af:  # Use data_entry_flow.AbortFlow
+            _LOGGER.info("Config flow aborted: %s", af.reason)
+            # Re-raise AbortFlow to let HA handle it (shows the abort message)
+            raise af
+        except CannotConnect:
+            errors["base"] = "cannot_connect"
+        except InvalidAuth:
+            errors["base"] = "invalid_auth"
+        except exceptions.HomeAssistantError as e:  # Catch other HA errors
+            _LOGGER.error("Config flow error: %s", e)
+            errors["base"] = "unknown"  # Default for now
+        # Broad exception catch as a fallback for the whole user step
+        except Exception as e: # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception in config flow: %s", e)
+            errors["base"] = "unknown"
+
+        # If errors occurred, schema is pre-filled from user_input
+        _LOGGER.info("GreeV2 Config Flow: Showing user form. Errors: %s", errors)
+        return self.async_show_form(
+            step_id="user", data_schema=get_user_schema(user_input), errors=errors
+        )
+
+    async def async_step_import(self, import_data: dict):
+        """Create an entry for a device bound by the bulk importer.
+
+        `importer.async_import_devices` has already bound to the device and
+        set the detected encryption version.
+        """
+        await self.async_set_unique_id(format_mac(import_data[CONF_MAC]))
+        self._abort_if_unique_id_configured()
+        _LOGGER.debug("Importing device: %s", import_data)
+        return self.async_create_entry(
+            title=import_data.get(CONF_NAME, import_data[CONF_HOST]),
+            data=import_data,
+        )
+
+    async def async_step_sweep(self, user_input=None):
+        """Sweep the entered range, showing progress while probes run."""
+        network = self._user_input[CONF_HOST]
+        started = self._sweep_task is None
+        if started:
+            self._sweep_task = self.hass.async_create_task(
+                async_sweep(network, on_progress=self.async_update_progress)
+            )
+        # Always show progress on the first call, even if the sweep already
+        # finished: progress_done here would pass the user form's input on
+        # to the next step
+        if started or not self._sweep_task.done():
+            return self.async_show_progress(
+                step_id="sweep",
+                progress_action="sweep",
+                description_placeholders={"network": network},
+                progress_task=self._sweep_task,
+            )
+        try:
+            self._discovered = self._sweep_task.result()
+        except OSError as e:
+            _LOGGER.error("Sweep of %s failed: %s", network, e)
+            self._discovered = []
+        finally:
+            self._sweep_task = None
+        if not self._discovered:
+            return self.async_show_progress_done(next_step_id="sweep_empty")
+        return self.async_show_progress_done(next_step_id="pick_device")
+
+    async def async_step_sweep_empty(self, user_input=None):
+        """Abort when the sweep found nothing."""
+        return self.async_abort(reason="no_devices_found")
+
+    async def async_step_pick_device(self, user_input=None):
+        """Let the user pick one of the swept devices, then bind to it."""
+        if user_input is not None:
+            device = next(
+                found for found in self._discovered if found.host == user_input[CONF_HOST]
+            )
+            data = {**self._user_input, CONF_HOST: device.host, CONF_MAC: device.mac}
+            if data.get(CONF_NAME, DEFAULT_NAME) == DEFAULT_NAME:
+                data[CONF_NAME] = device.name
+            return await self._async_validate_and_create(data, {})
+
+        options = [
+            selector.SelectOptionDict(
+                value=found.host, label=f"{found.name} ({found.mac}) at {found.host}"
+            )
+            for found in self._discovered
+        ]
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=options)
+                    )
+                }
+            ),
+        )
+
 
 _LOGGER.info("GreeV2 Config Flow module loaded.")
 
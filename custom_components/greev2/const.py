@@ -24,6 +24,13 @@ DEFAULT_DISABLE_AVAILABILITY_CHECK: bool = (
     False  # Default based on previous YAML schema
 )
 DEFAULT_MAX_ONLINE_ATTEMPTS: int = 3  # Default based on previous YAML schema
+DEFAULT_GROUP_TIMEOUT: float = 5.0  # Deadline for one apply_group fan-out (s)
+DEFAULT_PIPELINED_POLLING: bool = False
+DEFAULT_TEMP_SENSOR_DEADBAND: float = 0.1  # °C an external reading must move
+DEFAULT_TEMP_SENSOR_MIN_INTERVAL: float = 0.0  # Seconds between published readings
+DEFAULT_TEMP_SENSOR_SMOOTHING: float = 0.0  # EMA weight of the old average (0: off)
+DEFAULT_TEMP_SENSOR_AGGREGATE: str = "mean"  # How several room sensors combine
+DEFAULT_TEMP_SENSOR_MAX_AGE: float = 0.0  # Seconds a reading counts (0: forever)
 
 
 # Configuration constants
@@ -55,11 +62,75 @@ CONF_ENCRYPTION_VERSION: str = "encryption_version"
 CONF_DISABLE_AVAILABLE_CHECK: str = "disable_available_check"
 CONF_MAX_ONLINE_ATTEMPTS: str = "max_online_attempts"
 CONF_LIGHT_SENSOR: str = "light_sensor"
+CONF_PIPELINED_POLLING: str = "pipelined_polling"
+CONF_TEMP_SENSOR_DEADBAND: str = "temp_sensor_deadband"
+CONF_TEMP_SENSOR_MIN_INTERVAL: str = "temp_sensor_min_interval"
+CONF_TEMP_SENSOR_SMOOTHING: str = "temp_sensor_smoothing"
+CONF_TEMP_SENSOR_AGGREGATE: str = "temp_sensor_aggregate"
+CONF_TEMP_SENSOR_MAX_AGE: str = "temp_sensor_max_age"
+
+# Ways of combining several external temperature sensors
+TEMP_AGGREGATE_MEAN: str = "mean"
+TEMP_AGGREGATE_MEDIAN: str = "median"
+TEMP_AGGREGATE_MIN: str = "min"
+TEMP_AGGREGATE_MAX: str = "max"
+TEMP_SENSOR_AGGREGATES: List[str] = [
+    TEMP_AGGREGATE_MEAN,
+    TEMP_AGGREGATE_MEDIAN,
+    TEMP_AGGREGATE_MIN,
+    TEMP_AGGREGATE_MAX,
+]
+
+# Services
+SERVICE_APPLY_GROUP: str = "apply_group"
+SERVICE_SET_TRACE_MODE: str = "set_trace_mode"
+SERVICE_IMPORT_DEVICES: str = "import_devices"
+SERVICE_SET_LOOP_WATCHDOG: str = "set_loop_watchdog"
+SERVICE_PROFILE: str = "profile"
+ATTR_ENABLED: str = "enabled"
+ATTR_OPT: str = "opt"
+ATTR_P: str = "p"
+ATTR_TIMEOUT: str = "timeout"
+ATTR_PATH: str = "path"
+ATTR_DURATION: str = "duration"
 
 # Device limits and features
 MIN_TEMP: int = DEFAULT_MIN_TEMP
 MAX_TEMP: int = DEFAULT_MAX_TEMP
 TEMP_OFFSET: int = 40  # Offset used for internal temperature sensor readings
+COLUMN_INDEX_CACHE_SIZE: int = 64  # Column lists mapped to state slots (shared)
+
+# UDP transport
+RECV_BUFFER_SIZE: int = 64000  # Largest datagram accepted from a device
+STATUS_PACKET_CACHE_SIZE: int = 16  # Cached status requests per device
+TRACE_BUFFER_SIZE: int = 50  # Request/response pairs kept for diagnostics
+RECENT_REPLY_WINDOW: int = 8  # Delivered replies remembered to spot duplicates
+PIPELINE_COLUMNS_PER_PACKET: int = 7  # Status columns per packet when pipelined
+
+# Re-bind after the device key changed (reset or re-paired unit)
+REBIND_DECRYPT_FAILURES: int = 2  # Undecryptable replies in a row before re-binding
+REBIND_BACKOFF_MIN: float = 30.0  # Seconds before a failed re-bind is retried
+REBIND_BACKOFF_MAX: float = 900.0  # Backoff cap; it doubles after each failure
+
+# Unicast discovery sweep
+SWEEP_CONCURRENCY: int = 128  # Scan probes outstanding at once
+SWEEP_TIMEOUT: float = 0.5  # Seconds each probe waits for its reply
+SWEEP_MAX_ADDRESSES: int = 1024  # Largest range accepted (a /22)
+
+# Event loop lag watchdog (opt-in, see watchdog.py)
+WATCHDOG_INTERVAL: float = 0.1  # Seconds between heartbeats
+WATCHDOG_STALL_THRESHOLD: float = 0.05  # Heartbeat lateness counted as a stall
+WATCHDOG_TOP_OFFENDERS: int = 10  # Entries shown in diagnostics
+
+# On-demand profiling (see profiler.py)
+DEFAULT_PROFILE_DURATION: float = 30.0  # Seconds profiled by greev2.profile
+
+# Telemetry ring buffer (see telemetry.py)
+TELEMETRY_CAPACITY: int = 1440  # Samples kept per device (24h at the scan interval)
+TELEMETRY_MAX_GAP: float = 180.0  # Longer gaps between samples are not charged
+
+# Bulk import
+IMPORT_CONCURRENCY: int = 32  # Devices binding at once during an import
 
 # Update interval
 SCAN_INTERVAL: timedelta = timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS)
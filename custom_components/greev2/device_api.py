@@ -1,21 +1,59 @@
 """Handles direct communication (UDP) with Gree V2 climate devices."""
 
+import asyncio
 import base64
+import binascii
 import json
 import logging
 import socket
-from typing import Any, Dict, List, Optional, Tuple  # Removed unused Union
+import time
+import zlib
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 # Third-party imports
 from Crypto.Cipher import AES
 
+# Optional fast JSON backends; stdlib json is used when neither is installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None  # type: ignore[assignment]
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
 # Removed incorrect AESCipher import
 
 # Home Assistant imports
 from homeassistant.components.climate import HVACMode  # Corrected import path
 
 # Local imports
-from . import const # Moved import to top
+from . import const
+from .capture import PacketRecorder, ReplayTransport
+from .metrics import (
+    PHASE_BASE64,
+    PHASE_DECRYPT,
+    PHASE_ENCRYPT,
+    PHASE_JSON_BUILD,
+    PHASE_JSON_PARSE,
+    PHASE_SEND,
+    PHASE_WAIT,
+    TransportMetrics,
+)
+from .watchdog import PHASE_DECODE, PHASE_ENCODE, LoopWatchdog
 
 # Simplify CipherType to Any for broader compatibility, or use specific types
 # from Crypto.Cipher.AES import AESCipher # Example if using specific type
@@ -26,6 +64,330 @@ _LOGGER = logging.getLogger(__name__)
 # Import constants - Removed from here
 
 
+class _DecryptError(ValueError):
+    """A reply failed to decrypt or verify, or decrypted to an unparsable pack.
+
+    Only these count towards a re-bind; a corrupt envelope (bad JSON, no
+    `pack`, bad base64) says nothing about the key.
+    """
+
+
+class PackEnvelope(TypedDict, total=False):
+    """Outer (unencrypted) JSON envelope of every datagram."""
+
+    t: str
+    i: int
+    uid: int
+    cid: str
+    tcid: str
+    pack: str
+    tag: str
+
+
+class DevicePack(TypedDict, total=False):
+    """Decrypted inner pack of a device reply (status, command or bind)."""
+
+    t: str
+    mac: str
+    r: int
+    key: str
+    cols: List[str]
+    dat: List[Any]
+    opt: List[str]
+    p: List[Any]
+    val: List[Any]
+
+
+class _StdlibJsonCodec:
+    """JSON codec backed by the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize `obj` to compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def decode_envelope(self, data: memoryview) -> PackEnvelope:
+        """Parse the outer envelope of a received datagram."""
+        envelope: PackEnvelope = json.loads(bytes(data))
+        return envelope
+
+    def decode_pack(self, data: memoryview) -> DevicePack:
+        """Parse a decrypted inner pack."""
+        pack: DevicePack = json.loads(bytes(data))
+        return pack
+
+
+class _OrjsonCodec(_StdlibJsonCodec):
+    """JSON codec backed by orjson, which parses straight from a memoryview."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize `obj` to compact JSON text."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def decode_envelope(self, data: memoryview) -> PackEnvelope:
+        """Parse the outer envelope of a received datagram."""
+        envelope: PackEnvelope = orjson.loads(data)
+        return envelope
+
+    def decode_pack(self, data: memoryview) -> DevicePack:
+        """Parse a decrypted inner pack."""
+        pack: DevicePack = orjson.loads(data)
+        return pack
+
+
+class _MsgspecCodec(_StdlibJsonCodec):
+    """JSON codec backed by msgspec.
+
+    Decoding is untyped, like the other backends: validating against
+    `PackEnvelope`/`DevicePack` would reject replies they accept (a quoted
+    `i` or `r`, a numeric `mac`), so which replies work would depend on
+    what happens to be installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Build the decoder and encoder once."""
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize `obj` to compact JSON text."""
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def decode_envelope(self, data: memoryview) -> PackEnvelope:
+        """Parse the outer envelope of a received datagram."""
+        try:
+            envelope: PackEnvelope = self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Surface as the stdlib error so callers keep a single except clause
+            raise json.JSONDecodeError(str(e), "", 0) from e
+        return envelope
+
+    def decode_pack(self, data: memoryview) -> DevicePack:
+        """Parse a decrypted inner pack."""
+        try:
+            pack: DevicePack = self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+        return pack
+
+
+JsonCodec = Union[_StdlibJsonCodec, _OrjsonCodec, _MsgspecCodec]
+
+
+def available_json_codecs() -> List[str]:
+    """Return the names of the JSON backends importable in this environment."""
+    names: List[str] = []
+    if msgspec is not None:
+        names.append(_MsgspecCodec.name)
+    if orjson is not None:
+        names.append(_OrjsonCodec.name)
+    names.append(_StdlibJsonCodec.name)
+    return names
+
+
+def select_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """Select the JSON backend used for device packets.
+
+    Without a name the fastest available backend is used (msgspec, then
+    orjson, then the standard library). Returns the active codec.
+    """
+    global _CODEC  # pylint: disable=global-statement
+    name = name or available_json_codecs()[0]
+    if name == _OrjsonCodec.name and orjson is not None:
+        _CODEC = _OrjsonCodec()
+    elif name == _MsgspecCodec.name and msgspec is not None:
+        _CODEC = _MsgspecCodec()
+    elif name == _StdlibJsonCodec.name:
+        _CODEC = _StdlibJsonCodec()
+    else:
+        raise ValueError(f"JSON codec '{name}' is not available")
+    _LOGGER.debug("Using %s JSON codec for device packets", _CODEC.name)
+    return _CODEC
+
+
+_CODEC: JsonCodec = _StdlibJsonCodec()
+select_json_codec()
+
+
+class TraceEvent(TypedDict):
+    """Structured record of one request/reply exchange (trace mode)."""
+
+    device: str
+    host: str
+    op: str  # bind / status / cmd
+    bytes_out: int
+    bytes_in: int
+    rtt_ms: Optional[float]  # None if no reply arrived
+    outcome: str  # One of the TRACE_* outcomes
+
+
+TRACE_OK = "ok"
+TRACE_TIMEOUT = "timeout"
+TRACE_SOCKET_ERROR = "socket_error"
+TRACE_DECODE_ERROR = "decode_error"
+
+# Per-exchange trace events go to their own logger, and only when trace mode
+# is on: with it off the exchange path makes no logging calls at all.
+_TRACE_LOGGER = logging.getLogger(f"{__name__}.trace")
+_TRACE_ENABLED = False
+
+
+def set_trace_mode(enabled: bool) -> None:
+    """Turn structured per-exchange trace events on or off."""
+    global _TRACE_ENABLED  # pylint: disable=global-statement
+    _TRACE_ENABLED = enabled
+    # Make the events visible without a separate logger configuration
+    _TRACE_LOGGER.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+    _LOGGER.info("Gree trace mode %s", "enabled" if enabled else "disabled")
+
+
+def trace_mode_enabled() -> bool:
+    """Return True if trace events are being emitted."""
+    return _TRACE_ENABLED
+
+
+# Loop lag watchdog; API phases are only marked while one is installed
+_WATCHDOG: Optional[LoopWatchdog] = None
+
+
+def set_loop_watchdog(watchdog: Optional[LoopWatchdog]) -> None:
+    """Install the watchdog that API calls report their phases to."""
+    global _WATCHDOG  # pylint: disable=global-statement
+    _WATCHDOG = watchdog
+
+
+def loop_watchdog() -> Optional[LoopWatchdog]:
+    """Return the installed loop lag watchdog, if any."""
+    return _WATCHDOG
+
+
+class _BufferPool:
+    """Free-list of fixed-size bytearrays reused across exchanges.
+
+    Shared by every device API so memory is bounded by the number of
+    exchanges in flight rather than the number of configured devices.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty pool handing out buffers of `size` bytes."""
+        self._size = size
+        self._free: List[bytearray] = []
+
+    def acquire(self) -> bytearray:
+        """Return a free buffer, allocating one only if the pool is empty."""
+        if self._free:
+            return self._free.pop()
+        return bytearray(self._size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer to the pool for reuse."""
+        self._free.append(buffer)
+
+
+# Receive and plaintext scratch buffers. A decrypted pack is never larger than
+# the datagram carrying it, so both pools use the same size.
+_RECV_BUFFERS = _BufferPool(const.RECV_BUFFER_SIZE)
+_PLAINTEXT_BUFFERS = _BufferPool(const.RECV_BUFFER_SIZE)
+
+# Inner pack type of the reply to each request type
+REPLY_STATUS = "dat"
+REPLY_COMMAND = "res"
+REPLY_BIND = "bindok"
+
+
+class _StatusOutcome(NamedTuple):
+    """The result of one status request.
+
+    Kept per request rather than on the API, so concurrent requests (see
+    `get_status_pipelined`) each probe on their own reply.
+    """
+
+    values: Optional[List[Any]]
+    truncated_len: Optional[int] = None  # `dat` length of a cut reply
+    rejected: bool = False  # The reply carried no usable `dat`
+
+
+class _PendingRequest:
+    """A request waiting for its reply in the correlation layer.
+
+    A reply matches when its pack type is `reply_type` and its columns
+    (`cols` of a status reply, `opt` of a command reply) equal `columns`.
+    A reply that echoes no columns only matches when it cannot belong to
+    another request (see `matches`). Without a `reply_type` the first reply
+    that decodes is accepted.
+    """
+
+    __slots__ = (
+        "reply",
+        "op",
+        "reply_type",
+        "columns",
+        "nbytes",
+        "_cipher",
+        "_renew_cipher",
+        "_attempts",
+    )
+
+    def __init__(
+        self,
+        reply: "asyncio.Future[DevicePack]",
+        op: str,
+        cipher: CipherType,
+        renew_cipher: Optional[Callable[[], CipherType]],
+        reply_type: Optional[str],
+        columns: Optional[List[str]],
+    ) -> None:
+        """Initialize the request with the cipher for its reply."""
+        self.reply = reply
+        self.op = op  # Labels the request in traces and watchdog stalls
+        self.reply_type = reply_type
+        self.columns = columns
+        self.nbytes = 0  # Length of the datagram that resolved the request
+        self._cipher = cipher
+        self._renew_cipher = renew_cipher
+        self._attempts = 0
+
+    def next_cipher(self) -> CipherType:
+        """Return a cipher for the next decode attempt.
+
+        GCM cipher objects are single-use, so every attempt after the first
+        takes a fresh one from `renew_cipher` when it is given.
+        """
+        cipher = self._cipher
+        if self._attempts and self._renew_cipher is not None:
+            cipher = self._renew_cipher()
+        self._attempts += 1
+        return cipher
+
+    def matches(self, pack: DevicePack, exclusive: bool) -> bool:
+        """Return True if `pack` answers this request.
+
+        `exclusive` says no other request could have received the datagram
+        (it came in on this request's own socket, or nothing else is
+        outstanding); only then is a reply without echoed columns accepted.
+        """
+        if self.reply_type is None:
+            return True
+        if pack.get("t") != self.reply_type:
+            return False
+        if self.columns is None:
+            return True
+        echoed = pack.get("cols" if self.reply_type == REPLY_STATUS else "opt")
+        if echoed is None:
+            return exclusive
+        return echoed == self.columns
+
+
+# Outer envelope of status/command requests, split around the variable parts.
+_ENVELOPE_PREFIX: bytes = b'{"cid":"app","i":0,"pack":"'
+_ENVELOPE_TAG_END: bytes = b'"}'
+
+
 class GreeDeviceApi:
     """Handles communication with a Gree device."""
 
@@ -37,6 +399,23 @@ class GreeDeviceApi:
     _encryption_key: Optional[bytes]
     _encryption_version: int
     _cipher: Optional[CipherType]  # Type hint for the cipher object
+    _envelope_suffix: bytes  # Closes a V1 envelope after the pack
+    _envelope_tag_infix: bytes  # Sits between pack and tag in a V2 envelope
+    _status_packets: Dict[Tuple[Optional[bytes], Tuple[str, ...]], bytes]
+    metrics: TransportMetrics
+    _recorder: Optional[PacketRecorder] = None
+    _transport: Optional[ReplayTransport] = None
+    _pending: List[_PendingRequest]  # Outstanding requests, oldest first
+    _recent_replies: Deque[Tuple[int, int]]  # (length, CRC) of delivered replies
+    # Most columns the device answers in one status request, once probed
+    _column_limit: Optional[int] = None
+    _column_limit_probed: bool = False
+    _status_answered: bool = False  # A status request has succeeded before
+    _decrypt_failures: int = 0  # Replies in a row that failed to decrypt
+    _rebind_not_before: float = 0.0  # time.monotonic() of the next re-bind
+    _rebind_backoff: float = const.REBIND_BACKOFF_MIN
+    # (wall time, op, request, response or error) references, formatted on demand
+    _trace: Deque[Tuple[float, str, Any, Any]]
 
     _is_bound: bool = False
 
@@ -64,6 +443,19 @@ class GreeDeviceApi:
         self._cipher = None
         # self._is_bound initialized earlier
 
+        # Envelope bytes around the encrypted pack only depend on the MAC
+        self._envelope_suffix = (
+            f'","t":"pack","tcid":"{mac}","uid":0}}'.encode("utf-8")
+        )
+        self._envelope_tag_infix = (
+            f'","t":"pack","tcid":"{mac}","uid":0,"tag":"'.encode("utf-8")
+        )
+        self._status_packets = {}
+        self.metrics = TransportMetrics()
+        self._trace = deque(maxlen=const.TRACE_BUFFER_SIZE)
+        self._pending = []
+        self._recent_replies = deque(maxlen=const.RECENT_REPLY_WINDOW)
+
         if self._encryption_key:
             self._is_bound = True  # If a key is provided, assume it's bound
             if self._encryption_version == 1:
@@ -103,7 +495,7 @@ class GreeDeviceApi:
             )
             # Fetch result using generic cipher
             result: Dict[str, Any] = await self._fetch_result(
-                generic_cipher, json_payload_to_send
+                generic_cipher, json_payload_to_send, op="bind", reply_type=REPLY_BIND
             )
             new_key_str: str = result["key"]
             self._encryption_key = new_key_str.encode("utf8")
@@ -153,7 +545,11 @@ class GreeDeviceApi:
             # Get GCM cipher using the generic key for fetching the result
             cipher_gcm: CipherType = self._get_gcm_cipher(generic_gcm_key)
             result: Dict[str, Any] = await self._fetch_result(
-                cipher_gcm, json_payload_to_send
+                cipher_gcm,
+                json_payload_to_send,
+                op="bind",
+                reply_type=REPLY_BIND,
+                renew_cipher=lambda: self._get_gcm_cipher(generic_gcm_key),
             )
             new_key_str: str = result["key"]
             self._encryption_key = new_key_str.encode("utf8")
@@ -207,6 +603,50 @@ class GreeDeviceApi:
 
         return self._is_bound  # Return the final bound state
 
+    @property
+    def needs_rebind(self) -> bool:
+        """Whether the device stopped answering in the current key.
+
+        Timeouts never count; only replies that arrived and failed to
+        decrypt or verify, `REBIND_DECRYPT_FAILURES` times in a row.
+        """
+        return (
+            self._is_bound
+            and self._decrypt_failures >= const.REBIND_DECRYPT_FAILURES
+        )
+
+    async def rebind(self) -> bool:
+        """Bind again to fetch a new device key, rate limited.
+
+        Does nothing until the backoff since the last failed attempt has
+        passed; the backoff doubles after each failure, up to
+        `REBIND_BACKOFF_MAX`. A failed attempt keeps the old key. Returns
+        True if a new key was fetched.
+        """
+        now = time.monotonic()
+        if now < self._rebind_not_before:
+            return False
+        old_key, old_cipher = self._encryption_key, self._cipher
+        self._is_bound = False
+        if await self.bind_and_get_key() and self._encryption_key is not None:
+            self.update_encryption_key(self._encryption_key)
+            self._decrypt_failures = 0
+            self._rebind_backoff = const.REBIND_BACKOFF_MIN
+            self._rebind_not_before = 0.0
+            self.metrics.record_rebind()
+            _LOGGER.warning("Device %s re-bound with a new key", self._mac)
+            return True
+        self._encryption_key, self._cipher = old_key, old_cipher
+        self._is_bound = True
+        self._rebind_not_before = now + self._rebind_backoff
+        _LOGGER.warning(
+            "Re-bind of %s failed, next attempt in %.0fs",
+            self._mac,
+            self._rebind_backoff,
+        )
+        self._rebind_backoff = min(self._rebind_backoff * 2, const.REBIND_BACKOFF_MAX)
+        return False
+
     # Pad helper method to help us get the right string for encrypting
     def _pad(self, s: str) -> str:
         """Pads the string s to a multiple of the AES block size (16)."""
@@ -216,33 +656,299 @@ class GreeDeviceApi:
         )
 
     async def _fetch_result(
-        self, cipher: CipherType, json_payload: str
-    ) -> Dict[str, Any]:
-        """Sends a JSON payload to the device and returns the decrypted response pack."""
-        _LOGGER.debug(
-            "Fetching from %s:%s with timeout %s",
-            self._host,
-            self._port,
-            self._timeout,
-        )
+        self,
+        cipher: CipherType,
+        json_payload: Union[str, bytes],
+        op: str = "fetch",
+        reply_type: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        renew_cipher: Optional[Callable[[], CipherType]] = None,
+    ) -> DevicePack:
+        """Sends a JSON payload to the device and returns the decrypted response pack.
+
+        The request waits in the correlation layer until a reply of
+        `reply_type` for `columns` arrives (see `_PendingRequest`); any other
+        datagram received meanwhile is discarded as stale or duplicate.
+        `renew_cipher` supplies fresh GCM ciphers when more than one reply
+        has to be tried. `op` only labels the exchange in trace events.
+        """
+        if isinstance(json_payload, str):
+            json_payload = json_payload.encode("utf-8")
         # Note: Socket/JSON/Decryption errors are handled by caller or specific except blocks below.
+        loop = asyncio.get_running_loop()
+        recv_buffer = _RECV_BUFFERS.acquire()
+        metrics = self.metrics
+        pending = _PendingRequest(
+            loop.create_future(), op, cipher, renew_cipher, reply_type, columns
+        )
+        self._pending.append(pending)
+        outcome = TRACE_TIMEOUT
+        rtt: Optional[float] = None
+        try:
+            metrics.record_sent(len(json_payload))
+            sent_at = loop.time()
+            try:
+                await asyncio.wait_for(
+                    self._exchange(json_payload, recv_buffer, pending),
+                    self._timeout,
+                )
+            except asyncio.TimeoutError:
+                metrics.record_timeout()
+                if self._recorder is not None:
+                    self._recorder.record(json_payload, None, 0.0)
+                raise
+            except OSError:
+                outcome = TRACE_SOCKET_ERROR
+                metrics.record_socket_error()
+                raise
+            rtt = loop.time() - sent_at
+            metrics.record_received(pending.nbytes, rtt)
+            try:
+                pack = pending.reply.result()
+            except (ValueError, KeyError, TypeError) as e:
+                outcome = TRACE_DECODE_ERROR
+                if isinstance(e, _DecryptError):
+                    self._decrypt_failures += 1
+                raise
+            outcome = TRACE_OK
+            self._decrypt_failures = 0
+            return pack
+        finally:
+            self._pending.remove(pending)
+            _RECV_BUFFERS.release(recv_buffer)
+            if _TRACE_ENABLED:
+                self._emit_trace(op, len(json_payload), pending.nbytes, rtt, outcome)
+
+    def _dispatch_reply(
+        self, datagram: memoryview, owner: Optional[_PendingRequest] = None
+    ) -> None:
+        """Hands a received datagram to the outstanding request it answers.
+
+        A datagram that arrived on a request's own socket (`owner`) can only
+        answer that request; otherwise, as from the replay transport's
+        shared socket, requests are tried oldest first. A datagram no request
+        can decode
+        fails the oldest one, as a lone request always did; a decodable one
+        that answers nothing is counted as a duplicate if it repeats a
+        recently delivered reply and as stale otherwise, then dropped.
+        Identical requests get byte-identical replies (both ciphers are
+        deterministic here), so a duplicate that arrives while an identical
+        request is outstanding is simply delivered to it.
+        """
+        error: Optional[Exception] = None
+        decoded = False
+        watchdog = _WATCHDOG
+        if owner is not None:
+            candidates = [owner] if not owner.reply.done() else []
+        else:
+            candidates = [p for p in self._pending if not p.reply.done()]
+        exclusive = len(candidates) == 1
+        fingerprint = (len(datagram), zlib.crc32(datagram))
+        for pending in candidates:
+            if watchdog is not None:
+                stall_key = watchdog.enter(self._mac, pending.op, PHASE_DECODE)
+            try:
+                pack = self._decode_response(pending.next_cipher(), datagram)
+            except (ValueError, KeyError, TypeError) as e:
+                error = e
+                continue
+            finally:
+                if watchdog is not None:
+                    watchdog.exit(stall_key)
+            decoded = True
+            if pending.matches(pack, exclusive):
+                pending.nbytes = len(datagram)
+                self._recent_replies.append(fingerprint)
+                pending.reply.set_result(pack)
+                return
+
+        if error is not None and not decoded:
+            if isinstance(error, _DecryptError):
+                self.metrics.record_decrypt_failure()
+            else:
+                self.metrics.record_malformed_reply()
+            pending = candidates[0]
+            pending.nbytes = len(datagram)
+            pending.reply.set_exception(error)
+            return
+        if fingerprint in self._recent_replies:
+            self.metrics.record_duplicate_reply()
+        else:
+            self.metrics.record_stale_reply()
+
+    def _emit_trace(
+        self,
+        op: str,
+        bytes_out: int,
+        bytes_in: int,
+        rtt: Optional[float],
+        outcome: str,
+    ) -> None:
+        """Log one structured trace event for a finished exchange."""
+        event: TraceEvent = {
+            "device": self._mac,
+            "host": self._host,
+            "op": op,
+            "bytes_out": bytes_out,
+            "bytes_in": bytes_in,
+            "rtt_ms": None if rtt is None else round(rtt * 1000.0, 2),
+            "outcome": outcome,
+        }
+        _TRACE_LOGGER.debug(
+            "%(device)s %(op)s out=%(bytes_out)d in=%(bytes_in)d "
+            "rtt=%(rtt_ms)sms %(outcome)s",
+            event,
+            extra={"gree_trace": event},
+        )
+
+    async def _exchange(
+        self,
+        json_payload: bytes,
+        recv_buffer: bytearray,
+        pending: _PendingRequest,
+    ) -> None:
+        """Sends one datagram and receives until `pending` is resolved.
+
+        Every datagram received goes through `_dispatch_reply`. A live
+        exchange has its own socket, so its datagrams only answer `pending`;
+        the replay transport is one shared socket, so a datagram may resolve
+        another outstanding request. Uses the replay transport when one is
+        set. While capturing, every datagram received is recorded, stale and
+        duplicate ones included, with the time waited for it.
+        """
+        reply = pending.reply
+        phases = self.metrics.phases
+        transport = self._transport
+        recorder = self._recorder
+        if transport is not None:
+            started = time.perf_counter_ns()
+            transport.send(json_payload)
+            waiting = time.perf_counter_ns()
+            phases.record(PHASE_SEND, waiting - started)
+            while not reply.done():
+                try:
+                    nbytes = await transport.receive(recv_buffer, self._timeout)
+                except asyncio.TimeoutError:
+                    if reply.done():  # Answered while this receive waited
+                        return
+                    raise
+                received = time.perf_counter_ns()
+                phases.record(PHASE_WAIT, received - waiting)
+                if recorder is not None:
+                    recorder.record(
+                        json_payload,
+                        bytes(recv_buffer[:nbytes]),
+                        (received - waiting) / 1e9,
+                    )
+                with memoryview(recv_buffer) as datagram:
+                    self._dispatch_reply(datagram[:nbytes])
+                waiting = time.perf_counter_ns()
+            return
+        loop = asyncio.get_running_loop()
         client_sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        client_sock.settimeout(self._timeout)
-        data: bytes = b""
+        client_sock.setblocking(False)
         try:
-            client_sock.sendto(bytes(json_payload, "utf-8"), (self._host, self._port))
-            data, _ = client_sock.recvfrom(64000)
+            started = time.perf_counter_ns()
+            await loop.sock_sendto(client_sock, json_payload, (self._host, self._port))
+            waiting = time.perf_counter_ns()
+            phases.record(PHASE_SEND, waiting - started)
+            while not reply.done():
+                nbytes, address = await loop.sock_recvfrom_into(
+                    client_sock, recv_buffer
+                )
+                received = time.perf_counter_ns()
+                phases.record(PHASE_WAIT, received - waiting)
+                if address[0] != self._host:
+                    waiting = received
+                    self.metrics.record_stale_reply()
+                    continue
+                if recorder is not None:
+                    recorder.record(
+                        json_payload,
+                        bytes(recv_buffer[:nbytes]),
+                        (received - waiting) / 1e9,
+                    )
+                with memoryview(recv_buffer) as datagram:
+                    self._dispatch_reply(datagram[:nbytes], pending)
+                waiting = time.perf_counter_ns()
         finally:
             client_sock.close()
 
-        received_json: Dict[str, Any] = json.loads(data)
-        pack: str = received_json["pack"]
-        base64decoded_pack: bytes = base64.b64decode(pack)
+    def start_capture(self) -> PacketRecorder:
+        """Start recording every raw datagram sent and received, with timing."""
+        self._recorder = PacketRecorder()
+        return self._recorder
+
+    def stop_capture(self) -> Optional[PacketRecorder]:
+        """Stop recording and return the recorder, if one was running."""
+        recorder, self._recorder = self._recorder, None
+        return recorder
+
+    def set_transport(self, transport: Optional[ReplayTransport]) -> None:
+        """Route exchanges through a replay transport (None for the network)."""
+        self._transport = transport
+
+    def _decode_response(
+        self, cipher: CipherType, datagram: memoryview
+    ) -> DevicePack:
+        """Decrypts a received datagram and returns the inner JSON pack.
+
+        The ciphertext is decrypted into a pooled scratch buffer and the
+        trailing padding is cut off by slicing up to the last closing brace,
+        so no intermediate strings are built on the way to the JSON parser.
+        Raises _DecryptError if verification or the decrypted pack's parse
+        fails, and other ValueError/KeyError/TypeError for a bad envelope.
+        """
+        phases = self.metrics.phases
+        started = time.perf_counter_ns()
+        received_json: PackEnvelope = _CODEC.decode_envelope(datagram)
+        parsed = time.perf_counter_ns()
+        ciphertext: bytes = binascii.a2b_base64(received_json["pack"])
+        ciphertext_len: int = len(ciphertext)
+        decoded = time.perf_counter_ns()
+        phases.record(PHASE_BASE64, decoded - parsed)
+
+        plain_buffer = _PLAINTEXT_BUFFERS.acquire()
+        try:
+            with memoryview(plain_buffer) as plain_view:
+                plaintext = plain_view[:ciphertext_len]
+                self._decrypt_into(cipher, received_json, ciphertext, plaintext)
+                decrypted = time.perf_counter_ns()
+                phases.record(PHASE_DECRYPT, decrypted - decoded)
+                # Strip padding/trailing characters after the last '}'
+                last_brace_index: int = plain_buffer.rfind(b"}", 0, ciphertext_len)
+                if last_brace_index == -1:
+                    # Handle case where '}' is not found, though unlikely for valid JSON
+                    last_brace_index = ciphertext_len - 1
+                try:
+                    loaded_json_pack: DevicePack = _CODEC.decode_pack(
+                        plaintext[: last_brace_index + 1]
+                    )
+                except (ValueError, TypeError) as e:
+                    # V1 has no tag: a wrong key only shows up as garbage here
+                    raise _DecryptError(f"Undecodable pack: {e}") from e
+                # Envelope and pack parsing together
+                phases.record(
+                    PHASE_JSON_PARSE,
+                    parsed - started + time.perf_counter_ns() - decrypted,
+                )
+        finally:
+            _PLAINTEXT_BUFFERS.release(plain_buffer)
+        return loaded_json_pack
 
-        # Decryption logic
-        decrypted_pack: bytes = b""
+    def _decrypt_into(
+        self,
+        cipher: CipherType,
+        received_json: PackEnvelope,
+        ciphertext: bytes,
+        output: memoryview,
+    ) -> None:
+        """Decrypts `ciphertext` into the preallocated `output` view."""
         if self._encryption_version == 1:
-            # Use the stored ECB cipher
+            # The generic ECB cipher while binding, the device one afterwards
+            if cipher is not None:
+                cipher.decrypt(ciphertext, output=output)
+                return
             if not self._cipher:
                 # This assumes the key/cipher was set via GetDeviceKey previously
                 _LOGGER.error("ECB Cipher not initialized for V1 encryption!")
@@ -255,49 +961,28 @@ class GreeDeviceApi:
                     # Cannot proceed without key/cipher
                     raise ValueError("Cannot decrypt V1 data: key/cipher missing.")
             # Assuming self._cipher is EcbMode or compatible
-            decrypted_pack = self._cipher.decrypt(base64decoded_pack)
+            self._cipher.decrypt(ciphertext, output=output)
         elif self._encryption_version == 2:
             # Need the GCM cipher passed in (which is the 'cipher' argument).
             # This cipher was created using the appropriate key (generic key for binding,
             # or the device key for subsequent commands/status).
             # Do NOT check self._encryption_key here, as it might be None during binding.
-            # For now, assume the passed 'cipher' arg IS the correct GCM cipher for decrypt
-            tag_b64: str = received_json["tag"]
-            tag: bytes = base64.b64decode(tag_b64)
+            tag: bytes = binascii.a2b_base64(received_json["tag"])
             # Explicitly try the decryption/verification step
             try:
-                _LOGGER.debug("Attempting GCM decrypt_and_verify...")
                 # Assuming cipher is GcmMode or compatible
-                decrypted_pack = cipher.decrypt_and_verify(base64decoded_pack, tag)
-                _LOGGER.debug("GCM decrypt_and_verify successful.")
+                cipher.decrypt_and_verify(ciphertext, tag, output=output)
             except ValueError as e:
                 _LOGGER.error(
                     "GCM decryption/verification failed: %s", e, exc_info=True
                 )
-                # Re-raise the error to be caught by the caller (_fetch_result's caller)
-                raise  # Re-raise the ValueError
+                # Caught by the caller (_fetch_result's caller)
+                raise _DecryptError(str(e)) from e
         else:
             raise ValueError(
                 f"Unsupported encryption version: {self._encryption_version}"
             )
 
-        # Decode and remove padding/trailing characters
-        decoded_pack: str = decrypted_pack.decode("utf-8")
-        # This stripping logic might be fragile, needs review
-        # Find the last '}' and strip everything after it
-        last_brace_index: int = decoded_pack.rfind("}")
-        if last_brace_index != -1:
-            replaced_pack: str = decoded_pack[: last_brace_index + 1]
-        else:
-            # Handle case where '}' is not found, though unlikely for valid JSON
-            replaced_pack = decoded_pack
-
-        # Remove potential padding characters like \x0f more robustly if needed
-        # replaced_pack = replaced_pack.rstrip('\x0f') # Example if needed
-
-        loaded_json_pack: Dict[str, Any] = json.loads(replaced_pack)
-        return loaded_json_pack
-
     def _get_gcm_cipher(
         self, key: bytes
     ) -> CipherType:  # Return type depends on fallback
@@ -309,24 +994,118 @@ class GreeDeviceApi:
 
     def _encrypt_gcm(self, key: bytes, plaintext: str) -> Tuple[str, str]:
         """Encrypts plaintext using GCM and returns base64 encoded pack and tag."""
+        phases = self.metrics.phases
+        started = time.perf_counter_ns()
         cipher: CipherType = self._get_gcm_cipher(key)
         # AES.encrypt_and_digest is part of the cipher object protocol
         encrypted_data, tag = cipher.encrypt_and_digest(plaintext.encode("utf8"))
+        encrypted_at = time.perf_counter_ns()
+        phases.record(PHASE_ENCRYPT, encrypted_at - started)
         pack_b64: str = base64.b64encode(encrypted_data).decode("utf-8")
         tag_b64: str = base64.b64encode(tag).decode("utf-8")
+        phases.record(PHASE_BASE64, time.perf_counter_ns() - encrypted_at)
         return (pack_b64, tag_b64)
 
+    def _encrypt_request(self, plaintext: str, action: str) -> Optional[bytes]:
+        """Encrypts an inner JSON pack and wraps it in the outer request envelope."""
+        if self._encryption_version == 1:
+            if not self._cipher:
+                _LOGGER.error("Cannot %s: V1 ECB cipher not initialized.", action)
+                return None
+            phases = self.metrics.phases
+            started = time.perf_counter_ns()
+            padded_state: bytes = self._pad(plaintext).encode("utf8")
+            encrypted: bytes = self._cipher.encrypt(padded_state)
+            encrypted_at = time.perf_counter_ns()
+            phases.record(PHASE_ENCRYPT, encrypted_at - started)
+            encrypted_pack: bytes = base64.b64encode(encrypted)
+            phases.record(PHASE_BASE64, time.perf_counter_ns() - encrypted_at)
+            return b"".join((_ENVELOPE_PREFIX, encrypted_pack, self._envelope_suffix))
+
+        if self._encryption_version == 2:
+            if not self._encryption_key:
+                _LOGGER.error("Cannot %s: V2 encryption key missing.", action)
+                return None
+            pack, tag = self._encrypt_gcm(self._encryption_key, plaintext)
+            return b"".join(
+                (
+                    _ENVELOPE_PREFIX,
+                    pack.encode("utf-8"),
+                    self._envelope_tag_infix,
+                    tag.encode("utf-8"),
+                    _ENVELOPE_TAG_END,
+                )
+            )
+
+        _LOGGER.error(
+            "Unsupported encryption version: %s. Cannot %s.",
+            self._encryption_version,
+            action,
+        )
+        return None
+
+    def _response_cipher(self) -> CipherType:
+        """Returns the cipher used to decrypt the reply to a request."""
+        if self._encryption_version == 1:
+            return self._cipher
+        # GCM cipher objects are single-use, so every exchange needs a fresh one
+        return self._get_gcm_cipher(self._encryption_key)
+
+    def _renew_response_cipher(self) -> Optional[Callable[[], CipherType]]:
+        """Returns the factory for fresh reply ciphers (V2 only)."""
+        if self._encryption_version == 1:
+            return None  # The ECB cipher is reusable
+        return self._response_cipher
+
+    def _status_request(self, property_names: List[str]) -> Optional[bytes]:
+        """Returns the encrypted status request packet for a column list.
+
+        Both encryption modes are deterministic for this protocol (ECB, and GCM
+        with the fixed protocol nonce), so the packet for a given key and column
+        list never changes and can be cached instead of rebuilt on every poll.
+        """
+        cache_key = (self._encryption_key, tuple(property_names))
+        packet = self._status_packets.get(cache_key)
+        if packet is not None:
+            return packet
+
+        # Construct the inner JSON status request payload
+        started = time.perf_counter_ns()
+        try:
+            cols_json: str = json.dumps(property_names)
+        except TypeError as e:
+            _LOGGER.error("Error serializing property names to JSON: %s", e)
+            return None
+        plaintext_payload: str = (
+            f'{{"cols":{cols_json},"mac":"{self._mac}","t":"status"}}'
+        )
+        self.metrics.phases.record(PHASE_JSON_BUILD, time.perf_counter_ns() - started)
+
+        packet = self._encrypt_request(plaintext_payload, "get status")
+        if packet is not None:
+            if len(self._status_packets) >= const.STATUS_PACKET_CACHE_SIZE:
+                self._status_packets.clear()
+            self._status_packets[cache_key] = packet
+        return packet
+
     # Add methods for binding, sending commands, receiving status, etc.
     async def send_command(
         self, opt_keys: List[str], p_values: List[Any]
     ) -> Optional[Dict[str, Any]]:
         """Sends a command packet to the device."""
+        response = await self._send_command(opt_keys, p_values)
+        if response is None:
+            self.metrics.command_failures += 1
+        return response
+
+    async def _send_command(
+        self, opt_keys: List[str], p_values: List[Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Builds, sends and awaits one command packet."""
         if not self._is_bound:
             _LOGGER.error("Cannot send command: API is not bound (key missing).")
             return None
 
-        _LOGGER.debug("Preparing to send command with opt=%s, p=%s", opt_keys, p_values)
-
         # Build the command payload dictionary
         if len(opt_keys) != len(p_values):
             _LOGGER.error(
@@ -369,70 +1148,40 @@ class GreeDeviceApi:
             "t": "cmd",
         }
 
-        # Construct the inner JSON command payload string using json
+        # Construct the inner JSON command payload string
+        started = time.perf_counter_ns()
         try:
-            state_pack_json: str = json.dumps(command_payload, separators=(",", ":"))
+            state_pack_json: str = _CODEC.dumps(command_payload)
         except TypeError as e:
             _LOGGER.error("Error serializing command payload to JSON: %s", e)
             return None
+        self.metrics.phases.record(PHASE_JSON_BUILD, time.perf_counter_ns() - started)
 
-        _LOGGER.debug("Constructed state_pack_json: %s", state_pack_json)
-
-        sent_json_payload: Optional[str] = None
-        cipher_for_fetch: Optional[CipherType] = None  # Cipher needed for _fetch_result
-
-        if self._encryption_version == 1:
-            if not self._cipher:
-                _LOGGER.error("Cannot send V1 command: ECB cipher not initialized.")
-                # Potentially try to bind/get key first? Or just fail.
-                return None  # Or raise exception
-            cipher_for_fetch = self._cipher  # Use the instance's ECB cipher
-
-            padded_state: bytes = self._pad(state_pack_json).encode("utf8")
-            encrypted_pack_bytes: bytes = cipher_for_fetch.encrypt(padded_state)
-            encrypted_pack: str = base64.b64encode(encrypted_pack_bytes).decode("utf-8")
-
-            sent_json_payload = (
-                f'{{"cid":"app","i":0,"pack":"{encrypted_pack}",'
-                f'"t":"pack","tcid":"{self._mac}",'
-                f'"uid":0}}'  # Assuming uid 0 for commands, confirm if needed
-            )
-
-        elif self._encryption_version == 2:
-            if not self._encryption_key:
-                _LOGGER.error("Cannot send V2 command: Encryption key missing.")
-                # Potentially try to bind/get key first? Or just fail.
-                return None  # Or raise exception
-
-            # Encrypt using the instance's key
-            pack, tag = self._encrypt_gcm(self._encryption_key, state_pack_json)
-
-            # Get the GCM cipher instance required for decrypting the response in _fetch_result
-            cipher_for_fetch = self._get_gcm_cipher(self._encryption_key)
-
-            sent_json_payload = (
-                f'{{"cid":"app","i":0,"pack":"{pack}",'
-                f'"t":"pack","tcid":"{self._mac}",'
-                f'"uid":0,"tag":"{tag}"}}'  # Assuming uid 0 for commands, confirm if needed
-            )
-        else:
-            _LOGGER.error(
-                "Unsupported encryption version: %s. Cannot send command.",
-                self._encryption_version,
-            )
-            return None  # Or raise an exception
-
-        if sent_json_payload is None or cipher_for_fetch is None:
-            _LOGGER.error("Failed to prepare command payload or cipher.")
-            return None  # Should have been caught earlier, but safety check
+        watchdog = _WATCHDOG
+        if watchdog is not None:
+            stall_key = watchdog.enter(self._mac, "cmd", PHASE_ENCODE)
+        sent_json_payload: Optional[bytes] = self._encrypt_request(
+            state_pack_json, "send command"
+        )
+        if watchdog is not None:
+            watchdog.exit(stall_key)
+        if sent_json_payload is None:
+            return None
+        cipher_for_fetch: CipherType = self._response_cipher()
 
         try:
             # Call the internal fetch method
-            _LOGGER.debug("Sending payload: %s", sent_json_payload)
             received_json_pack: Dict[str, Any] = await self._fetch_result(
-                cipher_for_fetch, sent_json_payload
+                cipher_for_fetch,
+                sent_json_payload,
+                op="cmd",
+                reply_type=REPLY_COMMAND,
+                columns=opt_keys,
+                renew_cipher=self._renew_response_cipher(),
+            )
+            self._trace.append(
+                (time.time(), "cmd", command_payload, received_json_pack)
             )
-            _LOGGER.debug("Received response pack: %s", received_json_pack)
             return received_json_pack
         except (
             socket.timeout,
@@ -440,6 +1189,7 @@ class GreeDeviceApi:
             ConnectionError,
         ) as e:  # FIX: Catch specific socket/connection errors
             _LOGGER.error("Socket/Connection error sending command: %s", e)
+            self._trace.append((time.time(), "cmd", command_payload, e))
             return None
         except (
             json.JSONDecodeError,
@@ -448,85 +1198,165 @@ class GreeDeviceApi:
             TypeError,
         ) as e:  # FIX: Catch specific data processing errors
             _LOGGER.error("Error processing response after sending command: %s", e)
+            self._trace.append((time.time(), "cmd", command_payload, e))
             return None
         # FIX: Removed broad Exception catch
 
     async def get_status(
         self, property_names: List[str]
     ) -> Optional[List[Any]]:  # Changed return type hint
-        """Fetches the status of specified properties from the device."""
-        if not self._is_bound:
-            _LOGGER.error("Cannot get status: API is not bound (key missing).")
-            return None
+        """Fetches the status of specified properties from the device.
 
-        _LOGGER.debug("Preparing to get status for properties: %s", property_names)
-
-        # Construct the inner JSON status request payload
-        try:
-            cols_json: str = json.dumps(property_names)
-        except TypeError as e:
-            _LOGGER.error("Error serializing property names to JSON: %s", e)
-            return None
-
-        plaintext_payload: str = (
-            f'{{"cols":{cols_json},"mac":"{self._mac}","t":"status"}}'
-        )
-
-        sent_json_payload: Optional[str] = None
-        cipher_for_fetch: Optional[CipherType] = None  # Cipher needed for _fetch_result
-
-        if self._encryption_version == 1:
-            if not self._cipher:
-                _LOGGER.error("Cannot get V1 status: ECB cipher not initialized.")
-                return None  # Or raise exception
-            cipher_for_fetch = self._cipher
-
-            padded_state: bytes = self._pad(plaintext_payload).encode("utf8")
-            encrypted_pack_bytes: bytes = cipher_for_fetch.encrypt(padded_state)
-            encrypted_pack: str = base64.b64encode(encrypted_pack_bytes).decode("utf-8")
-
-            sent_json_payload = (
-                f'{{"cid":"app","i":0,"pack":"{encrypted_pack}",'
-                f'"t":"pack","tcid":"{self._mac}",'
-                f'"uid":0}}'  # Assuming uid 0 for status, confirm if needed
+        Requests longer than the device's column limit are split and the
+        replies merged. The limit is probed once, the first time a reply
+        comes back truncated, or without usable `dat` from a device that
+        answered before (see `probe_column_limit`). Timeouts never trigger
+        a probe.
+        """
+        limit = self._column_limit
+        if limit is not None and len(property_names) > limit:
+            status_list = await self._get_status_split(property_names, limit)
+        else:
+            outcome = await self._status_exchange(property_names)
+            status_list = outcome.values
+            if status_list is None and self._should_probe(property_names, outcome):
+                limit = await self.probe_column_limit(
+                    property_names, outcome.truncated_len
+                )
+                if limit is not None and limit < len(property_names):
+                    status_list = await self._get_status_split(property_names, limit)
+        if status_list is None:
+            self.metrics.status_failures += 1
+        return status_list
+
+    @property
+    def column_limit(self) -> Optional[int]:
+        """Return the learned column limit per status request, if any."""
+        return self._column_limit
+
+    def _should_probe(
+        self, property_names: List[str], outcome: _StatusOutcome
+    ) -> bool:
+        """Return True if a failed status request warrants a limit probe."""
+        return (
+            not self._column_limit_probed
+            and len(property_names) > 1
+            and (
+                outcome.truncated_len is not None
+                or (outcome.rejected and self._status_answered)
             )
+        )
 
-        elif self._encryption_version == 2:
-            if not self._encryption_key:
-                _LOGGER.error("Cannot get V2 status: Encryption key missing.")
-                return None  # Or raise exception
-
-            # Encrypt using the instance's key
-            pack, tag = self._encrypt_gcm(self._encryption_key, plaintext_payload)
+    async def probe_column_limit(
+        self, property_names: List[str], truncated_len: Optional[int] = None
+    ) -> Optional[int]:
+        """Finds the most columns the device answers in one status request.
+
+        Tries the cap first (`truncated_len`, the length of a truncated
+        reply, or one less than the failed request), then binary-searches
+        prefixes of
+        `property_names` below it. Runs once per API instance; the result
+        is cached as `column_limit`. Returns None if not even a single
+        column is answered.
+        """
+        self._column_limit_probed = True
+        high = len(property_names) - 1  # The full request just failed
+        if truncated_len is not None:
+            high = min(high, truncated_len)
+        low = 0  # Largest prefix known to be answered in full
+        size = high
+        while low < high:
+            if await self._get_status(property_names[:size]) is not None:
+                low = size
+            else:
+                high = size - 1
+            size = (low + high + 1) // 2
+        if not low:
+            _LOGGER.warning("Could not determine the column limit of %s", self._mac)
+            return None
+        self._column_limit = low
+        _LOGGER.info("Device %s answers at most %d columns per request", self._mac, low)
+        return low
+
+    async def _get_status_split(
+        self, property_names: List[str], limit: int
+    ) -> Optional[List[Any]]:
+        """Fetches the columns in requests of at most `limit` and merges them."""
+        merged: List[Any] = []
+        for start in range(0, len(property_names), limit):
+            values = await self._get_status(property_names[start : start + limit])
+            if values is None:
+                return None
+            merged.extend(values)
+        return merged
 
-            # Get the GCM cipher instance required for decrypting the response
-            cipher_for_fetch = self._get_gcm_cipher(self._encryption_key)
+    async def get_status_pipelined(
+        self,
+        property_names: List[str],
+        columns_per_packet: int,
+        on_reply: Optional[Callable[[List[str], List[Any]], None]] = None,
+    ) -> Optional[List[Any]]:
+        """Fetches columns in groups sent as parallel packets.
+
+        All groups are in flight at once and the correlation layer routes
+        each reply to its group, so the poll takes one round trip however
+        the columns are split. `on_reply` gets each group's columns and
+        values as soon as they land. Returns the values in `property_names`
+        order, or None if any group failed.
+        """
+        if self._column_limit is not None:
+            columns_per_packet = min(columns_per_packet, self._column_limit)
+        groups = [
+            property_names[start : start + columns_per_packet]
+            for start in range(0, len(property_names), columns_per_packet)
+        ]
+
+        async def _fetch_group(columns: List[str]) -> Optional[List[Any]]:
+            values = await self.get_status(columns)
+            if values is not None and on_reply is not None:
+                on_reply(columns, values)
+            return values
+
+        results = await asyncio.gather(*(_fetch_group(group) for group in groups))
+        if any(values is None for values in results):
+            return None
+        return [value for values in results for value in values]
 
-            sent_json_payload = (
-                f'{{"cid":"app","i":0,"pack":"{pack}",'
-                f'"t":"pack","tcid":"{self._mac}",'
-                f'"uid":0,"tag":"{tag}"}}'  # Assuming uid 0 for status, confirm if needed
-            )
-        else:
-            _LOGGER.error(
-                "Unsupported encryption version: %s. Cannot get status.",
-                self._encryption_version,
-            )
-            return None  # Or raise an exception
+    async def _get_status(self, property_names: List[str]) -> Optional[List[Any]]:
+        """Sends one status request and returns the `dat` values."""
+        return (await self._status_exchange(property_names)).values
 
-        if sent_json_payload is None or cipher_for_fetch is None:
-            _LOGGER.error("Failed to prepare status request payload or cipher.")
-            return None  # Should have been caught earlier, but safety check
+    async def _status_exchange(self, property_names: List[str]) -> _StatusOutcome:
+        """Sends one status request and returns its outcome."""
+        if not self._is_bound:
+            _LOGGER.error("Cannot get status: API is not bound (key missing).")
+            return _StatusOutcome(None)
+
+        watchdog = _WATCHDOG
+        if watchdog is not None:
+            stall_key = watchdog.enter(self._mac, "status", PHASE_ENCODE)
+        sent_json_payload: Optional[bytes] = self._status_request(property_names)
+        if watchdog is not None:
+            watchdog.exit(stall_key)
+        if sent_json_payload is None:
+            return _StatusOutcome(None)
+        cipher_for_fetch: CipherType = self._response_cipher()
 
         try:
             # Call the internal fetch method
-            _LOGGER.debug("Sending status request payload: %s", sent_json_payload)
             received_json_pack: Dict[str, Any] = (
                 await self._fetch_result(  # <<< Added await here
-                    cipher_for_fetch, sent_json_payload
+                    cipher_for_fetch,
+                    sent_json_payload,
+                    op="status",
+                    reply_type=REPLY_STATUS,
+                    columns=property_names,
+                    renew_cipher=self._renew_response_cipher(),
                 )
             )
-            _LOGGER.debug("Received status response pack: %s", received_json_pack)
+            self._trace.append(
+                (time.time(), "status", property_names, received_json_pack)
+            )
 
             # Extract the 'dat' field which should contain the list of status values
             if "dat" in received_json_pack and isinstance(
@@ -535,7 +1365,16 @@ class GreeDeviceApi:
                 status_list: List[Any] = received_json_pack["dat"]
                 # Optional: Validate list length against requested property_names length
                 if len(status_list) == len(property_names):
-                    return status_list
+                    self._status_answered = True
+                    return _StatusOutcome(status_list)
+                if 0 < len(status_list) < len(property_names):
+                    # Firmware cut the cols list short; get_status re-splits
+                    _LOGGER.warning(
+                        "Status reply truncated to %d of %d columns",
+                        len(status_list),
+                        len(property_names),
+                    )
+                    return _StatusOutcome(None, truncated_len=len(status_list))
                 else:
                     _LOGGER.error(
                         "Status response list length mismatch. Expected %d, got %d: %s",
@@ -543,25 +1382,26 @@ class GreeDeviceApi:
                         len(status_list),
                         status_list,
                     )
-                    return None  # Length mismatch
+                    return _StatusOutcome(None)  # Length mismatch
             elif "dat" not in received_json_pack:
                 _LOGGER.error(
                     "'dat' field missing from status response: %s", received_json_pack
                 )
-                return None
+                return _StatusOutcome(None, rejected=True)
             else:  # 'dat' exists but is not a list
                 _LOGGER.error(
                     "'dat' field in status response is not a list: %s",
                     received_json_pack["dat"],
                 )
-                return None
+                return _StatusOutcome(None, rejected=True)
         except (
             socket.timeout,
             socket.error,
             ConnectionError,
         ) as e:  # FIX: Catch specific socket/connection errors
             _LOGGER.error("Socket/Connection error getting status: %s", e)
-            return None
+            self._trace.append((time.time(), "status", property_names, e))
+            return _StatusOutcome(None)
         except (
             json.JSONDecodeError,
             ValueError,
@@ -569,9 +1409,31 @@ class GreeDeviceApi:
             TypeError,
         ) as e:  # FIX: Catch specific data processing errors
             _LOGGER.error("Error processing response after getting status: %s", e)
-            return None
+            self._trace.append((time.time(), "status", property_names, e))
+            return _StatusOutcome(None)
         # FIX: Removed broad Exception catch
 
+    def trace(self) -> List[Dict[str, Any]]:
+        """Return the recent request/response pairs, oldest first.
+
+        The ring buffer only holds references to objects the exchange built
+        anyway; they are turned into dictionaries here, when diagnostics are
+        downloaded, not on the hot path.
+        """
+        entries: List[Dict[str, Any]] = []
+        for timestamp, op, request, response in list(self._trace):
+            entry: Dict[str, Any] = {"time": timestamp, "op": op}
+            if op == "status":
+                entry["request"] = {"t": "status", "cols": list(request)}
+            else:
+                entry["request"] = dict(request)
+            if isinstance(response, Exception):
+                entry["error"] = repr(response)
+            else:
+                entry["response"] = {k: v for k, v in response.items() if k != "key"}
+            entries.append(entry)
+        return entries
+
     # Method definition should be at class level indentation
     def update_encryption_key(self, new_key: bytes) -> None:
         """
@@ -583,6 +1445,7 @@ class GreeDeviceApi:
         """
         _LOGGER.debug("Updating internal API encryption key.")
         self._encryption_key = new_key
+        self._status_packets.clear()
 
         # If using V1 (ECB), the cipher instance depends on the key, so recreate it.
         if self._encryption_version == 1:
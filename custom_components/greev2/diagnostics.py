@@ -0,0 +1,56 @@
+# pylint: disable=protected-access
+"""Diagnostics support for Gree Climate V2."""
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ENCRYPTION_KEY, DOMAIN
+from .device_api import loop_watchdog
+
+TO_REDACT = {CONF_MAC, CONF_ENCRYPTION_KEY, "unique_id", "mac", "tcid", "key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Everything below is assembled only when the download is requested.
+    """
+    diagnostics: Dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+    }
+    device = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if device is None:
+        return diagnostics
+
+    api = device._api
+    diagnostics["device"] = {
+        "available": device.available,
+        "encryption_version": device.encryption_version,
+        "bound": api._is_bound,
+        "column_limit": api.column_limit,
+        "features": {
+            "temp_sensor": device._has_temp_sensor,
+            "anti_direct_blow": device._has_anti_direct_blow,
+            "light_sensor": device._has_light_sensor,
+            "horizontal_swing": device._horizontal_swing,
+        },
+        "ac_options": device.ac_state._ac_options,
+    }
+    diagnostics["metrics"] = device.metrics.as_dict()
+    diagnostics["telemetry"] = device.telemetry.as_dict()
+    diagnostics["trace"] = async_redact_data(api.trace(), TO_REDACT)
+    watchdog = loop_watchdog()
+    if watchdog is not None:
+        diagnostics["loop_watchdog"] = {
+            "heartbeats": watchdog.heartbeats,
+            "top_offenders": async_redact_data(
+                watchdog.top_offenders(api._mac), {"device"}
+            ),
+        }
+    return diagnostics
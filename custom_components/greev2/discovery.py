@@ -0,0 +1,145 @@
+"""Unicast scan sweep for Gree devices on networks that block broadcast.
+
+Every address of a CIDR range gets one `scan` datagram from a single UDP
+socket. At most `SWEEP_CONCURRENCY` probes are outstanding at a time and
+each waits `SWEEP_TIMEOUT` for its reply, so a /22 takes a few seconds and
+no device sees more than one packet.
+"""
+
+import asyncio
+import base64
+import binascii
+import ipaddress
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Crypto.Cipher import AES
+
+from .const import (
+    DEFAULT_PORT,
+    SWEEP_CONCURRENCY,
+    SWEEP_MAX_ADDRESSES,
+    SWEEP_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_PAYLOAD = b'{"t":"scan"}'
+# Scan replies are encrypted with the generic V1 key, whatever the device uses
+_SCAN_KEY = b"a3K8Bx%2r8Y7#xDh"
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredDevice:
+    """A device that answered a scan."""
+
+    host: str
+    mac: str
+    name: str
+
+
+def sweep_hosts(network: str) -> List[str]:
+    """Return the host addresses of a CIDR range.
+
+    Raises ValueError for an invalid range or one larger than
+    `SWEEP_MAX_ADDRESSES`.
+    """
+    net = ipaddress.ip_network(network.strip(), strict=False)
+    if net.num_addresses > SWEEP_MAX_ADDRESSES:
+        raise ValueError(
+            f"{net} has {net.num_addresses} addresses, "
+            f"at most {SWEEP_MAX_ADDRESSES} can be swept"
+        )
+    return [str(host) for host in net.hosts()]
+
+
+def parse_scan_reply(host: str, data: bytes) -> Optional[DiscoveredDevice]:
+    """Parse a scan reply; None if it does not identify a device.
+
+    Falls back to the MAC in the outer envelope when the pack cannot be
+    decrypted.
+    """
+    try:
+        envelope: Dict[str, Any] = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(envelope, dict):
+        return None
+    inner: Dict[str, Any] = {}
+    try:
+        plaintext = AES.new(_SCAN_KEY, AES.MODE_ECB).decrypt(
+            base64.b64decode(envelope["pack"])
+        )
+        inner = json.loads(plaintext[: plaintext.rfind(b"}") + 1])
+    except (KeyError, TypeError, ValueError, binascii.Error):
+        _LOGGER.debug("Undecodable scan reply from %s", host)
+    mac = inner.get("mac") or envelope.get("cid")
+    if not mac:
+        return None
+    return DiscoveredDevice(host=host, mac=mac, name=inner.get("name") or mac)
+
+
+class _ScanProtocol(asyncio.DatagramProtocol):
+    """Routes scan replies to the probe waiting on the sender's address."""
+
+    def __init__(self) -> None:
+        """Initialize with no probes outstanding."""
+        self.waiters: Dict[str, "asyncio.Future[bytes]"] = {}
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Resolve the probe of the address that answered."""
+        waiter = self.waiters.pop(addr[0], None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        """Ignore ICMP errors; the probe simply times out."""
+
+
+async def async_sweep(
+    network: str,
+    on_progress: Optional[Callable[[float], None]] = None,
+    concurrency: int = SWEEP_CONCURRENCY,
+    timeout: float = SWEEP_TIMEOUT,
+) -> List[DiscoveredDevice]:
+    """Send a unicast scan to every address of `network`.
+
+    `on_progress` gets the fraction of addresses probed so far. Returns
+    the devices that answered, ordered by address.
+    """
+    hosts = sweep_hosts(network)
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        _ScanProtocol, local_addr=("0.0.0.0", 0)
+    )
+    slots = asyncio.Semaphore(concurrency)
+    found: List[DiscoveredDevice] = []
+    probed = 0
+
+    async def _probe(host: str) -> None:
+        nonlocal probed
+        async with slots:
+            waiter: "asyncio.Future[bytes]" = loop.create_future()
+            protocol.waiters[host] = waiter
+            try:
+                transport.sendto(SCAN_PAYLOAD, (host, DEFAULT_PORT))
+                data = await asyncio.wait_for(waiter, timeout)
+            except (asyncio.TimeoutError, OSError):
+                return
+            finally:
+                protocol.waiters.pop(host, None)
+                probed += 1
+                if on_progress is not None:
+                    on_progress(probed / len(hosts))
+        device = parse_scan_reply(host, data)
+        if device is not None:
+            found.append(device)
+
+    try:
+        await asyncio.gather(*(_probe(host) for host in hosts))
+    finally:
+        transport.close()
+    _LOGGER.debug("Sweep of %s found %d device(s)", network, len(found))
+    return sorted(found, key=lambda device: ipaddress.ip_address(device.host))
@@ -0,0 +1,73 @@
+"""Base class for Gree companion entities (switch, sensor, select)."""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity, EntityDescription
+
+from .climate_helpers import GreeClimateState, column_mask
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .climate import GreeClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_device(hass: HomeAssistant, entry_id: str) -> "GreeClimate":
+    """Return the climate entity that owns a config entry's device state."""
+    return hass.data[DOMAIN][entry_id]
+
+
+class GreeCompanionEntity(Entity):
+    """An entity backed by the state cache of a GreeClimate device.
+
+    Companion entities never talk to the device themselves: they read the
+    state polled by the climate entity, are refreshed when one of their
+    columns changes, and send writes through the device's command queue.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        device: "GreeClimate",
+        description: EntityDescription,
+        columns: Tuple[str, ...],
+        feature: Optional[str] = None,
+    ) -> None:
+        """Initialize the companion entity."""
+        self.entity_description = description
+        self._device = device
+        self._columns = columns
+        self._feature = feature
+        self._mask = column_mask(columns)
+        self._attr_unique_id = f"{device.unique_id}_{description.key}"
+        self._attr_device_info = device.device_info
+
+    @property
+    def _state(self) -> GreeClimateState:
+        """Return the shared device state."""
+        return self._device.ac_state
+
+    @property
+    def available(self) -> bool:
+        """Return True if the device is online and has this feature."""
+        return self._device.available and self._device.has_feature(self._feature)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to state changes of the owning device."""
+        self.async_on_remove(self._device.async_add_listener(self._handle_update))
+
+    @callback
+    def _handle_update(self, changed_mask: int) -> None:
+        """Write HA state when one of this entity's columns changed."""
+        if changed_mask & self._mask:
+            self.async_write_ha_state()
+
+    async def _async_send(self, options: Dict[str, Any]) -> None:
+        """Queue a write in the device's shared command pipeline."""
+        _LOGGER.debug("%s: sending %s", self.entity_id, options)
+        await self._device.async_send_command(options)
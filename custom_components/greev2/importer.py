@@ -0,0 +1,154 @@
+"""Bulk import of devices from a legacy YAML climate config or a CSV file.
+
+Legacy installs list their units as `platform: gree` blocks in
+`climate.yaml`. `async_import_devices` binds to every listed unit, at most
+`IMPORT_CONCURRENCY` at a time, and starts an import flow for each unit
+that bound. Feature detection then runs as each new entry sets up.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+from typing import Any, Dict, List, Set
+
+import yaml
+
+from homeassistant import config_entries, data_entry_flow
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import format_mac
+
+from .config_flow import CannotConnect, InvalidAuth, validate_input
+from .const import (
+    CONF_ENCRYPTION_VERSION,
+    CONF_HOST,
+    CONF_MAC,
+    CONF_NAME,
+    CONF_TEMP_SENSOR,
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Legacy platform names whose blocks are imported
+IMPORT_PLATFORMS = ("gree", "greev2")
+# Columns carried into the entry; everything else in a block is ignored
+IMPORT_FIELDS = (
+    CONF_HOST,
+    CONF_MAC,
+    CONF_NAME,
+    CONF_TEMP_SENSOR,
+    CONF_ENCRYPTION_VERSION,
+    "area_id",
+)
+
+# Per-device outcomes reported by async_import_devices
+IMPORT_CREATED = "created"
+IMPORT_ALREADY_CONFIGURED = "already_configured"
+IMPORT_CANNOT_CONNECT = "cannot_connect"
+IMPORT_INVALID_AUTH = "invalid_auth"
+IMPORT_INVALID = "invalid"
+
+
+def _clean_device(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Keep the imported columns of one device, as non-empty strings."""
+    return {
+        field: str(raw[field]).strip()
+        for field in IMPORT_FIELDS
+        if raw.get(field) not in (None, "")
+    }
+
+
+def parse_legacy_yaml(text: str) -> List[Dict[str, str]]:
+    """Return the devices of a legacy climate YAML file.
+
+    Accepts the `climate.yaml` list of platform blocks or a configuration
+    with a `climate:` key. Raises ValueError if the file cannot be parsed.
+    """
+    try:
+        config = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML: {e}") from e
+    if isinstance(config, dict):
+        config = config.get("climate")
+    if not isinstance(config, list):
+        raise ValueError("Expected a list of climate platform blocks")
+    return [
+        _clean_device(block)
+        for block in config
+        if isinstance(block, dict) and block.get("platform") in IMPORT_PLATFORMS
+    ]
+
+
+def parse_csv(text: str) -> List[Dict[str, str]]:
+    """Return the devices of a CSV file with a header row (host, mac, ...)."""
+    reader = csv.DictReader(io.StringIO(text))
+    if reader.fieldnames is None or CONF_HOST not in reader.fieldnames:
+        raise ValueError("CSV needs a header row with at least host and mac")
+    return [_clean_device(row) for row in reader]
+
+
+def parse_import_file(path: str, text: str) -> List[Dict[str, str]]:
+    """Parse an import file; `.csv` files as CSV, anything else as YAML."""
+    if path.lower().endswith(".csv"):
+        return parse_csv(text)
+    return parse_legacy_yaml(text)
+
+
+def _device_label(device: Dict[str, str], index: int, used: Set[str]) -> str:
+    """Name a device in the report: its MAC, or its position in the file.
+
+    The position is used when the MAC is missing or already names an earlier
+    device, so every device in the file gets its own outcome.
+    """
+    mac = device.get(CONF_MAC)
+    label = format_mac(mac) if mac else ""
+    if not label or label in used:
+        label = f"#{index + 1}"
+    used.add(label)
+    return label
+
+
+async def async_import_devices(
+    hass: HomeAssistant,
+    devices: List[Dict[str, str]],
+    concurrency: int = IMPORT_CONCURRENCY,
+) -> Dict[str, str]:
+    """Bind to every device and create a config entry for each that binds.
+
+    Returns the outcome per device, keyed by MAC (see `_device_label`).
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _import(device: Dict[str, str]) -> str:
+        if not device.get(CONF_HOST) or not device.get(CONF_MAC):
+            return IMPORT_INVALID
+        if hass.config_entries.async_entry_for_domain_unique_id(
+            DOMAIN, format_mac(device[CONF_MAC])
+        ):
+            return IMPORT_ALREADY_CONFIGURED
+        async with slots:
+            try:
+                info = await validate_input(hass, device)
+            except CannotConnect:
+                return IMPORT_CANNOT_CONNECT
+            except InvalidAuth:
+                return IMPORT_INVALID_AUTH
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_IMPORT},
+            data={**device, CONF_ENCRYPTION_VERSION: info["encryption_version"]},
+        )
+        if result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY:
+            return IMPORT_CREATED
+        return result.get("reason", IMPORT_INVALID)
+
+    outcomes = await asyncio.gather(*(_import(device) for device in devices))
+    used: Set[str] = set()
+    results = {
+        _device_label(device, index, used): outcome
+        for index, (device, outcome) in enumerate(zip(devices, outcomes))
+    }
+    _LOGGER.info("Imported %d device(s): %s", len(devices), results)
+    return results
@@ -0,0 +1,250 @@
+"""Per-device transport metrics for the Gree API layer."""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds (ms) of the round-trip time histogram buckets; the last
+# bucket catches everything slower.
+RTT_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Window used for the packets-per-minute rate, counted per whole second
+_RATE_WINDOW_S: int = 60
+
+
+# Phases of an exchange timed by PhaseTimings, in the order they happen.
+# The climate entity times `apply`; GreeDeviceApi times the rest.
+PHASE_JSON_BUILD = 0  # Serializing the request pack
+PHASE_ENCRYPT = 1  # Padding and encryption (GCM: with the tag)
+PHASE_BASE64 = 2  # Base64 encoding the request, decoding the reply
+PHASE_SEND = 3  # Handing the datagram to the socket
+PHASE_WAIT = 4  # Waiting for a reply datagram
+PHASE_DECRYPT = 5  # Decryption and tag verification
+PHASE_JSON_PARSE = 6  # Parsing the reply envelope and pack
+PHASE_APPLY = 7  # Merging the values into GreeClimateState
+PHASE_NAMES: Tuple[str, ...] = (
+    "json_build",
+    "encrypt",
+    "base64",
+    "send",
+    "wait",
+    "decrypt",
+    "json_parse",
+    "apply",
+)
+
+
+class PhaseTimings:
+    """Total time and count per exchange phase, in monotonic nanoseconds.
+
+    Recording is two list updates; callers take `time.perf_counter_ns()`
+    around the phase themselves.
+    """
+
+    __slots__ = ("total_ns", "counts")
+
+    def __init__(self) -> None:
+        """Initialize all phases to zero."""
+        self.total_ns: List[int] = [0] * len(PHASE_NAMES)
+        self.counts: List[int] = [0] * len(PHASE_NAMES)
+
+    def record(self, phase: int, elapsed_ns: int) -> None:
+        """Add one timed run of `phase`."""
+        self.total_ns[phase] += elapsed_ns
+        self.counts[phase] += 1
+
+    def mean_us(self, phase: int) -> Optional[float]:
+        """Return the mean duration of `phase`, or None if never timed."""
+        if not self.counts[phase]:
+            return None
+        return self.total_ns[phase] / self.counts[phase] / 1000.0
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return count, total and mean per phase for diagnostics."""
+        return {
+            name: {
+                "count": self.counts[phase],
+                "total_ms": round(self.total_ns[phase] / 1e6, 3),
+                "mean_us": (
+                    None
+                    if (mean := self.mean_us(phase)) is None
+                    else round(mean, 1)
+                ),
+            }
+            for phase, name in enumerate(PHASE_NAMES)
+        }
+
+
+class TransportMetrics:
+    """Counters and an RTT histogram for one device's UDP exchanges.
+
+    Recording is a handful of integer updates per exchange; derived values
+    (percentiles, rates) are only computed when read.
+    """
+
+    __slots__ = (
+        "requests",
+        "responses",
+        "timeouts",
+        "socket_errors",
+        "decrypt_failures",
+        "malformed_replies",
+        "stale_replies",
+        "duplicate_replies",
+        "rebinds",
+        "status_failures",
+        "command_failures",
+        "bytes_out",
+        "bytes_in",
+        "last_rtt_ms",
+        "phases",
+        "_rtt_counts",
+        "_rtt_sum_ms",
+        "_rate_counts",
+        "_rate_seconds",
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.requests: int = 0
+        self.responses: int = 0
+        self.timeouts: int = 0
+        self.socket_errors: int = 0
+        self.decrypt_failures: int = 0
+        self.malformed_replies: int = 0
+        self.stale_replies: int = 0
+        self.duplicate_replies: int = 0
+        self.rebinds: int = 0
+        self.status_failures: int = 0
+        self.command_failures: int = 0
+        self.bytes_out: int = 0
+        self.bytes_in: int = 0
+        self.last_rtt_ms: Optional[float] = None
+        self.phases: PhaseTimings = PhaseTimings()
+        self._rtt_counts: List[int] = [0] * (len(RTT_BUCKETS_MS) + 1)
+        self._rtt_sum_ms: float = 0.0
+        # Packets per second over the rate window, in a fixed ring of slots
+        self._rate_counts: List[int] = [0] * _RATE_WINDOW_S
+        self._rate_seconds: List[int] = [-1] * _RATE_WINDOW_S
+
+    # --- Recording (called from the API hot path) ---
+    def record_sent(self, nbytes: int) -> None:
+        """Record a datagram sent to the device."""
+        self.requests += 1
+        self.bytes_out += nbytes
+        self._count_packet()
+
+    def record_received(self, nbytes: int, rtt_s: float) -> None:
+        """Record a reply datagram and its round-trip time."""
+        self.responses += 1
+        self.bytes_in += nbytes
+        self._count_packet()
+        rtt_ms = rtt_s * 1000.0
+        self.last_rtt_ms = rtt_ms
+        self._rtt_sum_ms += rtt_ms
+        for i, bound in enumerate(RTT_BUCKETS_MS):
+            if rtt_ms <= bound:
+                self._rtt_counts[i] += 1
+                return
+        self._rtt_counts[-1] += 1
+
+    def _count_packet(self) -> None:
+        """Add a datagram to the current second's slot of the rate ring."""
+        second = int(time.monotonic())
+        slot = second % _RATE_WINDOW_S
+        if self._rate_seconds[slot] != second:
+            self._rate_seconds[slot] = second
+            self._rate_counts[slot] = 0
+        self._rate_counts[slot] += 1
+
+    def record_timeout(self) -> None:
+        """Record a request the device never answered."""
+        self.timeouts += 1
+
+    def record_socket_error(self) -> None:
+        """Record a send/receive failure other than a timeout."""
+        self.socket_errors += 1
+
+    def record_decrypt_failure(self) -> None:
+        """Record a reply that failed to decrypt or verify, or to parse after."""
+        self.decrypt_failures += 1
+
+    def record_malformed_reply(self) -> None:
+        """Record a reply whose envelope could not be parsed."""
+        self.malformed_replies += 1
+
+    def record_stale_reply(self) -> None:
+        """Record a reply that answered no outstanding request."""
+        self.stale_replies += 1
+
+    def record_duplicate_reply(self) -> None:
+        """Record a second copy of a reply that was already delivered."""
+        self.duplicate_replies += 1
+
+    def record_rebind(self) -> None:
+        """Record a re-bind that fetched a new device key."""
+        self.rebinds += 1
+
+    # --- Derived values ---
+    @property
+    def rtt_mean_ms(self) -> Optional[float]:
+        """Return the mean round-trip time, or None before the first reply."""
+        if not self.responses:
+            return None
+        return self._rtt_sum_ms / self.responses
+
+    def rtt_percentile_ms(self, percentile: float) -> Optional[float]:
+        """Estimate an RTT percentile as the upper bound of its bucket.
+
+        The overflow bucket reports the slowest bucket bound.
+        """
+        total = sum(self._rtt_counts)
+        if not total:
+            return None
+        threshold = total * percentile / 100.0
+        seen = 0
+        for i, count in enumerate(self._rtt_counts):
+            seen += count
+            if seen >= threshold:
+                return float(RTT_BUCKETS_MS[min(i, len(RTT_BUCKETS_MS) - 1)])
+        return float(RTT_BUCKETS_MS[-1])
+
+    @property
+    def packets_per_minute(self) -> int:
+        """Return datagrams sent plus received over the last minute."""
+        oldest = int(time.monotonic()) - _RATE_WINDOW_S
+        return sum(
+            count
+            for count, second in zip(self._rate_counts, self._rate_seconds)
+            if second > oldest
+        )
+
+    def rtt_histogram(self) -> Dict[str, int]:
+        """Return the RTT histogram keyed by bucket label."""
+        labels = [f"<={bound:g}ms" for bound in RTT_BUCKETS_MS]
+        labels.append(f">{RTT_BUCKETS_MS[-1]:g}ms")
+        return dict(zip(labels, self._rtt_counts))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a snapshot for diagnostics."""
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "timeouts": self.timeouts,
+            "socket_errors": self.socket_errors,
+            "decrypt_failures": self.decrypt_failures,
+            "malformed_replies": self.malformed_replies,
+            "stale_replies": self.stale_replies,
+            "duplicate_replies": self.duplicate_replies,
+            "rebinds": self.rebinds,
+            "status_failures": self.status_failures,
+            "command_failures": self.command_failures,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "packets_per_minute": self.packets_per_minute,
+            "rtt_last_ms": self.last_rtt_ms,
+            "rtt_mean_ms": self.rtt_mean_ms,
+            "rtt_p50_ms": self.rtt_percentile_ms(50),
+            "rtt_p95_ms": self.rtt_percentile_ms(95),
+            "rtt_histogram": self.rtt_histogram(),
+            "phases": self.phases.as_dict(),
+        }
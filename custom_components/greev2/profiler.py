@@ -0,0 +1,140 @@
+"""On-demand profiling of the integration on a running instance.
+
+`async_profile` runs cProfile on the event loop thread for a while and, at
+the same time, records that thread's call stacks with `sys.setprofile`. It
+writes the cProfile data as a pstats file and the stacks that pass through
+this integration as collapsed stacks (one `frame;frame;frame count` line
+per stack, count in microseconds; the input format of flame graph tools).
+
+Stacks are recorded on every call rather than sampled from another thread:
+a sampler only gets the GIL when the loop blocks in `select`, so its samples
+would nearly all land there.
+"""
+
+import asyncio
+import cProfile
+import os
+import sys
+import time
+from collections import defaultdict
+from types import FrameType
+from typing import Any, DefaultDict, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Label a frame as `module:function`."""
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+class _StackRecorder:
+    """Times the current thread's collapsed call stacks.
+
+    Each stack level keeps its full collapsed path and how many integration
+    frames it holds, so a profile event costs a push or a pop and one dict
+    update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing recorded."""
+        self.seconds: DefaultDict[str, float] = defaultdict(float)
+        self._paths: List[str] = []
+        self._ours: List[int] = []
+        self._last = 0.0
+
+    def _push(self, frame: FrameType) -> None:
+        """Enter `frame`."""
+        label = _frame_label(frame)
+        ours = frame.f_code.co_filename.startswith(_PACKAGE_DIR)
+        if self._paths:
+            self._paths.append(f"{self._paths[-1]};{label}")
+            self._ours.append(self._ours[-1] + ours)
+        else:
+            self._paths.append(label)
+            self._ours.append(int(ours))
+
+    def start(self) -> None:
+        """Start recording the current thread."""
+        # This frame is included: its return is the first event recorded
+        frame: Optional[FrameType] = sys._getframe()  # pylint: disable=protected-access
+        callers: List[FrameType] = []
+        while frame is not None:
+            callers.append(frame)
+            frame = frame.f_back
+        for caller in reversed(callers):
+            self._push(caller)
+        self._last = time.perf_counter()
+        sys.setprofile(self._event)
+
+    def stop(self) -> None:
+        """Stop recording."""
+        sys.setprofile(None)
+
+    def _event(self, frame: FrameType, event: str, _arg: Any) -> None:
+        """Charge the time since the last event to the current stack."""
+        now = time.perf_counter()
+        if self._ours and self._ours[-1]:
+            self.seconds[self._paths[-1]] += now - self._last
+        if event == "call":
+            self._push(frame)
+        elif event == "return" and self._paths:
+            self._paths.pop()
+            self._ours.pop()
+        self._last = now
+
+    def collapsed(self) -> Dict[str, int]:
+        """Return the stacks with their time in microseconds, longest first."""
+        micros = {
+            stack: int(seconds * 1e6) for stack, seconds in self.seconds.items()
+        }
+        return dict(
+            sorted(
+                ((stack, us) for stack, us in micros.items() if us),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        )
+
+
+def _write_reports(
+    profiler: cProfile.Profile,
+    stacks: Dict[str, int],
+    pstats_path: str,
+    collapsed_path: str,
+) -> None:
+    """Write both reports (runs in the executor)."""
+    profiler.dump_stats(pstats_path)
+    with open(collapsed_path, "w", encoding="utf-8") as collapsed:
+        for stack, micros in stacks.items():
+            collapsed.write(f"{stack} {micros}\n")
+
+
+async def async_profile(hass: HomeAssistant, duration: float) -> Dict[str, str]:
+    """Profile the event loop for `duration` seconds and write the reports.
+
+    Returns the paths of the pstats and collapsed-stack files, which are
+    written to the config directory. Raises ValueError if another profiler
+    is already running.
+    """
+    profiler = cProfile.Profile()
+    recorder = _StackRecorder()
+    profiler.enable()
+    recorder.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        recorder.stop()
+        profiler.disable()
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    pstats_path = hass.config.path(f"greev2_profile_{stamp}.pstats")
+    collapsed_path = hass.config.path(f"greev2_profile_{stamp}.collapsed.txt")
+    await hass.async_add_executor_job(
+        _write_reports, profiler, recorder.collapsed(), pstats_path, collapsed_path
+    )
+    return {"pstats": pstats_path, "collapsed": collapsed_path}
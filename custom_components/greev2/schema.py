@@ -0,0 +1,177 @@
+"""Declarative column schema for the Gree protocol.
+
+Every device column the integration knows about is described once in
+`COLUMNS`. The fetch list, the state layout, the decode lookup tables and
+the command encoder are all generated from it, so adding a column only
+means adding one `ColumnSpec` here.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNKNOWN
+
+from .const import FAN_MODES, HVAC_MODES, MAX_TEMP, MIN_TEMP, PRESET_MODES, SWING_MODES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Column value types
+KIND_BOOL = "bool"  # 0/1 switch
+KIND_ENUM = "enum"  # Index into a list of labels
+KIND_INT = "int"  # Plain number (temperatures, raw codes)
+
+# Column volatility
+SETTING = "setting"  # Only changes when someone sends a command
+READING = "reading"  # Changes on its own (sensor readings)
+
+# Feature gates: columns only fetched once detect_features found them
+FEATURE_TEMP_SENSOR = "temp_sensor"
+FEATURE_ANTI_DIRECT_BLOW = "anti_direct_blow"
+FEATURE_LIGHT_SENSOR = "light_sensor"
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnSpec:
+    """Description of one device column."""
+
+    name: str
+    kind: str
+    min_value: int
+    max_value: int
+    volatility: str = SETTING
+    feature: Optional[str] = None  # Feature gate, None if always fetched
+    default: Optional[int] = None  # Value before the first poll
+    labels: Optional[Sequence[Any]] = None  # Decoded values for KIND_ENUM
+
+
+COLUMNS: Tuple[ColumnSpec, ...] = (
+    ColumnSpec("Pow", KIND_BOOL, 0, 1, default=0),
+    ColumnSpec("Mod", KIND_ENUM, 0, 4, labels=HVAC_MODES),
+    ColumnSpec("SetTem", KIND_INT, MIN_TEMP, MAX_TEMP),
+    ColumnSpec("WdSpd", KIND_ENUM, 0, 5, labels=FAN_MODES),
+    ColumnSpec("Air", KIND_BOOL, 0, 1),
+    ColumnSpec("Blo", KIND_BOOL, 0, 1),
+    ColumnSpec("Health", KIND_BOOL, 0, 1),
+    ColumnSpec("SwhSlp", KIND_BOOL, 0, 1),
+    ColumnSpec("Lig", KIND_BOOL, 0, 1),
+    ColumnSpec("SwingLfRig", KIND_ENUM, 0, 6, labels=PRESET_MODES),
+    ColumnSpec("SwUpDn", KIND_ENUM, 0, 11, labels=SWING_MODES),
+    ColumnSpec("Quiet", KIND_BOOL, 0, 1),
+    ColumnSpec("Tur", KIND_BOOL, 0, 1),
+    ColumnSpec("StHt", KIND_BOOL, 0, 1),
+    ColumnSpec("TemUn", KIND_BOOL, 0, 1),
+    ColumnSpec("HeatCoolType", KIND_BOOL, 0, 1),
+    ColumnSpec("TemRec", KIND_BOOL, 0, 1),
+    ColumnSpec("SvSt", KIND_BOOL, 0, 1),
+    ColumnSpec("SlpMod", KIND_BOOL, 0, 1),
+    ColumnSpec(
+        "TemSen", KIND_INT, 0, 127, volatility=READING, feature=FEATURE_TEMP_SENSOR
+    ),
+    ColumnSpec(
+        "AntiDirectBlow", KIND_BOOL, 0, 1, feature=FEATURE_ANTI_DIRECT_BLOW
+    ),
+    ColumnSpec(
+        "LigSen", KIND_BOOL, 0, 1, volatility=READING, feature=FEATURE_LIGHT_SENSOR
+    ),
+)
+
+COLUMN_SPECS: Dict[str, ColumnSpec] = {spec.name: spec for spec in COLUMNS}
+
+# --- Generated tables ---
+
+# State layout (slot order of GreeClimateState)
+STATE_COLUMNS: Tuple[str, ...] = tuple(spec.name for spec in COLUMNS)
+
+# Columns polled on every update before feature detection adds gated ones
+DEFAULT_FETCH_COLUMNS: Tuple[str, ...] = tuple(
+    spec.name for spec in COLUMNS if spec.feature is None
+)
+
+# Feature gate -> column probed by detect_features
+FEATURE_COLUMNS: Dict[str, str] = {
+    spec.feature: spec.name for spec in COLUMNS if spec.feature is not None
+}
+
+# Columns that change without a command
+READING_COLUMNS: Tuple[str, ...] = tuple(
+    spec.name for spec in COLUMNS if spec.volatility == READING
+)
+
+# Initial state before the first poll
+INITIAL_OPTIONS: Dict[str, Optional[int]] = {
+    spec.name: spec.default for spec in COLUMNS
+}
+
+
+def _decode_table(spec: ColumnSpec) -> Tuple[Any, ...]:
+    """Build the raw value -> decoded value table for an enum column."""
+    return tuple(spec.labels or ())
+
+
+def _encode_table(spec: ColumnSpec) -> Dict[Any, int]:
+    """Build the decoded value -> raw value table for an enum column.
+
+    Only labels inside the column's range can be sent; the rest (e.g. the
+    Turbo/Quiet fan modes) are driven by other columns.
+    """
+    labels = _decode_table(spec)[: spec.max_value + 1]
+    return {label: i for i, label in enumerate(labels)}
+
+
+# O(1) decode tables (index by raw value) and their inverse encoders
+HVAC_MODE_DECODE: Tuple[HVACMode, ...] = _decode_table(COLUMN_SPECS["Mod"])
+FAN_MODE_DECODE: Tuple[str, ...] = _decode_table(COLUMN_SPECS["WdSpd"])
+SWING_MODE_DECODE: Tuple[str, ...] = _decode_table(COLUMN_SPECS["SwUpDn"])
+PRESET_MODE_DECODE: Tuple[str, ...] = _decode_table(COLUMN_SPECS["SwingLfRig"])
+HVAC_MODE_ENCODE: Dict[HVACMode, int] = _encode_table(COLUMN_SPECS["Mod"])
+FAN_MODE_ENCODE: Dict[str, int] = _encode_table(COLUMN_SPECS["WdSpd"])
+SWING_MODE_ENCODE: Dict[str, int] = _encode_table(COLUMN_SPECS["SwUpDn"])
+PRESET_MODE_ENCODE: Dict[str, int] = _encode_table(COLUMN_SPECS["SwingLfRig"])
+
+_ENCODE_TABLES: Dict[str, Dict[Any, int]] = {
+    spec.name: _encode_table(spec) for spec in COLUMNS if spec.kind == KIND_ENUM
+}
+
+# Raw 0/1 -> HA on/off state
+ONOFF_DECODE: Dict[Optional[int], str] = {1: STATE_ON, 0: STATE_OFF}
+
+
+def decode_onoff(value: Optional[int]) -> str:
+    """Decode a bool column to STATE_ON/STATE_OFF/STATE_UNKNOWN."""
+    return ONOFF_DECODE.get(value, STATE_UNKNOWN)
+
+
+def encode_command(options: Mapping[str, Any]) -> Tuple[List[str], List[int]]:
+    """Encode a column -> value mapping into the command `opt`/`p` lists.
+
+    Bools become 0/1 and enum labels become their raw index. Unknown
+    columns and out-of-range values are dropped with a warning.
+    """
+    opt: List[str] = []
+    p: List[int] = []
+    for name, value in options.items():
+        spec = COLUMN_SPECS.get(name)
+        if spec is None:
+            _LOGGER.warning("Dropping unknown column '%s' from command", name)
+            continue
+        if spec.kind == KIND_ENUM and not isinstance(value, int):
+            raw = _ENCODE_TABLES[name].get(value)
+        else:
+            try:
+                raw = int(value)
+            except (TypeError, ValueError):
+                raw = None
+        if raw is None or not spec.min_value <= raw <= spec.max_value:
+            _LOGGER.warning(
+                "Dropping out-of-range value '%s' for column '%s' (%d-%d)",
+                value,
+                name,
+                spec.min_value,
+                spec.max_value,
+            )
+            continue
+        opt.append(name)
+        p.append(raw)
+    return opt, p
@@ -0,0 +1,57 @@
+"""Select platform for Gree Climate V2 device settings."""
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .entity import GreeCompanionEntity, get_device
+from .schema import PRESET_MODE_DECODE, PRESET_MODE_ENCODE
+
+if TYPE_CHECKING:
+    from .climate import GreeClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+HORIZONTAL_SWING = SelectEntityDescription(
+    key="horizontal_swing",
+    name="Horizontal swing",
+    icon="mdi:arrow-left-right",
+    options=list(PRESET_MODE_ENCODE),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Gree selects from a config entry."""
+    device = get_device(hass, entry.entry_id)
+    async_add_entities([GreeHorizontalSwingSelect(device)])
+
+
+class GreeHorizontalSwingSelect(GreeCompanionEntity, SelectEntity):
+    """Horizontal swing position (SwingLfRig)."""
+
+    def __init__(self, device: "GreeClimate") -> None:
+        """Initialize the select."""
+        super().__init__(device, HORIZONTAL_SWING, ("SwingLfRig",))
+
+    @property
+    def current_option(self) -> Optional[str]:
+        """Return the current horizontal swing position."""
+        raw = self._state.get_column("SwingLfRig")
+        if raw is not None and 0 <= raw < len(PRESET_MODE_DECODE):
+            return PRESET_MODE_DECODE[raw]
+        return None
+
+    async def async_select_option(self, option: str) -> None:
+        """Change the horizontal swing position."""
+        if option not in PRESET_MODE_ENCODE:
+            _LOGGER.error("Invalid horizontal swing option requested: %s", option)
+            return
+        await self._async_send({"SwingLfRig": PRESET_MODE_ENCODE[option]})
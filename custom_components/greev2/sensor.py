@@ -0,0 +1,251 @@
+"""Sensor platform for Gree Climate V2 device readings."""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .entity import GreeCompanionEntity, get_device
+from .metrics import TransportMetrics
+from .schema import FEATURE_TEMP_SENSOR, HVAC_MODE_ENCODE
+from .telemetry import DeviceTelemetry
+
+if TYPE_CHECKING:
+    from .climate import GreeClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERNAL_TEMPERATURE = SensorEntityDescription(
+    key="internal_temperature",
+    name="Internal temperature",
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GreeMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a transport metric sensor."""
+
+    value_fn: Callable[[TransportMetrics], Any]
+    entity_category: Optional[EntityCategory] = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+METRIC_SENSORS: Tuple[GreeMetricSensorEntityDescription, ...] = (
+    GreeMetricSensorEntityDescription(
+        key="rtt_last",
+        name="Round-trip time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda metrics: metrics.last_rtt_ms,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="rtt_p95",
+        name="Round-trip time p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: metrics.rtt_percentile_ms(95),
+    ),
+    GreeMetricSensorEntityDescription(
+        key="timeouts",
+        name="Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.timeouts,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="decrypt_failures",
+        name="Decrypt failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.decrypt_failures,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="status_failures",
+        name="Status failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.status_failures,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="bytes_in",
+        name="Bytes received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda metrics: metrics.bytes_in,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="bytes_out",
+        name="Bytes sent",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        value_fn=lambda metrics: metrics.bytes_out,
+    ),
+    GreeMetricSensorEntityDescription(
+        key="packets_per_minute",
+        name="Packets per minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="packets/min",
+        value_fn=lambda metrics: metrics.packets_per_minute,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GreeTelemetrySensorEntityDescription(SensorEntityDescription):
+    """Describes a runtime statistic read from the telemetry ring."""
+
+    value_fn: Callable[[DeviceTelemetry], Any]
+    entity_category: Optional[EntityCategory] = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+def _runtime_sensor(index: int, mode: str) -> GreeTelemetrySensorEntityDescription:
+    """Describe the runtime sensor of one HVAC mode."""
+    return GreeTelemetrySensorEntityDescription(
+        key=f"runtime_{mode}",
+        name=f"Runtime {mode.replace('_', ' ')}",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        suggested_display_precision=2,
+        value_fn=lambda telemetry: telemetry.runtime_hours(index),
+    )
+
+
+TELEMETRY_SENSORS: Tuple[GreeTelemetrySensorEntityDescription, ...] = (
+    GreeTelemetrySensorEntityDescription(
+        key="duty_cycle",
+        name="Duty cycle",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        value_fn=lambda telemetry: telemetry.duty_cycle,
+    ),
+    GreeTelemetrySensorEntityDescription(
+        key="cycles_per_hour",
+        name="Cycles per hour",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="cycles/h",
+        suggested_display_precision=1,
+        value_fn=lambda telemetry: telemetry.cycles_per_hour,
+    ),
+    GreeTelemetrySensorEntityDescription(
+        key="mean_delta_t",
+        name="Mean delta-T",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        suggested_display_precision=1,
+        value_fn=lambda telemetry: telemetry.mean_delta_t,
+    ),
+    *(_runtime_sensor(index, str(mode)) for mode, index in HVAC_MODE_ENCODE.items()),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Gree sensors from a config entry."""
+    device = get_device(hass, entry.entry_id)
+    async_add_entities(
+        [
+            GreeInternalTemperatureSensor(device),
+            *(GreeMetricSensor(device, description) for description in METRIC_SENSORS),
+            *(
+                GreeTelemetrySensor(device, description)
+                for description in TELEMETRY_SENSORS
+            ),
+        ]
+    )
+
+
+class GreeInternalTemperatureSensor(GreeCompanionEntity, SensorEntity):
+    """The unit's own room temperature reading (TemSen)."""
+
+    def __init__(self, device: "GreeClimate") -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            device, INTERNAL_TEMPERATURE, ("TemSen",), FEATURE_TEMP_SENSOR
+        )
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the internal temperature with the device offset removed."""
+        return self._state.get_internal_temp()
+
+
+class GreeMetricSensor(GreeCompanionEntity, SensorEntity):
+    """A transport metric of the device's API layer.
+
+    Metrics are local counters, so this entity is polled by HA without
+    touching the network.
+    """
+
+    _attr_should_poll = True
+    entity_description: GreeMetricSensorEntityDescription
+
+    def __init__(
+        self, device: "GreeClimate", description: GreeMetricSensorEntityDescription
+    ) -> None:
+        """Initialize the metric sensor."""
+        super().__init__(device, description, ())
+
+    @property
+    def available(self) -> bool:
+        """Metrics stay readable while the device is offline."""
+        return True
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current metric value."""
+        return self.entity_description.value_fn(self._device.metrics)
+
+
+class GreeTelemetrySensor(GreeCompanionEntity, SensorEntity):
+    """A runtime statistic of the device's telemetry ring.
+
+    The statistics are updated in memory on every poll, so this entity is
+    polled by HA without touching the network or the recorder.
+    """
+
+    _attr_should_poll = True
+    entity_description: GreeTelemetrySensorEntityDescription
+
+    def __init__(
+        self,
+        device: "GreeClimate",
+        description: GreeTelemetrySensorEntityDescription,
+    ) -> None:
+        """Initialize the telemetry sensor."""
+        super().__init__(device, description, ())
+
+    @property
+    def available(self) -> bool:
+        """Statistics stay readable while the device is offline."""
+        return True
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current statistic."""
+        return self.entity_description.value_fn(self._device.telemetry)
@@ -0,0 +1,222 @@
+"""Integration-level services for Gree Climate V2."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+
+from .const import (
+    ATTR_DURATION,
+    ATTR_ENABLED,
+    ATTR_OPT,
+    ATTR_P,
+    ATTR_PATH,
+    ATTR_TIMEOUT,
+    DEFAULT_GROUP_TIMEOUT,
+    DEFAULT_PROFILE_DURATION,
+    DOMAIN,
+    SERVICE_APPLY_GROUP,
+    SERVICE_IMPORT_DEVICES,
+    SERVICE_PROFILE,
+    SERVICE_SET_LOOP_WATCHDOG,
+    SERVICE_SET_TRACE_MODE,
+)
+from .device_api import loop_watchdog, set_loop_watchdog, set_trace_mode
+from .importer import async_import_devices, parse_import_file
+from .profiler import async_profile
+from .watchdog import LoopWatchdog
+
+if TYPE_CHECKING:
+    from .climate import GreeClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-device outcomes reported by apply_group
+RESULT_OK = "ok"
+RESULT_FAILED = "failed"
+RESULT_TIMEOUT = "timeout"
+RESULT_NOT_FOUND = "not_found"
+
+
+def _same_length(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Check the opt and p lists pair up."""
+    if len(data[ATTR_OPT]) != len(data[ATTR_P]):
+        raise vol.Invalid("opt and p must have the same length")
+    return data
+
+
+APPLY_GROUP_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+            vol.Required(ATTR_OPT): vol.All(cv.ensure_list, [cv.string]),
+            vol.Required(ATTR_P): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+            vol.Optional(ATTR_TIMEOUT, default=DEFAULT_GROUP_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1, max=60)
+            ),
+        }
+    ),
+    _same_length,
+)
+
+SET_TRACE_MODE_SCHEMA = vol.Schema({vol.Required(ATTR_ENABLED): cv.boolean})
+
+SET_LOOP_WATCHDOG_SCHEMA = vol.Schema({vol.Required(ATTR_ENABLED): cv.boolean})
+
+IMPORT_DEVICES_SCHEMA = vol.Schema({vol.Required(ATTR_PATH): cv.string})
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+    }
+)
+
+
+def enable_loop_watchdog(hass: HomeAssistant, enabled: bool) -> None:
+    """Start a fresh loop lag watchdog, or stop the running one."""
+    running = loop_watchdog()
+    if running is not None:
+        running.stop()
+        set_loop_watchdog(None)
+    if enabled:
+        watchdog = LoopWatchdog()
+        watchdog.start(hass.loop)
+        set_loop_watchdog(watchdog)
+    _LOGGER.info("Gree loop watchdog %s", "enabled" if enabled else "disabled")
+
+
+def _read_file(path: str) -> str:
+    """Read an import file (runs in the executor)."""
+    with open(path, encoding="utf-8") as import_file:
+        return import_file.read()
+
+
+def _devices_by_entity_id(hass: HomeAssistant) -> Dict[str, "GreeClimate"]:
+    """Return the loaded climate devices keyed by entity_id."""
+    return {
+        device.entity_id: device for device in hass.data.get(DOMAIN, {}).values()
+    }
+
+
+async def async_apply_group(
+    hass: HomeAssistant,
+    entity_ids: List[str],
+    ac_options: Dict[str, Any],
+    timeout: float,
+) -> Dict[str, str]:
+    """Send one command to many devices at once.
+
+    Each device encrypts its own packet; all packets are dispatched
+    concurrently and the whole fan-out shares a single deadline. Returns
+    the outcome per entity_id.
+    """
+    devices = _devices_by_entity_id(hass)
+    results: Dict[str, str] = {}
+    tasks: Dict["asyncio.Task[bool]", str] = {}
+    for entity_id in entity_ids:
+        device = devices.get(entity_id)
+        if device is None:
+            results[entity_id] = RESULT_NOT_FOUND
+            continue
+        task = asyncio.create_task(device.async_send_group_command(ac_options))
+        tasks[task] = entity_id
+
+    if tasks:
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+            results[tasks[task]] = RESULT_TIMEOUT
+        for task in done:
+            acked = not task.cancelled() and task.exception() is None and task.result()
+            results[tasks[task]] = RESULT_OK if acked else RESULT_FAILED
+
+    _LOGGER.debug("apply_group %s -> %s", ac_options, results)
+    return results
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration-level services."""
+
+    async def _async_handle_apply_group(call: ServiceCall) -> ServiceResponse:
+        ac_options = dict(zip(call.data[ATTR_OPT], call.data[ATTR_P]))
+        results = await async_apply_group(
+            hass, call.data[ATTR_ENTITY_ID], ac_options, call.data[ATTR_TIMEOUT]
+        )
+        return {"results": results}
+
+    async def _async_handle_set_trace_mode(call: ServiceCall) -> None:
+        set_trace_mode(call.data[ATTR_ENABLED])
+
+    async def _async_handle_set_loop_watchdog(call: ServiceCall) -> None:
+        enable_loop_watchdog(hass, call.data[ATTR_ENABLED])
+
+    async def _async_handle_profile(call: ServiceCall) -> ServiceResponse:
+        try:
+            reports = await async_profile(hass, call.data[ATTR_DURATION])
+        except ValueError as e:  # Another profiler is active
+            raise HomeAssistantError(f"Cannot start profiling: {e}") from e
+        _LOGGER.info("Profile written to %s", reports)
+        return reports
+
+    async def _async_handle_import_devices(call: ServiceCall) -> ServiceResponse:
+        # Relative paths are taken from the config directory
+        path = hass.config.path(call.data[ATTR_PATH])
+        try:
+            text = await hass.async_add_executor_job(_read_file, path)
+            devices = parse_import_file(path, text)
+        except (OSError, ValueError) as e:
+            raise HomeAssistantError(f"Cannot import {path}: {e}") from e
+        results = await async_import_devices(hass, devices)
+        return {"results": results}
+
+    if hass.services.has_service(DOMAIN, SERVICE_APPLY_GROUP):
+        return
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_GROUP,
+        _async_handle_apply_group,
+        schema=APPLY_GROUP_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TRACE_MODE,
+        _async_handle_set_trace_mode,
+        schema=SET_TRACE_MODE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_LOOP_WATCHDOG,
+        _async_handle_set_loop_watchdog,
+        schema=SET_LOOP_WATCHDOG_SCHEMA,
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_IMPORT_DEVICES,
+        _async_handle_import_devices,
+        schema=IMPORT_DEVICES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,129 @@
+"""Switch platform for Gree Climate V2 device features."""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .entity import GreeCompanionEntity, get_device
+from .schema import FEATURE_ANTI_DIRECT_BLOW
+
+if TYPE_CHECKING:
+    from .climate import GreeClimate
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GreeSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Gree feature switch."""
+
+    columns: Tuple[str, ...]  # Columns written together (all 1 or all 0)
+    state_attr: str  # GreeClimateState property holding the on/off state
+    feature: Optional[str] = None
+
+
+SWITCHES: Tuple[GreeSwitchEntityDescription, ...] = (
+    GreeSwitchEntityDescription(
+        key="lights",
+        name="Lights",
+        icon="mdi:lightbulb",
+        columns=("Lig",),
+        state_attr="lights_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="xfan",
+        name="XFan",
+        icon="mdi:fan-chevron-down",
+        columns=("Blo",),
+        state_attr="xfan_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="health",
+        name="Health",
+        icon="mdi:air-filter",
+        columns=("Health",),
+        state_attr="health_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="sleep",
+        name="Sleep",
+        icon="mdi:power-sleep",
+        columns=("SwhSlp", "SlpMod"),
+        state_attr="sleep_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="powersave",
+        name="Power save",
+        icon="mdi:leaf",
+        columns=("SvSt",),
+        state_attr="powersave_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="eightdegheat",
+        name="8°C heat",
+        icon="mdi:snowflake-thermometer",
+        columns=("StHt",),
+        state_attr="eightdegheat_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="air",
+        name="Air",
+        icon="mdi:air-purifier",
+        columns=("Air",),
+        state_attr="air_state",
+    ),
+    GreeSwitchEntityDescription(
+        key="anti_direct_blow",
+        name="Anti-direct blow",
+        icon="mdi:weather-windy",
+        columns=("AntiDirectBlow",),
+        state_attr="anti_direct_blow_state",
+        feature=FEATURE_ANTI_DIRECT_BLOW,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Gree feature switches from a config entry."""
+    device = get_device(hass, entry.entry_id)
+    async_add_entities(GreeSwitch(device, description) for description in SWITCHES)
+
+
+class GreeSwitch(GreeCompanionEntity, SwitchEntity):
+    """A device feature exposed as a switch."""
+
+    entity_description: GreeSwitchEntityDescription
+
+    def __init__(
+        self, device: "GreeClimate", description: GreeSwitchEntityDescription
+    ) -> None:
+        """Initialize the switch."""
+        super().__init__(
+            device, description, description.columns, description.feature
+        )
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return True if the feature is on, None if unknown."""
+        state = getattr(self._state, self.entity_description.state_attr)
+        if state == STATE_UNKNOWN:
+            return None
+        return state == STATE_ON
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the feature on."""
+        await self._async_send(dict.fromkeys(self.entity_description.columns, 1))
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the feature off."""
+        await self._async_send(dict.fromkeys(self.entity_description.columns, 0))
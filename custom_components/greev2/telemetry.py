@@ -0,0 +1,247 @@
+"""Per-device telemetry ring buffer and runtime statistics.
+
+Each polled state is kept as one sample in fixed-size `array` columns, so
+memory does not grow with uptime and nothing is read back from the
+recorder. Aggregates are updated as samples enter and leave the ring:
+
+*   runtime per HVAC mode and the number of starts, since HA started;
+*   powered time, covered time, starts and room/target delta-T sums over
+    the samples in the ring, from which the duty cycle, cycles per hour
+    and mean delta-T are read.
+
+The interval between two samples is charged to the earlier sample's state;
+intervals longer than `TELEMETRY_MAX_GAP` (the device was offline) are not
+charged at all.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, List, Optional
+
+from .const import TELEMETRY_CAPACITY, TELEMETRY_MAX_GAP
+from .schema import HVAC_MODE_ENCODE
+
+# Stored for an unknown Pow/Mod/WdSpd value
+_UNKNOWN: int = -1
+_NAN: float = float("nan")
+
+
+def _int_or_unknown(value: Optional[int]) -> int:
+    """Return `value` for an int8 column, or _UNKNOWN."""
+    return _UNKNOWN if value is None or not -128 <= value <= 127 else value
+
+
+class DeviceTelemetry:
+    """A ring of polled samples with incrementally updated aggregates.
+
+    Recording a sample is a fixed number of array writes and sum updates,
+    whatever the ring size.
+    """
+
+    __slots__ = (
+        "capacity",
+        "_max_gap",
+        "_ts",
+        "_pow",
+        "_mod",
+        "_set_tem",
+        "_tem_sen",
+        "_wd_spd",
+        "_covered_s",
+        "_on_s",
+        "_start",
+        "_delta",
+        "_head",
+        "_size",
+        "_window_covered_s",
+        "_window_on_s",
+        "_window_starts",
+        "_window_delta_sum",
+        "_window_delta_count",
+        "runtime_s",
+        "starts",
+    )
+
+    def __init__(
+        self, capacity: int = TELEMETRY_CAPACITY, max_gap: float = TELEMETRY_MAX_GAP
+    ) -> None:
+        """Initialize an empty ring of `capacity` samples."""
+        if capacity < 2:
+            raise ValueError("Telemetry capacity must be at least 2 samples")
+        self.capacity = capacity
+        self._max_gap = max_gap
+        # Polled values, one slot per sample
+        self._ts = array("d", [0.0]) * capacity
+        self._pow = array("b", [_UNKNOWN]) * capacity
+        self._mod = array("b", [_UNKNOWN]) * capacity
+        self._set_tem = array("d", [_NAN]) * capacity
+        self._tem_sen = array("d", [_NAN]) * capacity
+        self._wd_spd = array("b", [_UNKNOWN]) * capacity
+        # Contribution of each sample to the window sums. The interval
+        # leading up to the oldest sample lies outside the window, so its
+        # covered/on seconds and start are zeroed when it becomes oldest.
+        self._covered_s = array("d", [0.0]) * capacity
+        self._on_s = array("d", [0.0]) * capacity
+        self._start = array("b", [0]) * capacity
+        self._delta = array("d", [_NAN]) * capacity
+        self._head = 0  # Slot the next sample is written to
+        self._size = 0
+        self._window_covered_s = 0.0
+        self._window_on_s = 0.0
+        self._window_starts = 0
+        self._window_delta_sum = 0.0
+        self._window_delta_count = 0
+        self.runtime_s: List[float] = [0.0] * len(HVAC_MODE_ENCODE)
+        self.starts = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the ring."""
+        return self._size
+
+    def record(
+        self,
+        timestamp: float,
+        power: Optional[int],
+        mode: Optional[int],
+        set_tem: Optional[float],
+        tem_sen: Optional[float],
+        wd_spd: Optional[int],
+    ) -> None:
+        """Add a polled sample taken at monotonic `timestamp`."""
+        capacity = self.capacity
+        slot = self._head
+        if self._size == capacity:
+            self._evict(slot)
+        else:
+            self._size += 1
+
+        covered = on = 0.0
+        started = 0
+        power_now = _int_or_unknown(power)
+        if self._size > 1:
+            last = (slot - 1) % capacity
+            elapsed = timestamp - self._ts[last]
+            if 0.0 < elapsed <= self._max_gap:
+                covered = elapsed
+                if self._pow[last] == 1:
+                    on = elapsed
+                    last_mode = self._mod[last]
+                    if 0 <= last_mode < len(self.runtime_s):
+                        self.runtime_s[last_mode] += elapsed
+            if power_now == 1 and self._pow[last] == 0:
+                started = 1
+                self.starts += 1
+
+        delta = _NAN
+        if power_now == 1 and set_tem is not None and tem_sen is not None:
+            delta = tem_sen - set_tem
+            self._window_delta_sum += delta
+            self._window_delta_count += 1
+
+        self._ts[slot] = timestamp
+        self._pow[slot] = power_now
+        self._mod[slot] = _int_or_unknown(mode)
+        self._set_tem[slot] = _NAN if set_tem is None else set_tem
+        self._tem_sen[slot] = _NAN if tem_sen is None else tem_sen
+        self._wd_spd[slot] = _int_or_unknown(wd_spd)
+        self._covered_s[slot] = covered
+        self._on_s[slot] = on
+        self._start[slot] = started
+        self._delta[slot] = delta
+        self._window_covered_s += covered
+        self._window_on_s += on
+        self._window_starts += started
+        self._head = (slot + 1) % capacity
+
+    def _evict(self, slot: int) -> None:
+        """Remove the oldest sample (in `slot`) from the window sums."""
+        self._window_covered_s -= self._covered_s[slot]
+        self._window_on_s -= self._on_s[slot]
+        self._window_starts -= self._start[slot]
+        delta = self._delta[slot]
+        if not math.isnan(delta):
+            self._window_delta_sum -= delta
+            self._window_delta_count -= 1
+        # The next sample becomes the oldest: its interval leaves the window
+        oldest = (slot + 1) % self.capacity
+        self._window_covered_s -= self._covered_s[oldest]
+        self._window_on_s -= self._on_s[oldest]
+        self._window_starts -= self._start[oldest]
+        self._covered_s[oldest] = 0.0
+        self._on_s[oldest] = 0.0
+        self._start[oldest] = 0
+
+    # --- Derived values ---
+    def runtime_hours(self, mode: int) -> float:
+        """Return the hours run in `mode` (a raw `Mod` value)."""
+        return self.runtime_s[mode] / 3600.0
+
+    @property
+    def window_hours(self) -> float:
+        """Return the hours covered by the samples in the ring."""
+        return self._window_covered_s / 3600.0
+
+    @property
+    def duty_cycle(self) -> Optional[float]:
+        """Return the percentage of the window the unit was on."""
+        if self._window_covered_s <= 0.0:
+            return None
+        return 100.0 * self._window_on_s / self._window_covered_s
+
+    @property
+    def cycles_per_hour(self) -> Optional[float]:
+        """Return off-to-on transitions per hour over the window."""
+        if self._window_covered_s <= 0.0:
+            return None
+        return self._window_starts * 3600.0 / self._window_covered_s
+
+    @property
+    def mean_delta_t(self) -> Optional[float]:
+        """Return the mean room minus target temperature while on."""
+        if not self._window_delta_count:
+            return None
+        return self._window_delta_sum / self._window_delta_count
+
+    def samples(self) -> List[Dict[str, Any]]:
+        """Return the samples oldest first (for diagnostics)."""
+        first = (self._head - self._size) % self.capacity
+        result = []
+        for offset in range(self._size):
+            slot = (first + offset) % self.capacity
+            result.append(
+                {
+                    "ts": self._ts[slot],
+                    "Pow": None if self._pow[slot] == _UNKNOWN else self._pow[slot],
+                    "Mod": None if self._mod[slot] == _UNKNOWN else self._mod[slot],
+                    "SetTem": (
+                        None
+                        if math.isnan(self._set_tem[slot])
+                        else self._set_tem[slot]
+                    ),
+                    "TemSen": (
+                        None
+                        if math.isnan(self._tem_sen[slot])
+                        else self._tem_sen[slot]
+                    ),
+                    "WdSpd": (
+                        None if self._wd_spd[slot] == _UNKNOWN else self._wd_spd[slot]
+                    ),
+                }
+            )
+        return result
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the aggregates for diagnostics."""
+        return {
+            "samples": self._size,
+            "capacity": self.capacity,
+            "window_hours": round(self.window_hours, 3),
+            "duty_cycle_pct": self.duty_cycle,
+            "cycles_per_hour": self.cycles_per_hour,
+            "mean_delta_t": self.mean_delta_t,
+            "starts": self.starts,
+            "runtime_hours": {
+                str(mode): round(self.runtime_hours(index), 3)
+                for mode, index in HVAC_MODE_ENCODE.items()
+            },
+        }
@@ -0,0 +1,128 @@
+"""Opt-in event loop lag watchdog for the Gree API layer.
+
+A heartbeat is scheduled every `WATCHDOG_INTERVAL` seconds; when it runs
+late by more than `WATCHDOG_STALL_THRESHOLD` the loop was blocked. The lag
+is charged to every (device, op, phase) that ran since the previous
+heartbeat, so a unit whose calls block the loop rises to the top of
+`top_offenders()`. The API marks its phases with `enter`/`exit` only while
+a watchdog is installed (see `device_api.set_loop_watchdog`).
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .const import WATCHDOG_INTERVAL, WATCHDOG_STALL_THRESHOLD, WATCHDOG_TOP_OFFENDERS
+
+# Phases of an API call the watchdog attributes stalls to
+# Only synchronous sections are marked: a phase left open across an await
+# would be charged for whatever else blocked the loop meanwhile.
+PHASE_ENCODE = "encode"  # Building and encrypting the request
+PHASE_DECODE = "decode"  # Decrypting and parsing a received reply
+
+# Charged when the loop stalled while no API call was running
+UNATTRIBUTED = ("", "", "")
+
+StallKey = Tuple[str, str, str]  # (device, op, phase)
+
+
+@dataclass(slots=True)
+class StallStats:
+    """Loop stalls charged to one (device, op, phase)."""
+
+    stalls: int = 0
+    total_s: float = 0.0
+    worst_s: float = 0.0
+
+
+class LoopWatchdog:
+    """Measures event loop lag and attributes it to Gree API calls."""
+
+    def __init__(
+        self,
+        interval: float = WATCHDOG_INTERVAL,
+        threshold: float = WATCHDOG_STALL_THRESHOLD,
+    ) -> None:
+        """Initialize a stopped watchdog with no stalls recorded."""
+        self._interval = interval
+        self._threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+        self._active: Dict[StallKey, int] = {}  # Calls in progress per key
+        self._touched: Set[StallKey] = set()  # Ran since the last heartbeat
+        self.stats: Dict[StallKey, StallStats] = {}
+        self.heartbeats = 0
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the heartbeat on `loop`."""
+        self._loop = loop
+        self._schedule()
+
+    def stop(self) -> None:
+        """Stop the heartbeat; recorded stalls are kept."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self) -> None:
+        """Schedule the next heartbeat."""
+        assert self._loop is not None
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._heartbeat)
+
+    def _heartbeat(self) -> None:
+        """Charge any lag to the calls that ran since the last heartbeat."""
+        assert self._loop is not None
+        self.heartbeats += 1
+        lag = self._loop.time() - self._expected
+        if lag >= self._threshold:
+            for key in self._touched or (UNATTRIBUTED,):
+                stats = self.stats.get(key)
+                if stats is None:
+                    stats = self.stats[key] = StallStats()
+                stats.stalls += 1
+                stats.total_s += lag
+                stats.worst_s = max(stats.worst_s, lag)
+        # Calls still running are charged for the next interval as well
+        self._touched = {key for key, count in self._active.items() if count}
+        self._schedule()
+
+    def enter(self, device: str, op: str, phase: str) -> StallKey:
+        """Mark the start of a phase; pass the returned key to `exit`."""
+        key = (device, op, phase)
+        self._active[key] = self._active.get(key, 0) + 1
+        self._touched.add(key)
+        return key
+
+    def exit(self, key: StallKey) -> None:
+        """Mark the end of a phase started with `enter`."""
+        self._active[key] -= 1
+
+    def top_offenders(
+        self, device: Optional[str] = None, limit: int = WATCHDOG_TOP_OFFENDERS
+    ) -> List[Dict[str, Any]]:
+        """Return the phases charged with the most lag, worst first.
+
+        With `device`, only that device's phases are returned.
+        """
+        ranked = sorted(
+            (
+                (key, stats)
+                for key, stats in self.stats.items()
+                if device is None or key[0] == device
+            ),
+            key=lambda item: item[1].total_s,
+            reverse=True,
+        )
+        return [
+            {
+                "device": key[0] or None,
+                "op": key[1] or None,
+                "phase": key[2] or None,
+                "stalls": stats.stalls,
+                "total_ms": round(stats.total_s * 1000.0, 1),
+                "worst_ms": round(stats.worst_s * 1000.0, 1),
+            }
+            for key, stats in ranked[:limit]
+        ]
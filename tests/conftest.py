@@ -123,6 +123,7 @@ async def gree_climate_device(mock_hass: HomeAssistant) -> GreeClimateFactory:
         with patch("custom_components.greev2.climate.GreeDeviceApi") as mock_api_class:
             mock_api_instance = mock_api_class.return_value
             mock_api_instance._is_bound = True
+            mock_api_instance.needs_rebind = False
             mock_api_instance.bind_and_get_key = AsyncMock(return_value=True)
             # Default mock status - adjust in specific tests if needed
             # Use a realistic length based on initial fetch list in climate.py __init__
@@ -137,6 +138,8 @@ async def gree_climate_device(mock_hass: HomeAssistant) -> GreeClimateFactory:
             # Instantiate the device (uses DEFAULT_HORIZONTAL_SWING internally first)
             device = GreeClimate(hass=mock_hass, entry=mock_entry)
             device._api = mock_api_instance  # Assign mock API
+            # Entity is not added to a platform; record state writes instead
+            device.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
 
             # Override horizontal_swing if specified by the test AFTER init
             if horizontal_swing is not None:
@@ -8,6 +8,8 @@ from unittest.mock import patch, MagicMock, AsyncMock, ANY
 import pytest
 
 # Import the class to test
+from custom_components.greev2 import device_api
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
 from custom_components.greev2.device_api import GreeDeviceApi
 from custom_components.greev2.const import DEFAULT_TIMEOUT, GCM_DEFAULT_KEY
 
@@ -162,3 +164,19 @@ async def test_api_bind_and_get_key_failure(failure_mode: Exception) -> None:
             assert not api._is_bound
             assert api._encryption_key is None
             assert api._cipher is None
+
+
+async def test_api_bind_v1_decrypts_with_generic_key() -> None:
+    """Test a V1 bind reply is decrypted with the generic key on the wire."""
+    api = GreeDeviceApi(
+        host=MOCK_IP, port=MOCK_PORT, mac=MOCK_MAC, timeout=DEFAULT_TIMEOUT
+    )
+    # conftest replaces Crypto.Cipher.AES with a mock; use the module's real one
+    generic = device_api.AES.new(b"a3K8Bx%2r8Y7#xDh", device_api.AES.MODE_ECB)
+    inner = api._pad(json.dumps({"t": "bindok", "mac": MOCK_MAC, "key": "k" * 16}))
+    pack = device_api.base64.b64encode(generic.encrypt(inner.encode("utf8")))
+    reply = json.dumps({"t": "pack", "i": 1, "pack": pack.decode()}).encode()
+    api.set_transport(ReplayTransport([CapturedExchange(b"", reply, 0.0)]))
+
+    assert await api.bind_and_get_key() is True
+    assert api._encryption_key == b"k" * 16
@@ -0,0 +1,108 @@
+# pylint: disable=protected-access
+"""Tests for the pluggable JSON codec used on the device protocol path."""
+
+import json
+import os
+import timeit
+from typing import Iterator
+
+import pytest
+
+from custom_components.greev2 import device_api
+from custom_components.greev2.device_api import (
+    available_json_codecs,
+    select_json_codec,
+)
+
+STATUS_PACK = (
+    b'{"t":"dat","mac":"a1b2c3d4e5f6","r":200,'
+    b'"cols":["Pow","Mod","SetTem","WdSpd","Air","Blo","Health","SwhSlp","Lig",'
+    b'"SwingLfRig","SwUpDn","Quiet","Tur","StHt","TemUn","HeatCoolType","TemRec",'
+    b'"SvSt","SlpMod","TemSen"],'
+    b'"dat":[1,1,24,0,0,0,1,0,1,0,0,0,0,0,0,1,0,0,0,65]}'
+)
+ENVELOPE = (
+    b'{"t":"pack","i":0,"uid":0,"cid":"a1b2c3d4e5f6","tcid":"",'
+    b'"pack":"c29tZV9lbmNyeXB0ZWRfcGFjaw==","tag":"dGFn"}'
+)
+
+
+@pytest.fixture(params=available_json_codecs())
+def codec_name(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Activate each available codec in turn, restoring the default after."""
+    previous = device_api._CODEC.name
+    select_json_codec(request.param)
+    yield request.param
+    select_json_codec(previous)
+
+
+def test_codec_decodes_envelope_and_pack(codec_name: str) -> None:
+    """Test every backend decodes packets to the same plain dicts."""
+    assert device_api._CODEC.name == codec_name
+    envelope = device_api._CODEC.decode_envelope(memoryview(ENVELOPE))
+    pack = device_api._CODEC.decode_pack(memoryview(STATUS_PACK))
+
+    assert envelope == json.loads(ENVELOPE)
+    assert pack == json.loads(STATUS_PACK)
+
+
+def test_codec_accepts_loosely_typed_packets(codec_name: str) -> None:
+    """Test every backend accepts the same off-spec field types as json."""
+    envelope = b'{"t":"pack","i":"1","uid":"0","cid":123,"pack":"cGFjaw=="}'
+    pack = b'{"t":"dat","mac":112233445566,"r":"200","cols":["Pow"],"dat":["1"]}'
+
+    assert device_api._CODEC.decode_envelope(memoryview(envelope)) == json.loads(
+        envelope
+    )
+    assert device_api._CODEC.decode_pack(memoryview(pack)) == json.loads(pack)
+
+
+def test_codec_dumps_matches_command_format(codec_name: str) -> None:
+    """Test every backend produces the compact command JSON the device expects."""
+    command = {"opt": ["Pow", "SetTem"], "p": [1, 23], "t": "cmd"}
+
+    assert device_api._CODEC.dumps(command) == json.dumps(
+        command, separators=(",", ":")
+    )
+
+
+def test_codec_invalid_json_raises_json_error(codec_name: str) -> None:
+    """Test malformed input raises json.JSONDecodeError for every backend."""
+    with pytest.raises(json.JSONDecodeError):
+        device_api._CODEC.decode_pack(memoryview(b'{"t":"dat","dat":[1,'))
+
+
+def test_select_unknown_codec() -> None:
+    """Test selecting an unavailable backend raises ValueError."""
+    with pytest.raises(ValueError):
+        select_json_codec("does-not-exist")
+
+
+def test_default_codec_is_fastest_available() -> None:
+    """Test the preferred available backend is active by default."""
+    assert device_api._CODEC.name == available_json_codecs()[0]
+
+
+@pytest.mark.skipif(
+    not os.environ.get("GREEV2_BENCHMARK"), reason="set GREEV2_BENCHMARK=1 to run"
+)
+def test_codec_per_packet_decode_benchmark(
+    codec_name: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Report per-packet decode time (envelope + inner pack) per backend.
+
+    Opt-in and assertion free: it only prints the figures, so a loaded
+    machine cannot fail the suite.
+    """
+    codec = device_api._CODEC
+    envelope_view = memoryview(ENVELOPE)
+    pack_view = memoryview(STATUS_PACK)
+
+    def decode_packet() -> None:
+        codec.decode_envelope(envelope_view)
+        codec.decode_pack(pack_view)
+
+    rounds = 2000
+    per_packet = min(timeit.repeat(decode_packet, number=rounds, repeat=5)) / rounds
+    with capsys.disabled():
+        print(f"\n{codec_name}: {per_packet * 1e6:.2f} us/packet")
@@ -0,0 +1,113 @@
+# pylint: disable=protected-access
+"""Tests for column limit discovery and status request splitting."""
+
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+
+from .test_fetch_result import _make_api, _v2_datagram
+
+COLUMNS = ["Pow", "Mod", "SetTem", "WdSpd", "Lig"]
+VALUES = [1, 1, 24, 2, 1]
+
+
+def _reply(api, columns, values) -> CapturedExchange:
+    """Build a captured status reply."""
+    return CapturedExchange(
+        b"", _v2_datagram(api, {"t": "dat", "cols": columns, "dat": values}), 0.0
+    )
+
+
+async def test_truncated_reply_learns_limit_and_splits() -> None:
+    """Test a truncated reply caps the limit and the poll is re-split."""
+    api = _make_api(2)
+    transport = ReplayTransport(
+        [
+            _reply(api, COLUMNS, VALUES[:2]),  # Firmware cut the list at 2
+            _reply(api, COLUMNS[:2], VALUES[:2]),  # Probe confirms 2
+            _reply(api, COLUMNS[:2], VALUES[:2]),
+            _reply(api, COLUMNS[2:4], VALUES[2:4]),
+            _reply(api, COLUMNS[4:], VALUES[4:]),
+        ]
+    )
+    api.set_transport(transport)
+
+    assert await api.get_status(COLUMNS) == VALUES
+    assert api.column_limit == 2
+    assert transport.remaining == 0
+    assert api.metrics.status_failures == 0
+
+
+async def test_learned_limit_is_reused() -> None:
+    """Test later polls split straight away without probing again."""
+    api = _make_api(2)
+    api._column_limit = 3
+    api._column_limit_probed = True
+    transport = ReplayTransport(
+        [_reply(api, COLUMNS[:3], VALUES[:3]), _reply(api, COLUMNS[3:], VALUES[3:])]
+    )
+    api.set_transport(transport)
+
+    assert await api.get_status(COLUMNS) == VALUES
+    assert len(transport.requests) == 2
+
+
+async def test_rejected_request_probes_by_halving() -> None:
+    """Test a reply without dat is probed down to the largest working size."""
+    api = _make_api(2)
+    rejected = CapturedExchange(
+        b"", _v2_datagram(api, {"t": "dat", "r": 400}), 0.0
+    )
+    api.set_transport(
+        ReplayTransport(
+            [
+                _reply(api, ["Pow"], [1]),  # Device has answered before
+                rejected,  # 5 columns rejected
+                rejected,  # Probe 4: rejected
+                _reply(api, COLUMNS[:2], VALUES[:2]),  # Probe 2: ok
+                rejected,  # Probe 3: rejected
+                _reply(api, COLUMNS[:2], VALUES[:2]),
+                _reply(api, COLUMNS[2:4], VALUES[2:4]),
+                _reply(api, COLUMNS[4:], VALUES[4:]),
+            ]
+        )
+    )
+
+    assert await api.get_status(["Pow"]) == [1]
+    assert await api.get_status(COLUMNS) == VALUES
+    assert api.column_limit == 2
+
+
+async def test_timeout_does_not_probe() -> None:
+    """Test an unanswered request is not taken as a column limit."""
+    api = _make_api(2)
+    transport = ReplayTransport(
+        [_reply(api, ["Pow"], [1]), CapturedExchange(b"", None, 0.0)]
+    )
+    api.set_transport(transport)
+
+    assert await api.get_status(["Pow"]) == [1]
+    assert await api.get_status(COLUMNS) is None
+    assert api.column_limit is None
+    assert not api._column_limit_probed
+
+
+async def test_concurrent_requests_probe_on_their_own_reply() -> None:
+    """Test a timed-out request does not probe on another request's cut reply."""
+    api = _make_api(2)
+    api.set_transport(
+        ReplayTransport(
+            [
+                _reply(api, COLUMNS[:2], VALUES[:1]),  # First group cut at 1
+                CapturedExchange(b"", None, 0.0),  # Second group timed out
+            ]
+        )
+    )
+    probed = []
+
+    async def _probe(property_names, truncated_len=None):
+        probed.append((property_names, truncated_len))
+        return None
+
+    api.probe_column_limit = _probe  # type: ignore[method-assign]
+
+    assert await api.get_status_pipelined(COLUMNS[:4], 2) is None
+    assert probed == [(COLUMNS[:2], 1)]
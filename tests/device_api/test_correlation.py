@@ -0,0 +1,136 @@
+# pylint: disable=protected-access
+"""Tests for matching replies to outstanding requests (correlation layer)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.greev2 import device_api
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+
+from ..conftest import MOCK_IP, MOCK_PORT
+from .test_fetch_result import _make_api, _v2_datagram
+
+
+def _replaying_api(api, *replies):
+    """Route the API through a replay of the given replies (None: timeout)."""
+    transport = ReplayTransport([CapturedExchange(b"", reply, 0.0) for reply in replies])
+    api.set_transport(transport)
+    return transport
+
+
+async def test_late_reply_of_timed_out_request_is_stale() -> None:
+    """Test a late status reply is not decoded as the next request's answer."""
+    api = _make_api(2)
+    late = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    current = _v2_datagram(api, {"t": "dat", "cols": ["SetTem"], "dat": [24]})
+    _replaying_api(api, None, late, current)
+
+    assert await api.get_status(["Pow"]) is None  # Timed out
+    assert await api.get_status(["SetTem"]) == [24]
+
+    assert api.metrics.stale_replies == 1
+    assert api.metrics.timeouts == 1
+    assert api.metrics.responses == 1
+
+
+async def test_duplicate_reply_is_discarded() -> None:
+    """Test a repeated reply is counted and the command gets its own answer."""
+    api = _make_api(2)
+    status = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [0]})
+    ack = _v2_datagram(api, {"t": "res", "opt": ["Pow"], "p": [1], "val": [1]})
+    _replaying_api(api, status, status, ack)
+
+    assert await api.get_status(["Pow"]) == [0]
+    response = await api.send_command(["Pow"], [1])
+
+    assert response is not None and response["t"] == "res"
+    assert api.metrics.duplicate_replies == 1
+    assert api.metrics.stale_replies == 0
+
+
+async def test_command_reply_must_echo_its_columns() -> None:
+    """Test an acknowledgement for other columns does not resolve a command."""
+    api = _make_api(2)
+    other = _v2_datagram(api, {"t": "res", "opt": ["Lig"], "p": [1]})
+    ack = _v2_datagram(api, {"t": "res", "opt": ["Pow"], "p": [1]})
+    _replaying_api(api, other, ack)
+
+    response = await api.send_command(["Pow"], [1])
+
+    assert response is not None and response["opt"] == ["Pow"]
+    assert api.metrics.stale_replies == 1
+
+
+async def test_concurrent_requests_get_their_own_replies() -> None:
+    """Test replies arriving out of order are routed to the right request."""
+    api = _make_api(2)
+    first = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    second = _v2_datagram(api, {"t": "dat", "cols": ["SetTem"], "dat": [22]})
+    transport = _replaying_api(api, second, first)
+
+    results = await asyncio.gather(
+        api.get_status(["Pow"]), api.get_status(["SetTem"])
+    )
+
+    assert results == [[1], [22]]
+    assert len(transport.requests) == 2
+    assert api.metrics.stale_replies == 0
+    assert not api._pending
+
+
+async def test_datagram_from_other_host_is_ignored() -> None:
+    """Test the socket path drops datagrams that did not come from the device."""
+    api = _make_api(2)
+    datagram = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    senders = iter([("192.0.2.99", MOCK_PORT), (MOCK_IP, MOCK_PORT)])
+    loop = asyncio.get_running_loop()
+
+    async def recv_into(_sock, buffer):
+        buffer[: len(datagram)] = datagram
+        return len(datagram), next(senders)
+
+    with (
+        patch.object(device_api.socket, "socket", MagicMock()),
+        patch.object(loop, "sock_sendto", new_callable=AsyncMock),
+        patch.object(loop, "sock_recvfrom_into", side_effect=recv_into),
+    ):
+        assert await api.get_status(["Pow"]) == [1]
+
+    assert api.metrics.stale_replies == 1
+    assert api.metrics.responses == 1
+
+
+async def test_reply_without_columns_needs_an_unambiguous_request() -> None:
+    """Test a reply echoing no columns is not given to either of two requests."""
+    api = _make_api(2)
+    bare = _v2_datagram(api, {"t": "dat", "dat": [1]})
+    first = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [0]})
+    second = _v2_datagram(api, {"t": "dat", "cols": ["SetTem"], "dat": [22]})
+    _replaying_api(api, bare, first, second)
+
+    results = await asyncio.gather(
+        api.get_status(["Pow"]), api.get_status(["SetTem"])
+    )
+
+    assert results == [[0], [22]]
+    assert api.metrics.stale_replies == 1
+
+
+async def test_socket_reply_only_answers_its_own_request() -> None:
+    """Test a datagram from a request's socket never resolves another one."""
+    api = _make_api(2)
+    loop = asyncio.get_running_loop()
+    mine = device_api._PendingRequest(
+        loop.create_future(), "status", api._response_cipher(), None, "dat", ["Pow"]
+    )
+    other = device_api._PendingRequest(
+        loop.create_future(), "status", api._response_cipher(), None, "dat", ["Lig"]
+    )
+    api._pending.extend([other, mine])
+    bare = _v2_datagram(api, {"t": "dat", "dat": [1]})
+
+    with memoryview(bytearray(bare)) as datagram:
+        api._dispatch_reply(datagram, mine)
+
+    assert mine.reply.result()["dat"] == [1]
+    assert not other.reply.done()
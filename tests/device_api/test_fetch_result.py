@@ -0,0 +1,167 @@
+# pylint: disable=protected-access
+"""Tests for the GreeDeviceApi receive path (_fetch_result/_decode_response)."""
+
+import asyncio
+import base64
+import json
+import socket
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Import the class to test
+from custom_components.greev2 import device_api
+from custom_components.greev2.device_api import GreeDeviceApi
+from custom_components.greev2.const import DEFAULT_TIMEOUT
+
+# Import constants if needed for setup
+from ..conftest import MOCK_IP, MOCK_MAC, MOCK_PORT  # Adjusted import path
+
+DEVICE_KEY = b"0123456789abcdef"
+
+
+def _make_api(encryption_version: int) -> GreeDeviceApi:
+    """Create a bound API instance using the real cipher implementation."""
+    return GreeDeviceApi(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        mac=MOCK_MAC,
+        timeout=DEFAULT_TIMEOUT,
+        encryption_key=DEVICE_KEY,
+        encryption_version=encryption_version,
+    )
+
+
+def _v1_datagram(api: GreeDeviceApi, inner: dict) -> bytes:
+    """Build a V1 (ECB) response datagram as a device would send it."""
+    # conftest replaces Crypto.Cipher.AES with a mock; use the module's real one
+    cipher = device_api.AES.new(DEVICE_KEY, device_api.AES.MODE_ECB)
+    padded = api._pad(json.dumps(inner)).encode("utf8")
+    pack = base64.b64encode(cipher.encrypt(padded)).decode("utf-8")
+    return json.dumps({"t": "pack", "i": 0, "cid": MOCK_MAC, "pack": pack}).encode()
+
+
+def _v2_datagram(api: GreeDeviceApi, inner: dict) -> bytes:
+    """Build a V2 (GCM) response datagram as a device would send it."""
+    pack, tag = api._encrypt_gcm(DEVICE_KEY, json.dumps(inner))
+    return json.dumps(
+        {"t": "pack", "i": 0, "cid": MOCK_MAC, "pack": pack, "tag": tag}
+    ).encode()
+
+
+@pytest.mark.parametrize("encryption_version", [1, 2])
+async def test_decode_response_roundtrip(encryption_version: int) -> None:
+    """Test a device datagram is decrypted, unpadded and parsed."""
+    api = _make_api(encryption_version)
+    inner = {"t": "dat", "cols": ["Pow", "SetTem"], "dat": [1, 24]}
+    if encryption_version == 1:
+        datagram = _v1_datagram(api, inner)
+        cipher = api._cipher
+    else:
+        datagram = _v2_datagram(api, inner)
+        cipher = api._get_gcm_cipher(DEVICE_KEY)
+
+    assert api._decode_response(cipher, memoryview(datagram)) == inner
+
+
+async def test_decode_response_reuses_buffers() -> None:
+    """Test scratch buffers go back to the shared pools after decoding."""
+    api = _make_api(1)
+    datagram = _v1_datagram(api, {"t": "dat", "dat": [0]})
+    api._decode_response(api._cipher, memoryview(datagram))
+    plain_buffer = device_api._PLAINTEXT_BUFFERS.acquire()
+    device_api._PLAINTEXT_BUFFERS.release(plain_buffer)
+
+    api._decode_response(api._cipher, memoryview(datagram))
+
+    assert device_api._PLAINTEXT_BUFFERS.acquire() is plain_buffer
+    device_api._PLAINTEXT_BUFFERS.release(plain_buffer)
+
+
+async def test_decode_response_v2_bad_tag() -> None:
+    """Test a GCM tag mismatch raises ValueError."""
+    api = _make_api(2)
+    received = json.loads(_v2_datagram(api, {"t": "dat", "dat": [1]}))
+    received["tag"] = base64.b64encode(b"\x00" * 16).decode("utf-8")
+    datagram = json.dumps(received).encode()
+
+    with pytest.raises(ValueError):
+        api._decode_response(api._get_gcm_cipher(DEVICE_KEY), memoryview(datagram))
+
+
+async def test_fetch_result_receives_into_pooled_buffer() -> None:
+    """Test _fetch_result sends the payload and decodes the reply."""
+    api = _make_api(2)
+    inner = {"t": "res", "opt": ["Pow"], "p": [1]}
+    datagram = _v2_datagram(api, inner)
+    loop = asyncio.get_running_loop()
+
+    async def recv_into(_sock, buffer):
+        buffer[: len(datagram)] = datagram
+        return len(datagram), (MOCK_IP, MOCK_PORT)
+
+    with (
+        patch.object(device_api.socket, "socket", MagicMock()) as mock_socket,
+        patch.object(loop, "sock_sendto", new_callable=AsyncMock) as mock_sendto,
+        patch.object(loop, "sock_recvfrom_into", side_effect=recv_into),
+    ):
+        result = await api._fetch_result(
+            api._get_gcm_cipher(DEVICE_KEY), '{"t":"pack"}'
+        )
+
+    assert result == inner
+    assert api.metrics.requests == api.metrics.responses == 1
+    assert api.metrics.bytes_out == len(b'{"t":"pack"}')
+    assert api.metrics.bytes_in == len(datagram)
+    assert api.metrics.last_rtt_ms is not None
+    mock_sendto.assert_awaited_once_with(
+        mock_socket.return_value, b'{"t":"pack"}', (MOCK_IP, MOCK_PORT)
+    )
+    mock_socket.return_value.setblocking.assert_called_once_with(False)
+    mock_socket.return_value.close.assert_called_once()
+
+
+async def test_fetch_result_timeout() -> None:
+    """Test _fetch_result raises socket.timeout when no reply arrives."""
+    api = _make_api(1)
+    api._timeout = 0.01
+    loop = asyncio.get_running_loop()
+
+    async def never_replies(_sock, _buffer):
+        await asyncio.sleep(1)
+
+    with (
+        patch.object(device_api.socket, "socket", MagicMock()) as mock_socket,
+        patch.object(loop, "sock_sendto", new_callable=AsyncMock),
+        patch.object(loop, "sock_recvfrom_into", side_effect=never_replies),
+        pytest.raises(socket.timeout),
+    ):
+        await api._fetch_result(api._cipher, b"{}")
+
+    mock_socket.return_value.close.assert_called_once()
+    assert api.metrics.timeouts == 1
+    assert api.metrics.responses == 0
+
+
+async def test_fetch_result_counts_decrypt_failures() -> None:
+    """Test a reply that fails GCM verification is counted."""
+    api = _make_api(2)
+    received = json.loads(_v2_datagram(api, {"t": "dat", "dat": [1]}))
+    received["tag"] = base64.b64encode(b"\x00" * 16).decode("utf-8")
+    datagram = json.dumps(received).encode()
+    loop = asyncio.get_running_loop()
+
+    async def recv_into(_sock, buffer):
+        buffer[: len(datagram)] = datagram
+        return len(datagram), (MOCK_IP, MOCK_PORT)
+
+    with (
+        patch.object(device_api.socket, "socket", MagicMock()),
+        patch.object(loop, "sock_sendto", new_callable=AsyncMock),
+        patch.object(loop, "sock_recvfrom_into", side_effect=recv_into),
+        pytest.raises(ValueError),
+    ):
+        await api._fetch_result(api._get_gcm_cipher(DEVICE_KEY), b"{}")
+
+    assert api.metrics.decrypt_failures == 1
+    assert api.metrics.responses == 1
@@ -161,9 +161,9 @@ async def test_api_get_status_v2_success() -> None:
         (Exception("Generic simulated error"), None, 1),  # Generic error V1
         (
             None,
-            {"t": "statusok", "dat": [1]},
+            {"t": "statusok", "dat": [1, 0, 1]},
             1,
-        ),  # Response length mismatch V1 (request 2, get 1)
+        ),  # Response length mismatch V1 (request 2, get 3)
         (
             None,
             {"t": "statusok", "dat": "not_a_list"},
@@ -250,3 +250,43 @@ async def test_api_get_status_failure(
                 await api.get_status(properties_to_get)
             # Ensure fetch was still called
             mock_fetch_result.assert_awaited_once()
+
+
+async def test_api_get_status_reuses_cached_request_packet() -> None:
+    """Test repeated polls of the same columns reuse the encrypted request."""
+    # Arrange
+    api = GreeDeviceApi(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        mac=MOCK_MAC,
+        timeout=DEFAULT_TIMEOUT,
+        encryption_version=2,
+    )
+    api._is_bound = True
+    api._encryption_key = b"test_device_key1"
+    properties_to_get = ["Pow", "SetTem"]
+
+    with (
+        patch.object(api, "_fetch_result", new_callable=AsyncMock) as mock_fetch_result,
+        patch.object(
+            api, "_encrypt_gcm", wraps=api._encrypt_gcm
+        ) as mock_encrypt_gcm,
+    ):
+        mock_fetch_result.return_value = {"t": "dat", "dat": [1, 24]}
+
+        # Act
+        await api.get_status(properties_to_get)
+        await api.get_status(properties_to_get)
+        await api.get_status(["Pow"])
+
+        # Assert: one encryption per distinct column list, identical packets sent
+        assert mock_encrypt_gcm.call_count == 2
+        first_packet = mock_fetch_result.call_args_list[0].args[1]
+        assert mock_fetch_result.call_args_list[1].args[1] is first_packet
+        assert json.loads(first_packet)["tcid"] == MOCK_MAC
+
+        # A new key invalidates the cached packets
+        api.update_encryption_key(b"test_device_key2")
+        await api.get_status(properties_to_get)
+        assert mock_encrypt_gcm.call_count == 3
+        assert mock_fetch_result.call_args_list[3].args[1] != first_packet
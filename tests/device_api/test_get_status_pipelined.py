@@ -0,0 +1,76 @@
+# pylint: disable=protected-access
+"""Tests for pipelined status polling (get_status_pipelined)."""
+
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+
+from .test_fetch_result import _make_api, _v2_datagram
+
+COLUMNS = ["Pow", "Mod", "SetTem", "WdSpd", "Lig"]
+VALUES = [1, 1, 24, 2, 1]
+
+
+def _group_reply(api, start: int, end: int, rtt: float = 0.0) -> CapturedExchange:
+    """Build the captured reply for COLUMNS[start:end]."""
+    reply = _v2_datagram(
+        api, {"t": "dat", "cols": COLUMNS[start:end], "dat": VALUES[start:end]}
+    )
+    return CapturedExchange(b"", reply, rtt)
+
+
+async def test_groups_are_merged_in_column_order() -> None:
+    """Test out-of-order group replies are merged back in request order."""
+    api = _make_api(2)
+    transport = ReplayTransport(
+        [_group_reply(api, 4, 5), _group_reply(api, 0, 2), _group_reply(api, 2, 4)]
+    )
+    api.set_transport(transport)
+    landed = []
+
+    values = await api.get_status_pipelined(
+        COLUMNS, 2, lambda cols, dat: landed.append(cols)
+    )
+
+    assert values == VALUES
+    assert len(transport.requests) == 3
+    assert landed == [["Lig"], ["Pow", "Mod"], ["SetTem", "WdSpd"]]
+    assert api.metrics.stale_replies == 0
+
+
+async def test_failed_group_fails_the_poll() -> None:
+    """Test the poll fails if a group times out, after merging the rest."""
+    api = _make_api(2)
+    api.set_transport(
+        ReplayTransport([_group_reply(api, 0, 3), CapturedExchange(b"", None, 0.0)])
+    )
+    landed = []
+
+    values = await api.get_status_pipelined(
+        COLUMNS, 3, lambda cols, dat: landed.append(cols)
+    )
+
+    assert values is None
+    assert landed == [COLUMNS[0:3]]
+    assert api.metrics.status_failures == 1
+
+
+async def test_pipelined_poll_takes_one_round_trip() -> None:
+    """Test every group is sent before the first reply is consumed."""
+    api = _make_api(2)
+    transport = ReplayTransport(
+        [_group_reply(api, i, i + 1) for i in range(len(COLUMNS))]
+    )
+    replay_receive = transport.receive
+    sent_at_receive = []
+
+    async def receive(buffer, timeout):
+        nbytes = await replay_receive(buffer, timeout)
+        sent_at_receive.append(len(transport.requests))
+        return nbytes
+
+    transport.receive = receive  # type: ignore[method-assign]
+    api.set_transport(transport)
+
+    values = await api.get_status_pipelined(COLUMNS, 1)
+
+    assert values == VALUES
+    assert sent_at_receive == [len(COLUMNS)] * len(COLUMNS)
@@ -0,0 +1,115 @@
+# pylint: disable=protected-access
+"""Tests for the event loop lag watchdog and its API phase attribution."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+from custom_components.greev2 import device_api
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+from custom_components.greev2.watchdog import (
+    PHASE_DECODE,
+    PHASE_ENCODE,
+    LoopWatchdog,
+)
+
+from ..conftest import MOCK_MAC
+from .test_fetch_result import _make_api, _v2_datagram
+
+
+async def _next_heartbeat(watchdog: LoopWatchdog) -> None:
+    """Wait until the watchdog has checked the loop again."""
+    seen = watchdog.heartbeats
+    while watchdog.heartbeats == seen:
+        await asyncio.sleep(0.005)
+
+
+async def test_blocking_phase_is_charged_to_its_device() -> None:
+    """Test a blocking request build shows up as that device's offender."""
+    api = _make_api(2)
+    reply = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    api.set_transport(ReplayTransport([CapturedExchange(b"", reply, 0.0)]))
+    build_request = api._status_request
+
+    def blocking_build(columns):
+        time.sleep(0.05)  # A blocking call on the event loop
+        return build_request(columns)
+
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.03)
+    watchdog.start(asyncio.get_running_loop())
+    device_api.set_loop_watchdog(watchdog)
+    try:
+        with patch.object(api, "_status_request", side_effect=blocking_build):
+            assert await api.get_status(["Pow"]) == [1]
+        await _next_heartbeat(watchdog)
+    finally:
+        device_api.set_loop_watchdog(None)
+        watchdog.stop()
+
+    offenders = watchdog.top_offenders(MOCK_MAC)
+    encode = next(entry for entry in offenders if entry["phase"] == PHASE_ENCODE)
+    assert encode["op"] == "status"
+    assert encode["stalls"] >= 1
+    assert encode["worst_ms"] >= 20
+    assert all(entry["device"] == MOCK_MAC for entry in offenders)
+    # The reply was decoded in the same blocked interval and shares the charge
+    assert {entry["phase"] for entry in offenders} == {PHASE_ENCODE, PHASE_DECODE}
+
+
+async def test_stall_while_waiting_for_reply_is_not_charged() -> None:
+    """Test lag while a request only awaits its reply is not the device's.
+
+    The heartbeat is driven by hand on a fake clock, so only the stall
+    staged while the request waits can be charged.
+    """
+    api = _make_api(2)
+    reply = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    transport = ReplayTransport([CapturedExchange(b"", reply, 0.0)])
+    replay_receive = transport.receive
+    waiting = asyncio.Event()
+    answer = asyncio.Event()
+
+    async def held_receive(buffer, timeout):
+        waiting.set()
+        await answer.wait()
+        return await replay_receive(buffer, timeout)
+
+    transport.receive = held_receive  # type: ignore[method-assign]
+    api.set_transport(transport)
+    clock = MagicMock()
+    clock.time.return_value = 0.0
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.03)
+    watchdog.start(clock)  # Schedules nothing real: call_at is a mock
+    device_api.set_loop_watchdog(watchdog)
+    try:
+        request = asyncio.create_task(api.get_status(["Pow"]))
+        await waiting.wait()
+        clock.time.return_value = 0.01
+        watchdog._heartbeat()  # On time: clears the request's encode phase
+        clock.time.return_value = 0.07
+        watchdog._heartbeat()  # 50 ms late while the request only waits
+        stalls = watchdog.top_offenders()
+        answer.set()
+        assert await request == [1]
+    finally:
+        device_api.set_loop_watchdog(None)
+
+    assert [entry["device"] for entry in stalls] == [None]
+    assert stalls[0]["stalls"] == 1
+
+
+async def test_stall_outside_api_calls_is_unattributed() -> None:
+    """Test lag with no API call running is not blamed on a device."""
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.03)
+    watchdog.start(asyncio.get_running_loop())
+    try:
+        await _next_heartbeat(watchdog)
+        time.sleep(0.05)
+        await _next_heartbeat(watchdog)
+    finally:
+        watchdog.stop()
+
+    (offender,) = watchdog.top_offenders()
+    assert (offender["device"], offender["op"], offender["phase"]) == (None, None, None)
+    assert offender["stalls"] >= 1
+    assert watchdog.top_offenders(MOCK_MAC) == []
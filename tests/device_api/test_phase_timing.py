@@ -0,0 +1,52 @@
+# pylint: disable=protected-access
+"""Tests for the per-phase exchange timings (metrics.PhaseTimings)."""
+
+import pytest
+
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+from custom_components.greev2.metrics import PHASE_NAMES, PhaseTimings
+
+from .test_fetch_result import _make_api, _v1_datagram, _v2_datagram
+
+
+@pytest.mark.parametrize("encryption_version", [1, 2])
+async def test_status_poll_times_every_phase_once(encryption_version: int) -> None:
+    """Test one status exchange records each API phase exactly once."""
+    api = _make_api(encryption_version)
+    inner = {"t": "dat", "cols": ["Pow"], "dat": [1]}
+    build = _v1_datagram if encryption_version == 1 else _v2_datagram
+    api.set_transport(ReplayTransport([CapturedExchange(b"", build(api, inner), 0.0)]))
+    api.metrics.phases = PhaseTimings()  # Drop timings from building the reply
+
+    assert await api.get_status(["Pow"]) == [1]
+
+    timings = api.metrics.phases.as_dict()
+    counts = {name: timing["count"] for name, timing in timings.items()}
+    assert counts == {
+        "json_build": 1,
+        "encrypt": 1,
+        "base64": 2,  # Request encoding and reply decoding
+        "send": 1,
+        "wait": 1,
+        "decrypt": 1,
+        "json_parse": 1,
+        "apply": 0,  # Timed by the climate entity
+    }
+    assert all(timings[name]["total_ms"] >= 0 for name in PHASE_NAMES)
+    assert api.metrics.as_dict()["phases"] == timings
+
+
+async def test_cached_request_skips_encode_phases() -> None:
+    """Test a cached status packet costs no build or encryption time."""
+    api = _make_api(2)
+    reply = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    api.set_transport(ReplayTransport([CapturedExchange(b"", reply, 0.0)] * 2))
+    await api.get_status(["Pow"])
+    api.metrics.phases = PhaseTimings()
+
+    await api.get_status(["Pow"])
+
+    counts = api.metrics.phases.counts
+    assert counts[PHASE_NAMES.index("json_build")] == 0
+    assert counts[PHASE_NAMES.index("encrypt")] == 0
+    assert counts[PHASE_NAMES.index("decrypt")] == 1
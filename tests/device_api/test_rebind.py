@@ -0,0 +1,118 @@
+# pylint: disable=protected-access
+"""Tests for re-binding after the device key changed."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+from custom_components.greev2 import const, device_api
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+
+from ..conftest import MOCK_MAC
+from .test_fetch_result import _make_api
+
+NEW_KEY = b"fedcba9876543210"
+
+
+def _new_key_datagram(api, inner: dict) -> bytes:
+    """Build a reply encrypted with the key the unit got after a reset."""
+    pack, tag = api._encrypt_gcm(NEW_KEY, json.dumps(inner))
+    return json.dumps(
+        {"t": "pack", "i": 0, "cid": MOCK_MAC, "pack": pack, "tag": tag}
+    ).encode()
+
+
+def _replay(api, *replies) -> None:
+    """Answer the API's requests from the given replies (None: timeout)."""
+    api.set_transport(
+        ReplayTransport([CapturedExchange(b"", reply, 0.0) for reply in replies])
+    )
+
+
+def _bind_new_key(api):
+    """Build a bind_and_get_key stand-in for a reset unit."""
+
+    async def bind() -> bool:
+        api._encryption_key = NEW_KEY
+        api._is_bound = True
+        return True
+
+    return bind
+
+
+async def test_decrypt_failures_request_rebind_timeouts_do_not() -> None:
+    """Test only replies that fail to verify count towards a re-bind."""
+    api = _make_api(2)
+    stale = _new_key_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    _replay(api, None, None, stale, stale)
+
+    for _ in range(2):
+        assert await api.get_status(["Pow"]) is None  # Timeouts
+    assert not api.needs_rebind
+    for _ in range(2):
+        assert await api.get_status(["Pow"]) is None  # Tag verification fails
+    assert api.needs_rebind
+    assert api.metrics.decrypt_failures == 2
+
+
+async def test_malformed_envelopes_do_not_request_rebind() -> None:
+    """Test replies that are corrupt before decryption are not key failures."""
+    api = _make_api(2)
+    malformed = [
+        b"not json",
+        json.dumps({"t": "pack", "i": 0, "cid": MOCK_MAC}).encode(),  # No pack
+        json.dumps({"t": "pack", "pack": "abc", "tag": "AA=="}).encode(),  # Base64
+        json.dumps({"t": "pack", "pack": "AAAA"}).encode(),  # No tag
+    ]
+    _replay(api, *malformed)
+
+    for _ in malformed:
+        assert await api.get_status(["Pow"]) is None
+    assert len(malformed) >= const.REBIND_DECRYPT_FAILURES
+    assert not api.needs_rebind
+    assert api.metrics.malformed_replies == len(malformed)
+    assert api.metrics.decrypt_failures == 0
+
+
+async def test_rebind_switches_to_new_key() -> None:
+    """Test a re-bind fetches the new key and polling recovers."""
+    api = _make_api(2)
+    stale = _new_key_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    fresh = _new_key_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [0]})
+    _replay(api, stale, stale, fresh)
+    await api.get_status(["Pow"])
+    await api.get_status(["Pow"])
+
+    with patch.object(api, "bind_and_get_key", side_effect=_bind_new_key(api)):
+        assert await api.rebind()
+
+    assert api._encryption_key == NEW_KEY
+    assert not api.needs_rebind
+    assert await api.get_status(["Pow"]) == [0]
+    assert api.metrics.rebinds == 1
+
+
+async def test_failed_rebind_backs_off_and_keeps_key() -> None:
+    """Test failed re-binds keep the old key and are retried less often."""
+    api = _make_api(2)
+    old_key = api._encryption_key
+    bind = AsyncMock(return_value=False)
+    now = 1000.0
+
+    with (
+        patch.object(api, "bind_and_get_key", bind),
+        patch.object(device_api.time, "monotonic", side_effect=lambda: now),
+    ):
+        assert not await api.rebind()
+        assert api._is_bound and api._encryption_key == old_key
+
+        now += const.REBIND_BACKOFF_MIN - 1
+        assert not await api.rebind()  # Still backing off
+        assert bind.await_count == 1
+
+        now += 1
+        assert not await api.rebind()
+        assert bind.await_count == 2
+
+        now += const.REBIND_BACKOFF_MIN  # Backoff doubled: not yet
+        assert not await api.rebind()
+        assert bind.await_count == 2
@@ -0,0 +1,165 @@
+# pylint: disable=protected-access
+"""Tests for packet capture and replay (capture.py)."""
+
+import pytest
+
+from custom_components.greev2.capture import (
+    CAPTURE_MAGIC,
+    CapturedExchange,
+    ReplayTransport,
+    read_capture,
+    write_capture,
+)
+
+from .test_fetch_result import _make_api, _v2_datagram
+
+STATUS_COLS = ["Pow", "Mod", "SetTem"]
+
+
+def _status_reply(api, values) -> bytes:
+    """Build an encrypted status reply for STATUS_COLS."""
+    return _v2_datagram(api, {"t": "dat", "cols": STATUS_COLS, "dat": values})
+
+
+async def test_capture_roundtrip(tmp_path) -> None:
+    """Test a live capture saves and loads back byte for byte."""
+    api = _make_api(2)
+    reply = _status_reply(api, [1, 0, 24])
+    api.set_transport(
+        ReplayTransport(
+            [CapturedExchange(b"", reply, 0.02), CapturedExchange(b"", None, 0.0)]
+        )
+    )
+    recorder = api.start_capture()
+
+    assert await api.get_status(STATUS_COLS) == [1, 0, 24]
+    assert await api.get_status(STATUS_COLS) is None  # Timed out
+    assert api.stop_capture() is recorder
+
+    path = tmp_path / "unit.grcap"
+    recorder.save(path)
+    loaded = read_capture(path)
+
+    assert [exchange.reply for exchange in loaded] == [reply, None]
+    assert loaded[0].request == recorder.exchanges[0].request
+    assert loaded[0].request.startswith(b'{"cid":"app","i":0,"pack":"')
+
+
+def test_read_capture_rejects_other_files(tmp_path) -> None:
+    """Test a file without the capture header is rejected."""
+    path = tmp_path / "not_a_capture"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        read_capture(path)
+
+
+def test_read_capture_rejects_truncated_files(tmp_path) -> None:
+    """Test a file cut off inside a record header or reply is rejected."""
+    path = tmp_path / "unit.grcap"
+    write_capture(path, [CapturedExchange(b"request", b"reply", 0.01)])
+    data = path.read_bytes()
+
+    for cut in (len(CAPTURE_MAGIC) + 4, len(data) - 2):
+        path.write_bytes(data[:cut])
+        with pytest.raises(ValueError, match="truncated"):
+            read_capture(path)
+
+
+async def test_capture_keeps_stale_and_duplicate_datagrams(tmp_path) -> None:
+    """Test every datagram received is captured, not only the resolving one."""
+    api = _make_api(2)
+    stale = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [0]})
+    reply = _status_reply(api, [1, 0, 24])
+    api.set_transport(
+        ReplayTransport(
+            [
+                CapturedExchange(b"", stale, 0.01),
+                CapturedExchange(b"", reply, 0.01),
+                CapturedExchange(b"", reply, 0.01),  # Duplicate
+                CapturedExchange(b"", None, 0.0),
+            ]
+        )
+    )
+    recorder = api.start_capture()
+
+    assert await api.get_status(STATUS_COLS) == [1, 0, 24]
+    assert await api.get_status(["Pow"]) is None  # Only the duplicate came
+    api.stop_capture()
+
+    assert [exchange.reply for exchange in recorder.exchanges] == [
+        stale,
+        reply,
+        reply,
+        None,
+    ]
+    path = tmp_path / "unit.grcap"
+    recorder.save(path)
+    replayed = _make_api(2)
+    replayed.set_transport(ReplayTransport(read_capture(path)))
+
+    assert await replayed.get_status(STATUS_COLS) == [1, 0, 24]
+    assert await replayed.get_status(["Pow"]) is None
+    assert replayed.metrics.stale_replies == api.metrics.stale_replies == 1
+    assert replayed.metrics.duplicate_replies == api.metrics.duplicate_replies == 1
+
+
+async def test_replay_duplicates_and_reordering(tmp_path) -> None:
+    """Test duplicated and out-of-order replies reach the decoder as captured."""
+    api = _make_api(2)
+    first = _status_reply(api, [1, 0, 24])
+    second = _status_reply(api, [1, 1, 22])
+    path = tmp_path / "odd_firmware.grcap"
+    write_capture(
+        path,
+        [
+            CapturedExchange(b"", second, 0.01),  # Late reply overtook the first
+            CapturedExchange(b"", first, 0.01),
+            CapturedExchange(b"", first, 0.01),  # Duplicate
+            CapturedExchange(b"", None, 0.0),
+        ],
+    )
+    transport = ReplayTransport(read_capture(path))
+    api.set_transport(transport)
+
+    results = [await api.get_status(STATUS_COLS) for _ in range(4)]
+
+    assert results == [[1, 1, 22], [1, 0, 24], [1, 0, 24], None]
+    assert transport.remaining == 0
+    assert len(transport.requests) == 4
+    assert api.metrics.timeouts == 1
+
+
+async def test_replay_realtime_slow_responder() -> None:
+    """Test realtime replay times out replies slower than the API timeout."""
+    api = _make_api(2)
+    api._timeout = 0.05
+    reply = _status_reply(api, [0, 0, 20])
+    api.set_transport(
+        ReplayTransport(
+            [CapturedExchange(b"", reply, 0.01), CapturedExchange(b"", reply, 2.0)],
+            realtime=True,
+        )
+    )
+
+    assert await api.get_status(STATUS_COLS) == [0, 0, 20]
+    assert await api.get_status(STATUS_COLS) is None
+    assert api.metrics.timeouts == 1
+    assert api.metrics.last_rtt_ms >= 10
+
+
+async def test_replay_decode_benchmark() -> None:
+    """Test a long replayed capture decodes every exchange.
+
+    There is no network or hardware in the loop, so the same capture serves
+    as a decode-path benchmark under a profiler.
+    """
+    api = _make_api(2)
+    reply = _status_reply(api, [1, 0, 24])
+    rounds = 500
+    api.set_transport(ReplayTransport([CapturedExchange(b"", reply, 0.0)] * rounds))
+
+    for _ in range(rounds):
+        await api.get_status(STATUS_COLS)
+
+    assert api.metrics.responses == rounds
+    assert api.metrics.decrypt_failures == 0
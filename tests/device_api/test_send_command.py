@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 
 # Import the class to test
+from custom_components.greev2 import device_api
 from custom_components.greev2.device_api import GreeDeviceApi
 from custom_components.greev2.const import DEFAULT_TIMEOUT
 
@@ -234,8 +235,10 @@ async def test_api_send_command_failure(
         elif isinstance(failure_mode, TypeError) and "JSON serialization error" in str(
             failure_mode
         ):
-            # Patch json.dumps specifically for this case
-            json_dumps_patch = patch("json.dumps", side_effect=failure_mode)
+            # Patch the active JSON codec's serializer for this case
+            json_dumps_patch = patch.object(
+                device_api._CODEC, "dumps", side_effect=failure_mode
+            )
             json_dumps_patch.start()  # Manually start the patch
             # should_fetch_be_called = False # Logic handled below
         elif isinstance(failure_mode, Exception):
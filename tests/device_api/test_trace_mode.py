@@ -0,0 +1,81 @@
+# pylint: disable=protected-access
+"""Tests for the hot-path logging guard and structured trace mode."""
+
+import logging
+from unittest.mock import patch
+
+from custom_components.greev2 import device_api
+from custom_components.greev2.capture import CapturedExchange, ReplayTransport
+from custom_components.greev2.climate_helpers import GreeClimateState
+from custom_components.greev2.schema import INITIAL_OPTIONS
+
+from ..conftest import MOCK_MAC
+from .test_fetch_result import _make_api, _v2_datagram
+
+
+def _replaying_api(*replies):
+    """Create a V2 API that answers from the given replies."""
+    api = _make_api(2)
+    api.set_transport(
+        ReplayTransport([CapturedExchange(b"", reply, 0.0) for reply in replies])
+    )
+    return api
+
+
+async def test_exchange_makes_no_logging_calls_when_trace_off() -> None:
+    """Test a successful status exchange does not touch logging at all."""
+    api = _make_api(2)
+    reply = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    api = _replaying_api(reply)
+    device_api.set_trace_mode(False)
+
+    with (
+        patch.object(device_api, "_LOGGER") as mock_logger,
+        patch.object(device_api, "_TRACE_LOGGER") as mock_trace_logger,
+    ):
+        assert await api.get_status(["Pow"]) == [1]
+        assert await api.send_command(["Pow"], [1]) is None  # Capture exhausted
+
+    assert not mock_trace_logger.method_calls
+    # Only the failed command logs (at error level)
+    assert [call[0] for call in mock_logger.method_calls] == ["error"]
+
+
+def test_state_properties_do_not_log() -> None:
+    """Test temperature reads (done on every state write) never log."""
+    state = GreeClimateState(
+        INITIAL_OPTIONS, horizontal_swing=False, has_temp_sensor=True
+    )
+    state.apply_dat(["TemSen"], [64])
+    with patch("custom_components.greev2.climate_helpers._LOGGER") as mock_logger:
+        assert state.get_internal_temp() == 24.0
+    assert not mock_logger.method_calls
+
+
+async def test_trace_mode_emits_one_event_per_exchange(caplog) -> None:
+    """Test trace mode logs a structured event for each exchange."""
+    api = _make_api(2)
+    reply = _v2_datagram(api, {"t": "dat", "cols": ["Pow"], "dat": [1]})
+    api = _replaying_api(reply)
+
+    device_api.set_trace_mode(True)
+    try:
+        with caplog.at_level(logging.DEBUG, logger=device_api._TRACE_LOGGER.name):
+            await api.get_status(["Pow"])
+            await api.get_status(["Pow"])  # Capture exhausted: times out
+    finally:
+        device_api.set_trace_mode(False)
+
+    events = [
+        record.gree_trace for record in caplog.records if hasattr(record, "gree_trace")
+    ]
+    assert [event["outcome"] for event in events] == [
+        device_api.TRACE_OK,
+        device_api.TRACE_TIMEOUT,
+    ]
+    assert events[0]["device"] == MOCK_MAC
+    assert events[0]["op"] == "status"
+    assert events[0]["bytes_in"] == len(reply)
+    assert events[0]["rtt_ms"] is not None
+    assert events[1]["rtt_ms"] is None
+    assert not device_api.trace_mode_enabled()
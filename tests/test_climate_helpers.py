@@ -11,8 +11,10 @@ from homeassistant.components.climate import HVACMode
 from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNKNOWN
 
 # Assuming consts are accessible or mocked if needed
+from custom_components.greev2 import climate_helpers
 from custom_components.greev2.const import (
     # HVAC_MODES, # Removed unused
+    COLUMN_INDEX_CACHE_SIZE,
     FAN_MODES,
     SWING_MODES,
     PRESET_MODES,
@@ -20,7 +22,13 @@ from custom_components.greev2.const import (
 )
 
 # Import detect_features and GreeDeviceApi for testing
-from custom_components.greev2.climate_helpers import GreeClimateState, detect_features
+from custom_components.greev2.climate_helpers import (
+    COLUMN_INDEX,
+    GreeClimateState,
+    SensorAggregate,
+    TemperatureFilter,
+    detect_features,
+)
 from custom_components.greev2.device_api import GreeDeviceApi
 
 
@@ -115,6 +123,56 @@ def test_update_options_mismatched_lists(climate_state: GreeClimateState, caplog
     assert "Mismatched lengths for keys (2) and values (1)" in caplog.text
 
 
+def test_update_options_out_of_range(climate_state: GreeClimateState, caplog):
+    """Test values outside the int16 state layout are stored as None."""
+    climate_state.update_options({"TemSen": 70000})
+    assert "Could not convert value '70000' to int for key 'TemSen'" in caplog.text
+    assert climate_state._ac_options["TemSen"] is None
+
+
+def test_state_has_fixed_layout(climate_state: GreeClimateState):
+    """Test the state object uses slots and ignores unknown columns."""
+    assert not hasattr(climate_state, "__dict__")
+    climate_state.update_options({"NotAColumn": 1})
+    assert "NotAColumn" not in climate_state._ac_options
+
+
+def test_apply_dat_dirty_mask(climate_state: GreeClimateState):
+    """Test bulk apply returns and accumulates the changed-slot bitmask."""
+    assert climate_state.dirty_mask == 0  # Initial options are not dirty
+
+    changed = climate_state.apply_dat(["Pow", "Mod", "SetTem"], [1, 4, "22"])
+
+    # Pow stays 1, Mod 1 -> 4, SetTem 24 -> 22
+    assert changed == (1 << COLUMN_INDEX["Mod"]) | (1 << COLUMN_INDEX["SetTem"])
+    assert climate_state.dirty_mask == changed
+    assert climate_state.hvac_mode == HVACMode.HEAT
+    assert climate_state.target_temperature == 22.0
+
+    # Re-applying identical data changes nothing but keeps earlier dirty bits
+    assert climate_state.apply_dat(["Pow", "Mod", "SetTem"], [1, 4, 22]) == 0
+    assert climate_state.clear_dirty() == changed
+    assert climate_state.dirty_mask == 0
+
+
+def test_column_index_cache_is_bounded(climate_state: GreeClimateState):
+    """Test every column order applied does not grow the index cache forever."""
+    columns = list(COLUMN_INDEX)
+    for start in range(len(columns)):
+        for end in range(start + 1, len(columns) + 1):
+            climate_state.apply_dat(columns[start:end], [0] * (end - start))
+
+    assert 0 < len(climate_helpers._INDEX_CACHE) <= COLUMN_INDEX_CACHE_SIZE
+    assert climate_state.get_column(columns[-1]) == 0
+
+
+def test_update_options_returns_changed_fields(climate_state: GreeClimateState):
+    """Test update_options reports exactly the columns whose value changed."""
+    assert climate_state.update_options({"Pow": 1, "SetTem": 20}) == {"SetTem"}
+    assert climate_state.update_options(["SetTem", "Lig"], [20, 1]) == set()
+    assert climate_state.update_options(["Lig", "Mod"], [0, 4]) == {"Lig", "Mod"}
+
+
 # --- Property Tests ---
 
 
@@ -432,3 +490,75 @@ async def test_detect_features_api_error(caplog):
 
 
 # TODO: Adapt existing tests (test_properties.py, test_update.py, etc.) - This is partially done
+
+
+def test_temperature_filter_deadband_and_interval():
+    """Test noise is dropped and early changes wait for the interval."""
+    temp_filter = TemperatureFilter(deadband=0.2, min_interval=30, smoothing=0)
+    assert temp_filter.offer(21.0, 0)  # First reading is published at once
+    assert not temp_filter.offer(21.01, 1)  # Inside the deadband
+    assert not temp_filter.offer(21.5, 2)  # Too soon after the last publish
+    assert temp_filter.pending
+    assert temp_filter.retry_in(2) == 28
+    assert temp_filter.flush(30)
+    assert temp_filter.value == 21.5
+    assert not temp_filter.pending
+
+    assert not temp_filter.offer(22.0, 40)
+    assert not temp_filter.offer(21.6, 41)  # Back inside the deadband
+    assert not temp_filter.pending
+    assert not temp_filter.flush(60)
+    assert temp_filter.offer(None, 61)  # Unavailable is published at once
+    assert temp_filter.value is None
+
+
+def test_temperature_filter_smoothing():
+    """Test the moving average damps a single spike."""
+    temp_filter = TemperatureFilter(deadband=0.5, min_interval=0, smoothing=0.8)
+    temp_filter.offer(20.0, 0)
+    assert not temp_filter.offer(22.0, 1)  # Average moves to 20.4 only
+    assert temp_filter.offer(22.0, 2)  # 20.72: now past the deadband
+    assert temp_filter.value == 20.72
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"),
+    [("mean", 21.0), ("median", 20.5), ("min", 19.5), ("max", 23.0)],
+)
+def test_sensor_aggregate_methods(method: str, expected: float):
+    """Test each sensor keeps one reading and the aggregate follows updates."""
+    aggregate = SensorAggregate(method, max_age=0)
+    assert aggregate.value is None
+    aggregate.update("sensor.a", 19.0, 0)
+    aggregate.update("sensor.b", 20.5, 0)
+    aggregate.update("sensor.c", 23.0, 0)
+    aggregate.update("sensor.d", 21.5, 0)
+    aggregate.update("sensor.a", 19.5, 1)  # Replaces sensor.a's reading
+    aggregate.update("sensor.d", None, 1)  # Unavailable: dropped
+    assert len(aggregate) == 3
+    assert aggregate.value == pytest.approx(expected)
+
+
+def test_sensor_aggregate_drops_non_finite_readings():
+    """Test NaN and inf readings drop the sensor like an unavailable state."""
+    aggregate = SensorAggregate("max", max_age=0)
+    aggregate.update("sensor.a", 20.0, 0)
+    aggregate.update("sensor.b", 21.0, 0)
+    aggregate.update("sensor.b", float("nan"), 1)
+    aggregate.update("sensor.c", float("inf"), 1)
+    assert len(aggregate) == 1
+    assert aggregate.value == 20.0
+
+
+def test_sensor_aggregate_evicts_stale_readings():
+    """Test readings older than max_age leave the aggregate."""
+    aggregate = SensorAggregate("mean", max_age=60)
+    aggregate.update("sensor.a", 20.0, 0)
+    aggregate.update("sensor.b", 22.0, 30)
+    assert not aggregate.evict_stale(60)
+    assert aggregate.evict_stale(61)  # sensor.a has not reported since 0
+    assert aggregate.value == 22.0
+    aggregate.update("sensor.a", 18.0, 120)  # Also evicts sensor.b
+    assert aggregate.value == 18.0
+    with pytest.raises(ValueError):
+        SensorAggregate("mode", max_age=0)
@@ -0,0 +1,132 @@
+"""Tests for the companion switch/sensor/select entities."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.greev2.select import GreeHorizontalSwingSelect
+from custom_components.greev2.sensor import GreeInternalTemperatureSensor
+from custom_components.greev2.switch import SWITCHES, GreeSwitch
+
+from .conftest import GreeClimateFactory
+
+_SWITCH_DESCRIPTIONS = {description.key: description for description in SWITCHES}
+
+
+async def test_switch_reads_shared_state(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test switches decode their columns from the device state cache."""
+    device = gree_climate_device()
+    lights = GreeSwitch(device, _SWITCH_DESCRIPTIONS["lights"])
+    sleep = GreeSwitch(device, _SWITCH_DESCRIPTIONS["sleep"])
+
+    assert lights.is_on is None  # Not polled yet
+    device.ac_state.apply_dat(["Lig", "SwhSlp", "SlpMod"], [1, 1, 0])
+    assert lights.is_on is True
+    assert sleep.is_on is None  # Sleep columns disagree
+    device.ac_state.apply_dat(["SlpMod"], [1])
+    assert sleep.is_on is True
+    assert lights.unique_id == f"{device.unique_id}_lights"
+
+
+async def test_switch_writes_are_coalesced(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test writes from several companions go out as one command."""
+    device = gree_climate_device()
+    device._async_apply_command = AsyncMock()  # type: ignore[method-assign]
+    lights = GreeSwitch(device, _SWITCH_DESCRIPTIONS["lights"])
+    sleep = GreeSwitch(device, _SWITCH_DESCRIPTIONS["sleep"])
+
+    await asyncio.gather(lights.async_turn_on(), sleep.async_turn_off())
+
+    device._async_apply_command.assert_awaited_once_with(
+        {"Lig": 1, "SwhSlp": 0, "SlpMod": 0}
+    )
+
+    # A later write starts a new command
+    await lights.async_turn_off()
+    device._async_apply_command.assert_awaited_with({"Lig": 0})
+    assert device._async_apply_command.await_count == 2
+
+
+async def test_coalesced_command_survives_cancelled_starter(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test a joined write is sent when the write that started it is cancelled."""
+    device = gree_climate_device()
+    device._async_apply_command = AsyncMock()  # type: ignore[method-assign]
+    starter = asyncio.create_task(device.async_send_command({"Lig": 1}))
+    joined = asyncio.create_task(device.async_send_command({"SwhSlp": 0}))
+    await asyncio.sleep(0)  # Both are queued; the starter is in its yield
+
+    starter.cancel()
+    await joined
+
+    device._async_apply_command.assert_awaited_once_with({"Lig": 1, "SwhSlp": 0})
+    assert starter.cancelled()
+    assert device._command_flush is None
+
+    # The next write starts a new command instead of waiting on a stale one
+    await device.async_send_command({"Lig": 0})
+    device._async_apply_command.assert_awaited_with({"Lig": 0})
+
+
+async def test_companion_writes_state_only_for_its_columns(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test companions refresh only when one of their columns changed."""
+    device = gree_climate_device()
+    device._device_online = True
+    lights = GreeSwitch(device, _SWITCH_DESCRIPTIONS["lights"])
+    lights.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
+    device.async_add_listener(lights._handle_update)
+
+    device._async_notify_listeners()  # First notification refreshes all
+    assert lights.async_write_ha_state.call_count == 1
+
+    device.ac_state.apply_dat(["Health"], [1])
+    device._async_notify_listeners()
+    assert lights.async_write_ha_state.call_count == 1
+
+    device.ac_state.apply_dat(["Lig"], [1])
+    device._async_notify_listeners()
+    assert lights.async_write_ha_state.call_count == 2
+
+
+async def test_feature_gated_companions(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test feature-gated companions are only available once detected."""
+    device = gree_climate_device()
+    device._device_online = True
+    adb = GreeSwitch(device, _SWITCH_DESCRIPTIONS["anti_direct_blow"])
+    sensor = GreeInternalTemperatureSensor(device)
+
+    assert not adb.available
+    assert not sensor.available
+    device._has_anti_direct_blow = True
+    device._has_temp_sensor = True
+    device.ac_state._has_temp_sensor = True
+    device.ac_state.apply_dat(["TemSen"], [65])
+    assert adb.available
+    assert sensor.available
+    assert sensor.native_value == 25.0
+
+
+async def test_horizontal_swing_select(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test the horizontal swing select decodes and encodes SwingLfRig."""
+    device = gree_climate_device()
+    device._async_apply_command = AsyncMock()  # type: ignore[method-assign]
+    select = GreeHorizontalSwingSelect(device)
+
+    device.ac_state.apply_dat(["SwingLfRig"], [1])
+    assert select.current_option == "Full swing"
+
+    await select.async_select_option("Fixed in the middle position")
+    device._async_apply_command.assert_awaited_once_with({"SwingLfRig": 4})
+
+    await select.async_select_option("Sideways")
+    assert device._async_apply_command.await_count == 1
@@ -1,8 +1,10 @@
 """Test the Gree Climate V2 config flow."""
 
+import asyncio
 from unittest.mock import patch
 
-# import pytest # Removed unused import
+import pytest
+import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME
 from homeassistant.core import HomeAssistant
@@ -13,7 +15,14 @@ from homeassistant.helpers.device_registry import format_mac
 from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import-untyped]
 
 # Import custom exceptions and constants
-from custom_components.greev2.config_flow import CannotConnect, InvalidAuth
+from custom_components.greev2.config_flow import (
+    ENCRYPTION_AUTO,
+    CannotConnect,
+    InvalidAuth,
+    validate_input,
+)
+from custom_components.greev2.device_api import GreeDeviceApi
+from custom_components.greev2.discovery import DiscoveredDevice
 from custom_components.greev2.const import (
     DOMAIN,
     CONF_ENCRYPTION_VERSION,
@@ -186,6 +195,179 @@ async def test_user_step_already_configured(
     assert result2["reason"] == "already_configured"
 
 
+async def test_user_step_records_detected_version(hass: HomeAssistant) -> None:
+    """Test the entry stores the version that bound, not "auto"."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input = {**MOCK_USER_INPUT, CONF_ENCRYPTION_VERSION: ENCRYPTION_AUTO}
+
+    with patch(
+        "custom_components.greev2.config_flow.validate_input",
+        return_value={
+            "title": MOCK_USER_INPUT[CONF_NAME],
+            "cleaned_mac": MOCK_CLEANED_MAC,
+            "encryption_version": "1",
+        },
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result2["data"][CONF_ENCRYPTION_VERSION] == "1"
+
+
+def _fake_bind(outcomes):
+    """Build a bind_and_get_key replacement: version -> (delay, bound)."""
+    attempted = []
+
+    async def bind(api: GreeDeviceApi) -> bool:
+        version = api._encryption_version  # pylint: disable=protected-access
+        attempted.append(version)
+        delay, bound = outcomes[version]
+        await asyncio.sleep(delay)
+        if bound:
+            api._encryption_key = b"0123456789abcdef"  # pylint: disable=protected-access
+        return bound
+
+    return bind, attempted
+
+
+@pytest.mark.parametrize(
+    "outcomes, expected_version",
+    [
+        ({1: (0.05, True), 2: (0.0, True)}, "2"),  # V2 answers first
+        ({1: (0.01, True), 2: (0.0, False)}, "1"),  # V2 fails fast, V1 binds
+    ],
+)
+async def test_validate_input_races_versions(
+    hass: HomeAssistant, outcomes, expected_version
+) -> None:
+    """Test auto-detection keeps the first version that binds."""
+    bind, attempted = _fake_bind(outcomes)
+    data = {**MOCK_USER_INPUT, CONF_ENCRYPTION_VERSION: ENCRYPTION_AUTO}
+
+    with patch.object(GreeDeviceApi, "bind_and_get_key", autospec=True, side_effect=bind):
+        info = await validate_input(hass, data)
+
+    assert sorted(attempted) == [1, 2]
+    assert info["encryption_version"] == expected_version
+    assert info["cleaned_mac"] == MOCK_CLEANED_MAC
+
+
+async def test_validate_input_explicit_version(hass: HomeAssistant) -> None:
+    """Test a forced version binds only with that version."""
+    bind, attempted = _fake_bind({1: (0.0, True), 2: (0.0, True)})
+
+    with patch.object(GreeDeviceApi, "bind_and_get_key", autospec=True, side_effect=bind):
+        info = await validate_input(hass, MOCK_USER_INPUT)
+
+    assert attempted == [2]
+    assert info["encryption_version"] == "2"
+
+
+async def test_validate_input_no_version_binds(hass: HomeAssistant) -> None:
+    """Test InvalidAuth when neither version binds."""
+    bind, _ = _fake_bind({1: (0.0, False), 2: (0.0, False)})
+    data = {**MOCK_USER_INPUT, CONF_ENCRYPTION_VERSION: ENCRYPTION_AUTO}
+
+    with (
+        patch.object(GreeDeviceApi, "bind_and_get_key", autospec=True, side_effect=bind),
+        pytest.raises(InvalidAuth),
+    ):
+        await validate_input(hass, data)
+
+
+async def test_user_step_sweeps_range(hass: HomeAssistant) -> None:
+    """Test a CIDR range sweeps, lets the user pick a device and binds to it."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    found = [DiscoveredDevice("192.168.1.37", "c8f742000001", "Bedroom")]
+    user_input = {**MOCK_USER_INPUT, CONF_HOST: "192.168.1.0/24"}
+    del user_input[CONF_MAC]  # Not needed to sweep a range
+
+    with patch(
+        "custom_components.greev2.config_flow.async_sweep", return_value=found
+    ) as mock_sweep:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+        await hass.async_block_till_done()
+        result3 = await hass.config_entries.flow.async_configure(result["flow_id"])
+
+    assert result2["type"] == data_entry_flow.FlowResultType.SHOW_PROGRESS
+    assert mock_sweep.call_args.args[0] == "192.168.1.0/24"
+    assert result3["type"] == data_entry_flow.FlowResultType.FORM
+    assert result3["step_id"] == "pick_device"
+
+    with patch(
+        "custom_components.greev2.config_flow.validate_input",
+        return_value={"title": "Bedroom", "cleaned_mac": "c8:f7:42:00:00:01"},
+    ) as mock_validate:
+        result4 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_HOST: "192.168.1.37"}
+        )
+        await hass.async_block_till_done()
+
+    assert result4["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    validated = mock_validate.call_args.args[1]
+    assert validated[CONF_HOST] == "192.168.1.37"
+    assert validated[CONF_MAC] == "c8f742000001"
+
+
+async def test_user_step_sweep_finds_nothing(hass: HomeAssistant) -> None:
+    """Test the flow aborts when no device answers the sweep."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input = {**MOCK_USER_INPUT, CONF_HOST: "192.168.1.0/24"}
+
+    with patch("custom_components.greev2.config_flow.async_sweep", return_value=[]):
+        await hass.config_entries.flow.async_configure(result["flow_id"], user_input)
+        await hass.async_block_till_done()
+        result2 = await hass.config_entries.flow.async_configure(result["flow_id"])
+
+    assert result2["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result2["reason"] == "no_devices_found"
+
+
+async def test_user_step_rejects_large_range(hass: HomeAssistant) -> None:
+    """Test a range above the sweep limit is refused on the form."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    user_input = {**MOCK_USER_INPUT, CONF_HOST: "10.0.0.0/16"}
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input
+    )
+
+    assert result2["type"] == data_entry_flow.FlowResultType.FORM
+    assert result2["errors"] == {"base": "invalid_range"}
+
+
+async def test_user_step_requires_mac_for_single_host(hass: HomeAssistant) -> None:
+    """Test the MAC is optional on the form but needed to bind one host."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    mac_key = next(key for key in result["data_schema"].schema if key == CONF_MAC)
+    assert isinstance(mac_key, vol.Optional)
+    user_input = {**MOCK_USER_INPUT}
+    del user_input[CONF_MAC]
+
+    with patch("custom_components.greev2.config_flow.validate_input") as mock_validate:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+
+    assert result2["type"] == data_entry_flow.FlowResultType.FORM
+    assert result2["errors"] == {CONF_MAC: "mac_required"}
+    mock_validate.assert_not_called()
+
 # --- Options Flow Tests ---
 
 # Mock data for existing config entry
@@ -0,0 +1,75 @@
+# pylint: disable=protected-access
+"""Tests for the diagnostics platform."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.greev2.const import DEFAULT_TIMEOUT, DOMAIN
+from custom_components.greev2.device_api import GreeDeviceApi
+from custom_components.greev2.diagnostics import async_get_config_entry_diagnostics
+
+from .conftest import MOCK_IP, MOCK_MAC, MOCK_PORT, GreeClimateFactory
+
+
+def _bound_api() -> GreeDeviceApi:
+    """Create a bound V1 API with a mock cipher."""
+    api = GreeDeviceApi(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        mac=MOCK_MAC,
+        timeout=DEFAULT_TIMEOUT,
+        encryption_version=1,
+    )
+    api._is_bound = True
+    api._cipher = MagicMock(name="MockEcbCipher")
+    api._cipher.encrypt.return_value = b"encrypted_data"
+    return api
+
+
+async def test_trace_ring_buffer() -> None:
+    """Test exchanges are kept as request/response pairs in a bounded ring."""
+    api = _bound_api()
+    with patch.object(api, "_fetch_result", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = {"t": "dat", "dat": [1]}
+        await api.get_status(["Pow"])
+        mock_fetch.side_effect = ConnectionError("unreachable")
+        await api.send_command(["Lig"], [1])
+
+    trace = api.trace()
+    assert [entry["op"] for entry in trace] == ["status", "cmd"]
+    assert trace[0]["request"] == {"t": "status", "cols": ["Pow"]}
+    assert trace[0]["response"] == {"t": "dat", "dat": [1]}
+    assert trace[1]["request"]["opt"] == ["Lig"]
+    assert "unreachable" in trace[1]["error"]
+    assert trace[0]["time"] <= trace[1]["time"]
+
+    for _ in range(api._trace.maxlen + 5):
+        api._trace.append((0.0, "status", ("Pow",), {"dat": [0]}))
+    assert len(api.trace()) == api._trace.maxlen
+
+
+async def test_config_entry_diagnostics(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test the download holds redacted config, state, metrics and trace."""
+    device = gree_climate_device()
+    device._api = _bound_api()
+    device._has_temp_sensor = True
+    device.ac_state.apply_dat(["Pow", "SetTem"], [1, 23])
+    device._api._trace.append(
+        (1.0, "status", ("Pow",), {"t": "dat", "mac": MOCK_MAC, "dat": [1]})
+    )
+
+    entry = MagicMock()
+    entry.entry_id = "mock_entry_123"
+    entry.as_dict.return_value = {"data": {"mac": MOCK_MAC, "host": MOCK_IP}}
+    device.hass.data[DOMAIN] = {entry.entry_id: device}
+
+    diagnostics = await async_get_config_entry_diagnostics(device.hass, entry)
+
+    assert diagnostics["entry"]["data"]["mac"] == "**REDACTED**"
+    assert diagnostics["entry"]["data"]["host"] == MOCK_IP
+    assert diagnostics["device"]["features"]["temp_sensor"] is True
+    assert diagnostics["device"]["ac_options"]["SetTem"] == 23
+    assert diagnostics["metrics"]["requests"] == 0
+    assert diagnostics["telemetry"]["samples"] == 0
+    assert diagnostics["trace"][0]["response"]["mac"] == "**REDACTED**"
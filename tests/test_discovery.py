@@ -0,0 +1,109 @@
+"""Tests for the unicast discovery sweep (discovery.py)."""
+
+import asyncio
+import base64
+import json
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.greev2 import device_api, discovery
+from custom_components.greev2.discovery import (
+    DiscoveredDevice,
+    async_sweep,
+    parse_scan_reply,
+    sweep_hosts,
+)
+
+
+def _scan_reply(mac: str, name: str) -> bytes:
+    """Build a scan reply as a device sends it."""
+    inner = json.dumps({"t": "dev", "mac": mac, "name": name}).encode()
+    inner += b" " * (-len(inner) % 16)
+    # conftest replaces Crypto.Cipher.AES with a mock; device_api holds the real one
+    cipher = device_api.AES.new(
+        discovery._SCAN_KEY, device_api.AES.MODE_ECB  # pylint: disable=protected-access
+    )
+    pack = base64.b64encode(cipher.encrypt(inner)).decode()
+    return json.dumps({"t": "pack", "i": 1, "cid": mac, "pack": pack}).encode()
+
+
+class _FakeNetwork:
+    """Stands in for the datagram endpoint; listed hosts answer the scan."""
+
+    def __init__(self, replies: Dict[str, bytes]) -> None:
+        self.replies = replies
+        self.sent: List[Tuple[bytes, Tuple[str, int]]] = []
+        self.max_outstanding = 0
+        self.closed = False
+        self.protocol = None
+
+    async def create_endpoint(self, protocol_factory, local_addr):
+        """Replacement for loop.create_datagram_endpoint."""
+        self.protocol = protocol_factory()
+        return self, self.protocol
+
+    def sendto(self, data: bytes, addr: Tuple[str, int]) -> None:
+        """Record the probe and schedule the device's reply, if any."""
+        self.sent.append((data, addr))
+        self.max_outstanding = max(self.max_outstanding, len(self.protocol.waiters))
+        if addr[0] in self.replies:
+            asyncio.get_running_loop().call_soon(
+                self.protocol.datagram_received, self.replies[addr[0]], addr
+            )
+
+    def close(self) -> None:
+        """Record the endpoint was closed."""
+        self.closed = True
+
+
+def test_sweep_hosts_limits_range() -> None:
+    """Test ranges are expanded to hosts and oversized ones are refused."""
+    assert sweep_hosts("192.0.2.0/30") == ["192.0.2.1", "192.0.2.2"]
+    assert len(sweep_hosts("10.0.0.0/22")) == 1022
+    with pytest.raises(ValueError):
+        sweep_hosts("10.0.0.0/21")
+    with pytest.raises(ValueError):
+        sweep_hosts("not-a-range/24")
+
+
+def test_parse_scan_reply_falls_back_to_envelope() -> None:
+    """Test an undecodable pack still yields the envelope MAC."""
+    reply = json.dumps({"t": "pack", "cid": "aabbccddeeff", "pack": "!!"}).encode()
+    assert parse_scan_reply("192.0.2.9", reply) == DiscoveredDevice(
+        "192.0.2.9", "aabbccddeeff", "aabbccddeeff"
+    )
+    assert parse_scan_reply("192.0.2.9", b"garbage") is None
+
+
+async def test_sweep_finds_devices_with_bounded_concurrency() -> None:
+    """Test every address is probed once and answering devices are returned."""
+    network = _FakeNetwork(
+        {
+            "192.0.2.20": _scan_reply("c8f742000002", "Bedroom"),
+            "192.0.2.3": _scan_reply("c8f742000001", "Office"),
+        }
+    )
+    progress: List[float] = []
+    loop = asyncio.get_running_loop()
+
+    with (
+        patch.object(loop, "create_datagram_endpoint", network.create_endpoint),
+        patch.object(discovery, "AES", device_api.AES),
+    ):
+        found = await async_sweep(
+            "192.0.2.0/27", progress.append, concurrency=4, timeout=0.01
+        )
+
+    assert found == [
+        DiscoveredDevice("192.0.2.3", "c8f742000001", "Office"),
+        DiscoveredDevice("192.0.2.20", "c8f742000002", "Bedroom"),
+    ]
+    assert len(network.sent) == 30
+    assert {addr for _, addr in network.sent} == {
+        (f"192.0.2.{i}", 7000) for i in range(1, 31)
+    }
+    assert network.max_outstanding <= 4
+    assert progress[-1] == 1.0
+    assert network.closed
@@ -0,0 +1,171 @@
+"""Tests for the bulk import of legacy YAML and CSV device lists."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # type: ignore[import-untyped]
+
+from custom_components.greev2.config_flow import CannotConnect
+from custom_components.greev2.const import (
+    CONF_ENCRYPTION_VERSION,
+    DOMAIN,
+    SERVICE_IMPORT_DEVICES,
+)
+from custom_components.greev2.importer import (
+    IMPORT_ALREADY_CONFIGURED,
+    IMPORT_CANNOT_CONNECT,
+    IMPORT_CREATED,
+    IMPORT_INVALID,
+    async_import_devices,
+    parse_csv,
+    parse_import_file,
+    parse_legacy_yaml,
+)
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+LEGACY_YAML = """
+- platform: gree
+  name: First AC
+  host: 192.168.1.10
+  mac: 'aa:bb:cc:dd:ee:01'
+  port: 7000
+  timeout: 10
+  temp_sensor: sensor.first_room
+  lights: input_boolean.first_lights
+- platform: generic_thermostat
+  name: Not a Gree
+- platform: gree
+  name: Second AC
+  host: 192.168.1.11
+  mac: 'aa:bb:cc:dd:ee:02'
+  encryption_version: 2
+"""
+
+
+def test_parse_legacy_yaml_keeps_gree_blocks() -> None:
+    """Test only gree blocks are imported, with the entry fields only."""
+    assert parse_legacy_yaml(LEGACY_YAML) == [
+        {
+            "host": "192.168.1.10",
+            "mac": "aa:bb:cc:dd:ee:01",
+            "name": "First AC",
+            "temp_sensor": "sensor.first_room",
+        },
+        {
+            "host": "192.168.1.11",
+            "mac": "aa:bb:cc:dd:ee:02",
+            "name": "Second AC",
+            "encryption_version": "2",
+        },
+    ]
+    assert parse_legacy_yaml("climate:\n" + LEGACY_YAML.replace("\n", "\n  "))[0][
+        "host"
+    ] == "192.168.1.10"
+    with pytest.raises(ValueError):
+        parse_legacy_yaml("climate: [")
+
+
+def test_parse_csv() -> None:
+    """Test CSV rows become devices and blank cells are dropped."""
+    text = "host,mac,name,temp_sensor\n192.168.1.10,aabbccddee01,Office,\n"
+    assert parse_csv(text) == [
+        {"host": "192.168.1.10", "mac": "aabbccddee01", "name": "Office"}
+    ]
+    assert parse_import_file("units.CSV", text) == parse_csv(text)
+    with pytest.raises(ValueError):
+        parse_csv("ip;mac\n")
+
+
+async def test_import_binds_in_parallel_and_reports(hass: HomeAssistant) -> None:
+    """Test every device gets an outcome and binds run concurrently, capped."""
+    MockConfigEntry(domain=DOMAIN, unique_id="aa:bb:cc:dd:ee:03").add_to_hass(hass)
+    devices = [
+        {"host": f"192.168.1.{i}", "mac": f"aa:bb:cc:dd:ee:{i:02x}", "name": f"AC {i}"}
+        for i in range(1, 7)
+    ]
+    devices.append({"host": "192.168.1.99"})  # No MAC
+    devices.append({"host": "192.168.1.1", "mac": "aa:bb:cc:dd:ee:07"})  # Same host
+    devices.append({"host": "192.168.1.8", "mac": "AA:BB:CC:DD:EE:07"})  # Same MAC
+    in_flight = 0
+    max_in_flight = 0
+
+    async def bind(_hass, data):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if data["host"] in ("192.168.1.5", "192.168.1.8"):
+            raise CannotConnect
+        return {"title": data.get("name", data["host"]), "cleaned_mac": data["mac"], "encryption_version": "1"}
+
+    with (
+        patch("custom_components.greev2.importer.validate_input", side_effect=bind),
+        patch("custom_components.greev2.async_setup_entry", return_value=True),
+    ):
+        results = await async_import_devices(hass, devices, concurrency=2)
+        await hass.async_block_till_done()
+
+    assert results == {
+        "aa:bb:cc:dd:ee:01": IMPORT_CREATED,
+        "aa:bb:cc:dd:ee:02": IMPORT_CREATED,
+        "aa:bb:cc:dd:ee:03": IMPORT_ALREADY_CONFIGURED,
+        "aa:bb:cc:dd:ee:04": IMPORT_CREATED,
+        "aa:bb:cc:dd:ee:05": IMPORT_CANNOT_CONNECT,
+        "aa:bb:cc:dd:ee:06": IMPORT_CREATED,
+        "#7": IMPORT_INVALID,
+        "aa:bb:cc:dd:ee:07": IMPORT_CREATED,
+        "#9": IMPORT_CANNOT_CONNECT,
+    }
+    assert max_in_flight == 2
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert len(entries) == 6
+    created = next(entry for entry in entries if entry.unique_id == "aa:bb:cc:dd:ee:01")
+    assert created.title == "AC 1"
+    assert created.data[CONF_ENCRYPTION_VERSION] == "1"
+
+
+async def test_import_devices_service(hass: HomeAssistant, tmp_path) -> None:
+    """Test the import_devices service reads the file and reports per MAC."""
+    path = tmp_path / "units.csv"
+    path.write_text(
+        "host,mac,name\n"
+        "192.168.1.10,aa:bb:cc:dd:ee:01,Hall\n"
+        "192.168.1.10,aa:bb:cc:dd:ee:02,Hall again\n"
+        "192.168.1.12,,No MAC\n",
+        encoding="utf-8",
+    )
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    async def bind(_hass, data):
+        return {"title": data["name"], "cleaned_mac": data["mac"], "encryption_version": "2"}
+
+    with (
+        patch("custom_components.greev2.importer.validate_input", side_effect=bind),
+        patch("custom_components.greev2.async_setup_entry", return_value=True),
+    ):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_DEVICES,
+            {"path": str(path)},
+            blocking=True,
+            return_response=True,
+        )
+        await hass.async_block_till_done()
+
+    assert response == {
+        "results": {
+            "aa:bb:cc:dd:ee:01": IMPORT_CREATED,
+            "aa:bb:cc:dd:ee:02": IMPORT_CREATED,
+            "#3": IMPORT_INVALID,
+        }
+    }
+    assert {entry.title for entry in hass.config_entries.async_entries(DOMAIN)} == {
+        "Hall",
+        "Hall again",
+    }
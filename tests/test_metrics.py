@@ -0,0 +1,80 @@
+"""Unit tests for metrics.py."""
+
+from unittest.mock import patch
+
+from custom_components.greev2 import metrics as metrics_module
+from custom_components.greev2.metrics import PHASE_APPLY, PHASE_WAIT, TransportMetrics
+from custom_components.greev2.sensor import METRIC_SENSORS, GreeMetricSensor
+
+from .conftest import GreeClimateFactory
+
+
+def test_rtt_histogram_and_percentiles() -> None:
+    """Test RTTs land in the right buckets and percentiles use bucket bounds."""
+    metrics = TransportMetrics()
+    assert metrics.rtt_mean_ms is None
+    assert metrics.rtt_percentile_ms(50) is None
+
+    for rtt_s in (0.004, 0.008, 0.020, 0.030, 5.0):
+        metrics.record_sent(100)
+        metrics.record_received(200, rtt_s)
+
+    histogram = metrics.rtt_histogram()
+    assert histogram["<=5ms"] == 1
+    assert histogram["<=10ms"] == 1
+    assert histogram["<=25ms"] == 1
+    assert histogram["<=50ms"] == 1
+    assert histogram[">2500ms"] == 1
+    assert metrics.rtt_percentile_ms(50) == 25.0
+    assert metrics.rtt_percentile_ms(100) == 2500.0
+    assert metrics.last_rtt_ms == 5000.0
+    assert metrics.bytes_out == 500
+    assert metrics.bytes_in == 1000
+    assert metrics.packets_per_minute == 10
+
+
+async def test_metric_sensors_and_diagnostics(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test metric sensors are disabled-by-default diagnostics."""
+    device = gree_climate_device()
+    device._api.metrics = TransportMetrics()
+    device._api.metrics.record_timeout()
+    descriptions = {description.key: description for description in METRIC_SENSORS}
+
+    timeouts = GreeMetricSensor(device, descriptions["timeouts"])
+    assert timeouts.native_value == 1
+    assert timeouts.entity_registry_enabled_default is False
+    assert timeouts.available  # Readable even while the device is offline
+
+
+def test_phase_timings_mean() -> None:
+    """Test phase means are reported in microseconds and None until timed."""
+    metrics = TransportMetrics()
+    metrics.phases.record(PHASE_WAIT, 2_000_000)
+    metrics.phases.record(PHASE_WAIT, 4_000_000)
+
+    assert metrics.phases.mean_us(PHASE_WAIT) == 3000.0
+    assert metrics.phases.mean_us(PHASE_APPLY) is None
+    phases = metrics.as_dict()["phases"]
+    assert phases["wait"] == {"count": 2, "total_ms": 6.0, "mean_us": 3000.0}
+    assert phases["apply"]["mean_us"] is None
+
+
+def test_packet_rate_uses_a_fixed_window() -> None:
+    """Test the packet rate forgets old packets without storing each one."""
+    metrics = TransportMetrics()
+    now = 1000.0
+    with patch.object(metrics_module.time, "monotonic", side_effect=lambda: now):
+        for _ in range(500):
+            metrics.record_sent(10)
+        now += 30
+        metrics.record_received(10, 0.01)
+        assert metrics.packets_per_minute == 501
+
+        now += 31  # The first burst is now more than a minute old
+        assert metrics.packets_per_minute == 1
+        for _ in range(5000):
+            metrics.record_sent(10)
+            now += 0.1
+    assert len(metrics._rate_counts) == 60  # pylint: disable=protected-access
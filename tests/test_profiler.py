@@ -0,0 +1,41 @@
+"""Tests for the on-demand profiler behind greev2.profile."""
+
+import asyncio
+import pstats
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.greev2.climate_helpers import GreeClimateState
+from custom_components.greev2.profiler import async_profile
+from custom_components.greev2.schema import INITIAL_OPTIONS
+
+
+async def test_profile_writes_pstats_and_collapsed_stacks(
+    mock_hass: HomeAssistant, tmp_path
+) -> None:
+    """Test both reports are written and the stacks show integration code."""
+    mock_hass.config.path = lambda name: str(tmp_path / name)
+    state = GreeClimateState(
+        INITIAL_OPTIONS, horizontal_swing=False, has_temp_sensor=False
+    )
+
+    async def busy_integration() -> None:
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:
+            for _ in range(200):
+                state.apply_dat(["Pow", "SetTem"], [1, 24])
+                state.apply_dat(["Pow", "SetTem"], [0, 22])
+            await asyncio.sleep(0)
+
+    work = asyncio.create_task(busy_integration())
+    reports = await async_profile(mock_hass, 0.25)
+    await work
+
+    stats = pstats.Stats(reports["pstats"])
+    assert any(name == "apply_dat" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+    with open(reports["collapsed"], encoding="utf-8") as collapsed:
+        lines = collapsed.read().splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("climate_helpers:apply_dat" in line for line in lines)
@@ -0,0 +1,69 @@
+"""Unit tests for schema.py."""
+
+import pytest
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNKNOWN
+
+from custom_components.greev2.climate_helpers import COLUMN_INDEX
+from custom_components.greev2.const import FAN_MODES, HVAC_MODES
+from custom_components.greev2.schema import (
+    COLUMNS,
+    DEFAULT_FETCH_COLUMNS,
+    FAN_MODE_DECODE,
+    FAN_MODE_ENCODE,
+    FEATURE_COLUMNS,
+    HVAC_MODE_ENCODE,
+    INITIAL_OPTIONS,
+    STATE_COLUMNS,
+    decode_onoff,
+    encode_command,
+)
+
+
+def test_generated_tables_follow_schema() -> None:
+    """Test the fetch list, state layout and initial state come from COLUMNS."""
+    assert STATE_COLUMNS == tuple(spec.name for spec in COLUMNS)
+    assert list(COLUMN_INDEX) == list(STATE_COLUMNS)
+    # Feature-gated columns are only fetched after detection
+    assert set(FEATURE_COLUMNS.values()) == {"TemSen", "AntiDirectBlow", "LigSen"}
+    assert not set(FEATURE_COLUMNS.values()) & set(DEFAULT_FETCH_COLUMNS)
+    assert len(DEFAULT_FETCH_COLUMNS) == len(STATE_COLUMNS) - len(FEATURE_COLUMNS)
+    assert INITIAL_OPTIONS["Pow"] == 0
+    assert INITIAL_OPTIONS["SetTem"] is None
+
+
+def test_enum_tables_round_trip() -> None:
+    """Test enum decode tables match the mode lists and encode their inverse."""
+    assert FAN_MODE_DECODE == tuple(FAN_MODES)
+    assert HVAC_MODE_ENCODE[HVACMode.HEAT] == HVAC_MODES.index(HVACMode.HEAT)
+    # OFF, Turbo and Quiet are driven by other columns, not encodable directly
+    assert HVACMode.OFF not in HVAC_MODE_ENCODE
+    assert "Turbo" not in FAN_MODE_ENCODE
+    for label, raw in FAN_MODE_ENCODE.items():
+        assert FAN_MODE_DECODE[raw] == label
+
+
+@pytest.mark.parametrize(
+    "raw, expected", [(1, STATE_ON), (0, STATE_OFF), (None, STATE_UNKNOWN), (2, STATE_UNKNOWN)]
+)
+def test_decode_onoff(raw, expected) -> None:
+    """Test bool columns decode through the on/off table."""
+    assert decode_onoff(raw) == expected
+
+
+def test_encode_command_converts_values() -> None:
+    """Test commands encode bools and enum labels to raw ints."""
+    opt, p = encode_command({"Pow": True, "Mod": HVACMode.COOL, "SetTem": 24})
+    assert opt == ["Pow", "Mod", "SetTem"]
+    assert p == [1, 1, 24]
+
+
+def test_encode_command_drops_invalid(caplog) -> None:
+    """Test unknown columns and out-of-range values are dropped."""
+    opt, p = encode_command({"Bogus": 1, "SetTem": 99, "Lig": 1, "Mod": "Nope"})
+    assert opt == ["Lig"]
+    assert p == [1]
+    assert "Dropping unknown column 'Bogus'" in caplog.text
+    assert "Dropping out-of-range value '99' for column 'SetTem'" in caplog.text
+    assert "Dropping out-of-range value 'Nope' for column 'Mod'" in caplog.text
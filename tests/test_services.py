@@ -0,0 +1,125 @@
+"""Tests for the integration-level services."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.greev2.const import (
+    DOMAIN,
+    SERVICE_APPLY_GROUP,
+    SERVICE_IMPORT_DEVICES,
+    SERVICE_PROFILE,
+    SERVICE_SET_LOOP_WATCHDOG,
+    SERVICE_SET_TRACE_MODE,
+)
+from custom_components.greev2.services import (
+    APPLY_GROUP_SCHEMA,
+    RESULT_FAILED,
+    RESULT_NOT_FOUND,
+    RESULT_OK,
+    RESULT_TIMEOUT,
+    async_apply_group,
+)
+
+from .conftest import GreeClimateFactory
+
+
+async def test_setup_registers_services(hass: HomeAssistant) -> None:
+    """Test setting up the integration registers every service."""
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    for service in (
+        SERVICE_APPLY_GROUP,
+        SERVICE_SET_TRACE_MODE,
+        SERVICE_SET_LOOP_WATCHDOG,
+        SERVICE_PROFILE,
+        SERVICE_IMPORT_DEVICES,
+    ):
+        assert hass.services.has_service(DOMAIN, service), service
+
+
+def _register(hass: HomeAssistant, device, entity_id: str, entry_id: str) -> None:
+    """Register a device the way the climate platform does."""
+    device.entity_id = entity_id
+    hass.data.setdefault(DOMAIN, {})[entry_id] = device
+
+
+async def test_apply_group_fans_out_concurrently(
+    mock_hass: HomeAssistant, gree_climate_device: GreeClimateFactory
+) -> None:
+    """Test all devices get the command at once and report per-device acks."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_ack(opt, p):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"opt": opt, "p": p, "r": 200}
+
+    devices = []
+    for i in range(3):
+        device = gree_climate_device()
+        device._api.send_command = AsyncMock(side_effect=slow_ack)
+        _register(mock_hass, device, f"climate.unit_{i}", f"entry_{i}")
+        devices.append(device)
+    devices[2]._api.send_command = AsyncMock(return_value=None)
+
+    results = await async_apply_group(
+        mock_hass,
+        ["climate.unit_0", "climate.unit_1", "climate.unit_2", "climate.missing"],
+        {"Pow": 0},
+        timeout=1.0,
+    )
+
+    assert results == {
+        "climate.unit_0": RESULT_OK,
+        "climate.unit_1": RESULT_OK,
+        "climate.unit_2": RESULT_FAILED,
+        "climate.missing": RESULT_NOT_FOUND,
+    }
+    assert max_in_flight == 2  # Both slow devices were in flight together
+    devices[0]._api.send_command.assert_awaited_once_with(["Pow"], [0])
+    devices[0]._api.get_status.assert_not_awaited()  # No status read first
+    assert devices[0].ac_state.get_column("Pow") == 0
+
+
+async def test_apply_group_deadline(
+    mock_hass: HomeAssistant, gree_climate_device: GreeClimateFactory
+) -> None:
+    """Test devices that miss the shared deadline are reported as timed out."""
+
+    async def never_acks(opt, p):
+        await asyncio.sleep(10)
+
+    fast = gree_climate_device()
+    fast._api.send_command = AsyncMock(return_value={"r": 200})
+    slow = gree_climate_device()
+    slow._api.send_command = AsyncMock(side_effect=never_acks)
+    _register(mock_hass, fast, "climate.fast", "entry_fast")
+    _register(mock_hass, slow, "climate.slow", "entry_slow")
+
+    results = await async_apply_group(
+        mock_hass, ["climate.fast", "climate.slow"], {"Pow": 1}, timeout=0.05
+    )
+
+    assert results == {"climate.fast": RESULT_OK, "climate.slow": RESULT_TIMEOUT}
+
+
+def test_apply_group_schema() -> None:
+    """Test opt and p must pair up."""
+    data = APPLY_GROUP_SCHEMA(
+        {"entity_id": ["climate.a", "climate.b"], "opt": ["Pow"], "p": ["0"]}
+    )
+    assert data["p"] == [0]
+    assert data["timeout"] == 5.0
+    with pytest.raises(vol.Invalid):
+        APPLY_GROUP_SCHEMA({"entity_id": "climate.a", "opt": ["Pow", "Mod"], "p": [1]})
@@ -0,0 +1,86 @@
+# pylint: disable=protected-access
+"""Unit tests for telemetry.py."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.greev2.schema import HVAC_MODE_ENCODE
+from custom_components.greev2.sensor import TELEMETRY_SENSORS, GreeTelemetrySensor
+from custom_components.greev2.telemetry import DeviceTelemetry
+
+from .conftest import GreeClimateFactory
+
+COOL = HVAC_MODE_ENCODE["cool"]
+HEAT = HVAC_MODE_ENCODE["heat"]
+
+
+def test_runtime_cycles_and_delta_t() -> None:
+    """Test intervals are charged to the earlier sample's state."""
+    telemetry = DeviceTelemetry(capacity=10, max_gap=120)
+    assert telemetry.duty_cycle is None
+    assert telemetry.cycles_per_hour is None
+
+    telemetry.record(0, 1, COOL, 24, 26, 1)
+    telemetry.record(60, 1, COOL, 24, 25, 1)
+    telemetry.record(120, 0, COOL, 24, 27, 0)
+    telemetry.record(180, 1, HEAT, 22, 20, 2)
+    telemetry.record(1000, 1, HEAT, 22, 21, 2)  # Offline gap: not charged
+
+    assert telemetry.runtime_s[COOL] == 120
+    assert telemetry.runtime_s[HEAT] == 0
+    assert telemetry.starts == 1
+    assert telemetry.window_hours == pytest.approx(180 / 3600)
+    assert telemetry.duty_cycle == pytest.approx(100 * 120 / 180)
+    assert telemetry.cycles_per_hour == pytest.approx(3600 / 180)
+    # Room minus target while on: 2, 1, -2, -1
+    assert telemetry.mean_delta_t == pytest.approx(0)
+
+
+def test_ring_is_fixed_size_and_window_sums_follow_it() -> None:
+    """Test evicted samples leave the window while lifetime totals stay."""
+    telemetry = DeviceTelemetry(capacity=3, max_gap=120)
+    for step, power in enumerate((0, 1, 1, 0, 0, 1, 1)):
+        telemetry.record(step * 60, power, COOL, 24, 25, 1)
+
+    assert len(telemetry) == 3
+    assert [sample["ts"] for sample in telemetry.samples()] == [240, 300, 360]
+    assert telemetry.starts == 2
+    assert telemetry.runtime_s[COOL] == 3 * 60
+    # The window spans 240..360; the unit was started at 300
+    assert telemetry.window_hours == pytest.approx(120 / 3600)
+    assert telemetry.duty_cycle == pytest.approx(50)
+    assert telemetry.cycles_per_hour == pytest.approx(3600 / 120)
+    assert telemetry.mean_delta_t == pytest.approx(1)
+
+
+@patch(
+    "custom_components.greev2.climate.detect_features",
+    return_value=(False, False, False, []),
+)
+async def test_poll_records_sample_for_sensors(
+    mock_detect_features: AsyncMock,
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test each successful poll adds a sample the sensors read from."""
+    device = gree_climate_device()
+    columns = list(device._options_to_fetch)
+    mock_detect_features.return_value = (False, False, False, columns)
+    values = {"Pow": 1, "Mod": COOL, "SetTem": 24, "WdSpd": 1}
+    device._api.get_status = AsyncMock(  # type: ignore[method-assign]
+        return_value=[values.get(column, 0) for column in columns]
+    )
+    device._api._is_bound = True
+
+    with patch("custom_components.greev2.climate.time.monotonic", return_value=0.0):
+        await device.async_update()
+    with patch("custom_components.greev2.climate.time.monotonic", return_value=60.0):
+        await device.async_update()
+
+    assert len(device.telemetry) == 2
+    assert device.telemetry.samples()[-1]["SetTem"] == 24
+    descriptions = {description.key: description for description in TELEMETRY_SENSORS}
+    runtime = GreeTelemetrySensor(device, descriptions["runtime_cool"])
+    assert runtime.native_value == pytest.approx(60 / 3600)
+    assert runtime.entity_registry_enabled_default is False
+    assert GreeTelemetrySensor(device, descriptions["duty_cycle"]).native_value == 100
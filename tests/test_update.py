@@ -1,5 +1,7 @@
 # import json # Removed unused
 # import socket  # Removed unused
+import asyncio
+from datetime import datetime
 from typing import Any, Dict, List # Removed Optional
 from unittest.mock import ANY, MagicMock, patch, AsyncMock  # Removed call
 
@@ -8,15 +10,16 @@ from _pytest.logging import LogCaptureFixture
 from homeassistant.components.climate import HVACMode
 # Removed unused UnitOfTemperature, ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.const import STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 # from homeassistant.helpers.entity import Entity # Removed unused
 # from unittest.mock import Mock # Removed unused
 
 from custom_components.greev2.climate import GreeClimate
+from custom_components.greev2.climate_helpers import TemperatureFilter
 
 # Import detect_features for patching
 # from custom_components.greev2.climate_helpers import detect_features # Removed unused
-from custom_components.greev2.const import FAN_MODES, SWING_MODES
+from custom_components.greev2.const import CONF_ENCRYPTION_KEY, FAN_MODES, SWING_MODES
 
 # Import type alias from conftest
 from .conftest import GreeClimateFactory
@@ -390,3 +393,238 @@ async def test_update_gcm_key_retrieval_and_update(
 
 
 # External temperature sensor tests removed
+
+
+# --- Change Detection Tests ---
+
+
+@patch("custom_components.greev2.climate.detect_features")
+async def test_poll_writes_state_only_on_change(
+    mock_detect_features: AsyncMock,
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test the poll timer only writes HA state when visible state changed."""
+    device: GreeClimate = gree_climate_device()
+    initial_options = list(device._options_to_fetch)
+    mock_detect_features.return_value = (False, False, False, initial_options)
+    status: Dict[str, Any] = {key: 0 for key in initial_options}
+    status.update({"Pow": 1, "Mod": 1, "SetTem": 24})
+    device._api.get_status = AsyncMock(  # type: ignore[method-assign]
+        return_value=[status[key] for key in initial_options]
+    )
+
+    # First poll always writes (initial sync)
+    await device._async_poll(datetime.now())
+    assert device.async_write_ha_state.call_count == 1  # type: ignore[attr-defined]
+
+    # Identical reply: nothing to write
+    await device._async_poll(datetime.now())
+    assert device.async_write_ha_state.call_count == 1  # type: ignore[attr-defined]
+
+    # A column not shown by the climate entity changes: still nothing to write
+    status["Health"] = 1
+    device._api.get_status.return_value = [status[key] for key in initial_options]
+    await device._async_poll(datetime.now())
+    assert device.async_write_ha_state.call_count == 1  # type: ignore[attr-defined]
+
+    # Target temperature changes: state is written
+    status["SetTem"] = 22
+    device._api.get_status.return_value = [status[key] for key in initial_options]
+    await device._async_poll(datetime.now())
+    assert device.async_write_ha_state.call_count == 2  # type: ignore[attr-defined]
+    assert device.target_temperature == 22.0
+
+    # Device goes offline: availability change is written
+    device._max_online_attempts = 1
+    device._api.get_status.side_effect = ConnectionError("Simulated failure")
+    await device._async_poll(datetime.now())
+    assert device.available is False
+    assert device.async_write_ha_state.call_count == 3  # type: ignore[attr-defined]
+
+
+@patch("custom_components.greev2.climate.detect_features")
+async def test_poll_skipped_while_previous_update_runs(
+    mock_detect_features: AsyncMock,
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test a poll tick does not start while the previous poll is pending."""
+    device: GreeClimate = gree_climate_device()
+    columns = list(device._options_to_fetch)
+    mock_detect_features.return_value = (False, False, False, columns)
+    reply: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def _get_status(_columns: List[str]) -> List[Any]:
+        return await reply
+
+    device._api.get_status = AsyncMock(  # type: ignore[method-assign]
+        side_effect=_get_status
+    )
+
+    first = asyncio.create_task(device._async_poll(datetime.now()))
+    await asyncio.sleep(0)
+    assert device._api.get_status.await_count == 1  # First poll waits for reply
+
+    # Next tick fires meanwhile; it must return without waiting for the reply
+    await asyncio.wait_for(device._async_poll(datetime.now()), 1)
+    assert device._api.get_status.await_count == 1
+
+    reply.set_result([0] * len(columns))
+    await first
+    await device._async_poll(datetime.now())  # Polling resumes afterwards
+    assert device._api.get_status.await_count == 2
+
+
+async def test_temp_sensor_change_writes_only_on_new_value(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test the external temp sensor listener skips writes for repeated values."""
+    device: GreeClimate = gree_climate_device()
+    device._temp_sensor_entity_ids = ["sensor.room_temp"]
+
+    def _event(value: str) -> MagicMock:
+        event = MagicMock()
+        event.data = {
+            "entity_id": "sensor.room_temp",
+            "old_state": None,
+            "new_state": State("sensor.room_temp", value),
+        }
+        return event
+
+    await device._async_temp_sensor_changed(_event("21.5"))
+    await device._async_temp_sensor_changed(_event("21.5"))
+    assert device.async_write_ha_state.call_count == 1  # type: ignore[attr-defined]
+    assert device.current_temperature == 21.5
+
+    await device._async_temp_sensor_changed(_event("22.0"))
+    assert device.async_write_ha_state.call_count == 2  # type: ignore[attr-defined]
+
+
+async def test_temp_sensors_are_aggregated(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test several room sensors feed one current temperature."""
+    device: GreeClimate = gree_climate_device()
+    device._temp_sensor_entity_ids = ["sensor.window", "sensor.door"]
+
+    def _event(entity_id: str, value: str) -> MagicMock:
+        event = MagicMock()
+        event.data = {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, value),
+        }
+        return event
+
+    await device._async_temp_sensor_changed(_event("sensor.window", "20.0"))
+    assert device.current_temperature == 20.0
+    await device._async_temp_sensor_changed(_event("sensor.door", "23.0"))
+    assert device.current_temperature == 21.5
+    await device._async_temp_sensor_changed(_event("sensor.door", "unavailable"))
+    assert device.current_temperature == 20.0
+    assert device.async_write_ha_state.call_count == 3  # type: ignore[attr-defined]
+
+
+async def test_temp_sensor_change_held_back_by_min_interval(
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test a reading inside the min interval is published when it ends."""
+    device: GreeClimate = gree_climate_device()
+    device._temp_sensor_entity_ids = ["sensor.room_temp"]
+    device._temp_filter = TemperatureFilter(0.1, 60, 0)
+
+    def _event(value: str) -> MagicMock:
+        event = MagicMock()
+        event.data = {
+            "entity_id": "sensor.room_temp",
+            "old_state": None,
+            "new_state": State("sensor.room_temp", value),
+        }
+        return event
+
+    with (
+        patch("custom_components.greev2.climate.time.monotonic", return_value=0.0),
+        patch("custom_components.greev2.climate.async_call_later") as call_later,
+    ):
+        await device._async_temp_sensor_changed(_event("21.5"))
+        await device._async_temp_sensor_changed(_event("21.52"))  # Noise
+        await device._async_temp_sensor_changed(_event("22.0"))
+    assert device.async_write_ha_state.call_count == 1  # type: ignore[attr-defined]
+    assert device.current_temperature == 21.5
+    call_later.assert_called_once_with(device.hass, 60.0, device._async_flush_temp)
+
+    with patch("custom_components.greev2.climate.time.monotonic", return_value=60.0):
+        device._async_flush_temp(datetime.now())
+    assert device.async_write_ha_state.call_count == 2  # type: ignore[attr-defined]
+    assert device.current_temperature == 22.0
+
+
+@patch(
+    "custom_components.greev2.climate.detect_features",
+    return_value=(False, False, False, []),
+)  # Mock feature detection
+async def test_update_pipelined_merges_groups(
+    mock_detect_features: AsyncMock,
+    gree_climate_device: GreeClimateFactory,
+) -> None:
+    """Test pipelined polling applies each group's reply as it lands."""
+    device: GreeClimate = gree_climate_device()
+    device._pipelined_polling = True
+    initial_options = list(device._options_to_fetch)
+    mock_detect_features.return_value = (False, False, False, initial_options)
+    status: Dict[str, Any] = {key: 0 for key in initial_options}
+    status.update({"Pow": 1, "Mod": 1, "SetTem": 21})
+
+    async def pipelined(columns, per_packet, on_reply):
+        for start in range(0, len(columns), per_packet):
+            group = columns[start : start + per_packet]
+            on_reply(group, [status[key] for key in group])
+        return [status[key] for key in columns]
+
+    device._api.get_status_pipelined = AsyncMock(side_effect=pipelined)  # type: ignore[method-assign]
+    device._api.get_status = AsyncMock()  # type: ignore[method-assign]
+    device._api._is_bound = True
+    device._api.bind_and_get_key = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+    assert await device._async_sync_state() is True
+
+    device._api.get_status.assert_not_called()
+    assert device.available is True
+    assert device.hvac_mode == HVACMode.COOL
+    assert device.target_temperature == 21.0
+
+
+@patch(
+    "custom_components.greev2.climate.detect_features",
+    return_value=(False, False, False, []),
+)  # Mock feature detection
+async def test_update_rebinds_and_persists_new_key(
+    mock_detect_features: AsyncMock,
+    gree_climate_device: GreeClimateFactory,
+    mock_hass: HomeAssistant,
+) -> None:
+    """Test a poll re-binds when replies stop decrypting and stores the key."""
+    device: GreeClimate = gree_climate_device()
+    mock_detect_features.return_value = (
+        False,
+        False,
+        False,
+        list(device._options_to_fetch),
+    )
+    mock_api = device._api
+    mock_api.needs_rebind = True
+
+    async def rebind() -> bool:
+        mock_api._encryption_key = b"newDeviceKey4567"
+        mock_api.needs_rebind = False
+        return True
+
+    mock_api.rebind = AsyncMock(side_effect=rebind)  # type: ignore[method-assign]
+
+    await device._async_update_internal()
+
+    mock_api.rebind.assert_awaited_once()
+    mock_api.get_status.assert_awaited_once()
+    mock_hass.config_entries.async_update_entry.assert_called_once_with(
+        device._entry,
+        data={**device._entry.data, CONF_ENCRYPTION_KEY: "newDeviceKey4567"},
+    )